@@ -3,25 +3,66 @@ Flask Web Application for Resume Shortlisting Tool
 """
 
 from flask import Flask, render_template, request, jsonify, flash, redirect, url_for
+from functools import wraps
 import os
 from werkzeug.utils import secure_filename
 import traceback
 
-from match_engine import ResumeJobMatcher
+from match_engine import ResumeJobMatcher, CHART_RENDERERS, REPORT_FIELDS
 from resume_parser import ResumeParser
+from utils import select_fields
+from resume_cache import ResumeCache
 from jd_parser import JobDescriptionParser
+from vector_space import load_vector_space
+from embeddings import load_embedding_backend
+from candidate_index import CandidateIndex
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'your-secret-key-here'
-app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
-
-# Ensure upload directory exists
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+# Worker processes per batch request; one per CPU by default. Each request
+# starts its own pool (and spaCy model per worker), so the default is capped
+# to leave room for concurrent batches. Set BATCH_WORKERS=1 to parse serially
+app.config['BATCH_WORKERS'] = int(os.environ.get('BATCH_WORKERS', min(os.cpu_count() or 1, 4)))
+# Parsed-resume cache; set RESUME_CACHE_PATH to an empty string to disable it
+app.config['RESUME_CACHE_PATH'] = os.environ.get('RESUME_CACHE_PATH', os.path.join('cache', 'resumes.sqlite3'))
+app.config['RESUME_CACHE_MAX_MB'] = int(os.environ.get('RESUME_CACHE_MAX_MB', 256))
+# Fixed vector space for comparable scores: 'hashing', or the path of an
+# artifact written by vector_space.py; empty fits TF-IDF per request
+app.config['VECTOR_SPACE'] = os.environ.get('VECTOR_SPACE', '')
+# Local sentence-transformers model directory for semantic scoring; empty
+# disables it. Embeddings are cached as float16 (or int8) vectors
+app.config['EMBEDDING_MODEL'] = os.environ.get('EMBEDDING_MODEL', '')
+app.config['EMBEDDING_CACHE_PATH'] = os.environ.get('EMBEDDING_CACHE_PATH', os.path.join('cache', 'embeddings.sqlite3'))
+app.config['EMBEDDING_CACHE_DTYPE'] = os.environ.get('EMBEDDING_CACHE_DTYPE', 'float16')
+# Persistent candidate index; needs VECTOR_SPACE and is disabled when empty
+app.config['CANDIDATE_INDEX_PATH'] = os.environ.get('CANDIDATE_INDEX_PATH', '')
 
 # Initialize components
-matcher = ResumeJobMatcher()
-resume_parser = ResumeParser()
+resume_cache = None
+if app.config['RESUME_CACHE_PATH']:
+    resume_cache = ResumeCache(
+        app.config['RESUME_CACHE_PATH'],
+        max_bytes=app.config['RESUME_CACHE_MAX_MB'] * 1024 * 1024
+    )
+
+vector_space = load_vector_space(app.config['VECTOR_SPACE'])
+embedding_backend = load_embedding_backend(
+    app.config['EMBEDDING_MODEL'],
+    app.config['EMBEDDING_CACHE_PATH'],
+    app.config['EMBEDDING_CACHE_DTYPE']
+)
+
+matcher = ResumeJobMatcher(
+    resume_cache=resume_cache,
+    vector_space=vector_space,
+    embedding_backend=embedding_backend
+)
+resume_parser = ResumeParser(cache=resume_cache)
+
+candidate_index = None
+if app.config['CANDIDATE_INDEX_PATH']:
+    candidate_index = CandidateIndex(app.config['CANDIDATE_INDEX_PATH'], matcher)
 jd_parser = JobDescriptionParser()
 
 ALLOWED_EXTENSIONS = {'pdf'}
@@ -30,12 +71,72 @@ def allowed_file(filename):
     """Check if file extension is allowed"""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+# Report field behind each column of the batch results table
+BATCH_RESULT_SOURCES = {
+    'filename': None,
+    'match_score': 'match_score',
+    'common_skills': 'skills_analysis',
+    'missing_skills': 'skills_analysis',
+    'suggestions': 'suggestions',
+    'contact_info': 'contact_info'
+}
+
+# Fields of the parse endpoints' data (see preprocess_resume and
+# preprocess_job_description)
+RESUME_DATA_FIELDS = (
+    'raw_text', 'cleaned_text', 'contact_info', 'sections', 'extracted_skills',
+    'word_count', 'truncated', 'degraded'
+)
+JD_DATA_FIELDS = (
+    'raw_text', 'cleaned_text', 'job_info', 'sections', 'requirements',
+    'extracted_skills', 'word_count', 'truncated', 'degraded'
+)
+
+def requested_fields():
+    """
+    Field names from the 'fields' parameter, or None for every field
+    
+    Read from the query string or form as a comma-separated list, or from
+    a JSON body as a list or string.
+    """
+    fields = request.values.get('fields')
+    if fields is None and request.is_json:
+        fields = (request.get_json(silent=True) or {}).get('fields')
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(',')
+    return [field.strip() for field in fields if field.strip()]
+
+def accepts_fields(valid_fields):
+    """
+    Reject requests whose 'fields' parameter names a field the endpoint
+    does not return, instead of silently leaving it out
+    
+    Args:
+        valid_fields: Field names the endpoint can return
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            unknown = [field for field in requested_fields() or [] if field not in valid_fields]
+            if unknown:
+                return jsonify({
+                    'success': False,
+                    'error': f"Unknown fields: {', '.join(unknown)}. "
+                             f"Valid fields are: {', '.join(valid_fields)}"
+                }), 400
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
 @app.route('/')
 def index():
     """Main page"""
     return render_template('index.html')
 
 @app.route('/upload', methods=['POST'])
+@accepts_fields(REPORT_FIELDS)
 def upload_file():
     """Handle file upload and job description submission"""
     try:
@@ -56,19 +157,8 @@ def upload_file():
         if not allowed_file(file.filename):
             return jsonify({'success': False, 'error': 'Only PDF files are allowed'})
         
-        # Save uploaded file
-        filename = secure_filename(file.filename)
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(file_path)
-        
-        # Analyze the match
-        result = matcher.analyze_match(file_path, job_description)
-        
-        # Clean up uploaded file
-        try:
-            os.remove(file_path)
-        except:
-            pass
+        # Analyze the match straight from the upload stream
+        result = matcher.analyze_match(file.stream, job_description, fields=requested_fields())
         
         if result['success']:
             return jsonify({
@@ -82,13 +172,6 @@ def upload_file():
             })
             
     except Exception as e:
-        # Clean up file if it exists
-        try:
-            if 'file_path' in locals():
-                os.remove(file_path)
-        except:
-            pass
-        
         return jsonify({
             'success': False,
             'error': f'Server error: {str(e)}'
@@ -100,6 +183,7 @@ def batch_analysis():
     return render_template('batch_analysis.html')
 
 @app.route('/batch_upload', methods=['POST'])
+@accepts_fields(tuple(BATCH_RESULT_SOURCES))
 def batch_upload():
     """Handle batch upload of multiple resumes"""
     try:
@@ -114,50 +198,110 @@ def batch_upload():
             return jsonify({'success': False, 'error': 'No resume files provided'})
         
         results = []
-        file_paths = []
-        
-        try:
-            # Save and process each file
-            for file in files:
-                if file.filename and allowed_file(file.filename):
-                    filename = secure_filename(file.filename)
-                    file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                    file.save(file_path)
-                    file_paths.append(file_path)
-            
-            # Analyze all resumes
-            if file_paths:
-                batch_results = matcher.batch_analyze(file_paths, job_description)
-                
-                # Format results for display
-                for i, result in enumerate(batch_results):
-                    if result['success']:
-                        original_filename = os.path.basename(result['resume_path'])
-                        results.append({
-                            'filename': original_filename,
-                            'match_score': result['data']['match_score'],
-                            'common_skills': result['data']['skills_analysis']['common_skills'],
-                            'missing_skills': result['data']['skills_analysis']['missing_skills'],
-                            'suggestions': result['data']['suggestions'],
-                            'contact_info': result['data']['contact_info']
-                        })
-            
-            return jsonify({
-                'success': True,
-                'data': {
-                    'total_resumes': len(results),
-                    'results': results
-                }
-            })
-            
-        finally:
-            # Clean up uploaded files
-            for file_path in file_paths:
-                try:
-                    os.remove(file_path)
-                except:
-                    pass
-                    
+        
+        # Parse each PDF straight from its upload stream
+        resume_files = [
+            file for file in files
+            if file.filename and allowed_file(file.filename)
+        ]
+        
+        # Optional shortlist cut: a minimum score and/or the number to keep
+        min_score = request.form.get('min_score', '').strip()
+        top_k = request.form.get('top_k', '').strip()
+        
+        # Only build the report fields behind the requested columns
+        fields = requested_fields()
+        columns = BATCH_RESULT_SOURCES if fields is None else [
+            column for column in BATCH_RESULT_SOURCES if column in fields or column == 'filename'
+        ]
+        options = {
+            'workers': app.config['BATCH_WORKERS'],
+            'resume_names': [secure_filename(file.filename) for file in resume_files],
+            'min_score': float(min_score) if min_score else None,
+            'top_k': int(top_k) if top_k else None,
+            'fields': [BATCH_RESULT_SOURCES[column] for column in columns if BATCH_RESULT_SOURCES[column]]
+        }
+        
+        # With top_n, only the best top_n of a keyword prescreen are fully analyzed
+        top_n = request.form.get('top_n', '').strip()
+        stages = None
+        
+        # Analyze all resumes
+        batch_results = []
+        if resume_files and top_n:
+            cascade_result = matcher.cascade_analyze(
+                [file.stream for file in resume_files], job_description,
+                top_n=int(top_n), **options
+            )
+            if not cascade_result['success']:
+                return jsonify(cascade_result)
+            batch_results = cascade_result['data']['results']
+            stages = cascade_result['data']['stages']
+        elif resume_files:
+            batch_results = matcher.batch_analyze(
+                [file.stream for file in resume_files], job_description, **options
+            )
+        
+        # Format results for display
+        for i, result in enumerate(batch_results):
+            if result['success']:
+                report = result['data']
+                row = {'filename': result['resume_name'], 'match_score': report['match_score']}
+                if 'skills_analysis' in report:
+                    row['common_skills'] = report['skills_analysis']['common_skills']
+                    row['missing_skills'] = report['skills_analysis']['missing_skills']
+                if 'suggestions' in report:
+                    row['suggestions'] = report['suggestions']
+                if 'contact_info' in report:
+                    row['contact_info'] = report['contact_info']
+                results.append(select_fields(row, columns))
+        
+        return jsonify({
+            'success': True,
+            'data': {
+                'total_resumes': len(results),
+                'results': results,
+                'stages': stages
+            }
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Server error: {str(e)}'
+        })
+
+@app.route('/api/matrix', methods=['POST'])
+@accepts_fields(REPORT_FIELDS)
+def api_matrix():
+    """API endpoint to score many resumes against many job descriptions"""
+    try:
+        job_descriptions = [
+            text.strip() for text in request.form.getlist('job_descriptions') if text.strip()
+        ]
+        if not job_descriptions:
+            return jsonify({'success': False, 'error': 'At least one job description is required'})
+        
+        jd_names = request.form.getlist('jd_names')
+        if len(jd_names) != len(job_descriptions):
+            jd_names = None
+        
+        files = [
+            file for file in request.files.getlist('resumes')
+            if file.filename and allowed_file(file.filename)
+        ]
+        if not files:
+            return jsonify({'success': False, 'error': 'No resume files provided'})
+        
+        k = int(request.form.get('k', 5))
+        result = matcher.matrix_analyze(
+            [file.stream for file in files], job_descriptions, k=k,
+            resume_names=[secure_filename(file.filename) for file in files],
+            jd_names=jd_names,
+            fields=requested_fields()
+        )
+        return jsonify(result)
+        
     except Exception as e:
         return jsonify({
             'success': False,
@@ -165,6 +309,7 @@ def batch_upload():
         })
 
 @app.route('/api/parse_resume', methods=['POST'])
+@accepts_fields(RESUME_DATA_FIELDS)
 def api_parse_resume():
     """API endpoint to parse resume only"""
     try:
@@ -175,16 +320,10 @@ def api_parse_resume():
         if not allowed_file(file.filename):
             return jsonify({'success': False, 'error': 'Only PDF files are allowed'})
         
-        # Save and parse file
-        filename = secure_filename(file.filename)
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(file_path)
-        
-        try:
-            result = resume_parser.parse_resume(file_path)
-            return jsonify(result)
-        finally:
-            os.remove(file_path)
+        # Parse straight from the upload stream
+        result = resume_parser.parse_resume(file.stream)
+        result['data'] = select_fields(result['data'], requested_fields())
+        return jsonify(result)
             
     except Exception as e:
         return jsonify({
@@ -193,6 +332,7 @@ def api_parse_resume():
         })
 
 @app.route('/api/parse_jd', methods=['POST'])
+@accepts_fields(JD_DATA_FIELDS)
 def api_parse_jd():
     """API endpoint to parse job description only"""
     try:
@@ -201,6 +341,7 @@ def api_parse_jd():
             return jsonify({'success': False, 'error': 'Job description is required'})
         
         result = jd_parser.parse_job_description(jd_text)
+        result['data'] = select_fields(result['data'], requested_fields())
         return jsonify(result)
         
     except Exception as e:
@@ -209,6 +350,105 @@ def api_parse_jd():
             'error': f'Server error: {str(e)}'
         })
 
+@app.route('/api/visualization', methods=['POST'])
+@accepts_fields(('visualization', 'format'))
+def api_visualization():
+    """API endpoint to render the chart for a match report"""
+    try:
+        report = request.json or {}
+        if 'match_score' not in report or 'skills_analysis' not in report:
+            return jsonify({'success': False, 'error': 'Match report is required'})
+        
+        chart_format = report.get('format', 'svg')
+        if chart_format not in CHART_RENDERERS:
+            return jsonify({'success': False, 'error': 'Format must be svg or png'})
+        
+        visualization = matcher.create_report_visualization(report, chart_format)
+        if not visualization:
+            return jsonify({'success': False, 'error': 'Could not create visualization'})
+        
+        return jsonify({
+            'success': True,
+            'data': select_fields({'visualization': visualization, 'format': chart_format}, requested_fields())
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Server error: {str(e)}'
+        })
+
+@app.route('/api/candidates', methods=['POST'])
+@accepts_fields(('added', 'errors', 'total_candidates'))
+def api_add_candidates():
+    """API endpoint to add resumes to the candidate index"""
+    try:
+        if candidate_index is None:
+            return jsonify({'success': False, 'error': 'Candidate index is not enabled'})
+        
+        files = [
+            file for file in request.files.getlist('resumes')
+            if file.filename and allowed_file(file.filename)
+        ]
+        if not files:
+            return jsonify({'success': False, 'error': 'No resume files provided'})
+        
+        results = candidate_index.add_many(
+            [file.stream for file in files],
+            [secure_filename(file.filename) for file in files]
+        )
+        
+        return jsonify({
+            'success': True,
+            'data': select_fields({
+                'added': [result['data'] for result in results if result['success']],
+                'errors': [result['error'] for result in results if not result['success']],
+                'total_candidates': len(candidate_index)
+            }, requested_fields())
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Server error: {str(e)}'
+        })
+
+@app.route('/api/candidates/query', methods=['POST'])
+@accepts_fields(REPORT_FIELDS)
+def api_query_candidates():
+    """API endpoint to rank indexed candidates against a job description"""
+    try:
+        if candidate_index is None:
+            return jsonify({'success': False, 'error': 'Candidate index is not enabled'})
+        
+        jd_text = (request.json or {}).get('job_description', '').strip()
+        if not jd_text:
+            return jsonify({'success': False, 'error': 'Job description is required'})
+        
+        k = int(request.json.get('k', 10))
+        results = candidate_index.query(jd_text, k, fields=requested_fields())
+        
+        return jsonify({
+            'success': True,
+            'data': {
+                'total_candidates': len(candidate_index),
+                'results': [
+                    {
+                        'candidate_id': result['candidate_id'],
+                        'filename': result['resume_name'],
+                        'report': result['data']
+                    }
+                    for result in results
+                ]
+            }
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Server error: {str(e)}'
+        })
+
 @app.route('/help')
 def help_page():
     """Help and documentation page"""
@@ -0,0 +1,383 @@
+"""
+Candidate Index Module
+Persistent index of parsed resumes that can be ranked against new job
+descriptions without re-uploading or re-parsing them
+"""
+
+import hashlib
+import heapq
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional
+
+from resume_parser import PdfSource
+from skill_bitsets import SkillVocabulary, skill_overlap
+from utils import NormalizedText, calculate_match_percentage
+
+# Resume fields not needed to rebuild a match report; dropped before storing
+UNSTORED_FIELDS = ('raw_text', 'cleaned_text')
+
+class CandidateIndex:
+    """
+    SQLite store of parsed resumes with their vectors and skill sets
+
+    Every candidate's vector (in the matcher's fixed vector space) and
+    skills are also held in memory, as a sparse matrix and a packed skill
+    bit matrix, so a query scores the whole pool with one sparse
+    matrix-vector product and a vectorized AND / popcount, and only builds
+    full reports for the top k. Adding candidates is incremental; the
+    matrices are rebuilt lazily on the next query.
+
+    Scores are lexical only: the text similarity and skill overlap above,
+    with no embedding term even when the matcher has an embedding backend,
+    since the resume text is not stored. Reports therefore carry no
+    'semantic_score', and a match score can differ from batch_analyze with
+    semantic scoring enabled.
+
+    One index may be shared by threads (the in-memory rows are guarded by a
+    lock) and by processes: each query reloads the rows if the table's row
+    count or largest rowid no longer match what was loaded.
+    """
+
+    def __init__(self, path: str, matcher):
+        """
+        Args:
+            path: Path of the SQLite database file
+            matcher: ResumeJobMatcher with a fixed vector space, used to parse,
+                vectorize and report
+        """
+        if matcher.vector_space is None:
+            raise ValueError("CandidateIndex needs a matcher with a fixed vector space")
+
+        self.path = path
+        self.matcher = matcher
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS candidates ('
+                'id TEXT PRIMARY KEY, name TEXT NOT NULL, data BLOB NOT NULL, '
+                'skills TEXT NOT NULL, vector_indices BLOB NOT NULL, '
+                'vector_values BLOB NOT NULL, added_at REAL NOT NULL)'
+            )
+            row = conn.execute("SELECT value FROM meta WHERE key = 'vector_space'").fetchone()
+            identifier = matcher.vector_space.identifier
+            if row is None:
+                conn.execute("INSERT INTO meta (key, value) VALUES ('vector_space', ?)", (identifier,))
+            elif row[0] != identifier:
+                raise ValueError(
+                    f"Index '{path}' was built in vector space {row[0]}, not {identifier}"
+                )
+
+        with self._lock:
+            self._load()
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection that commits on success and is always closed"""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _table_state(conn) -> tuple:
+        """Row count and largest rowid of the candidates table; any insert,
+        replace or delete by any process changes one of them"""
+        return tuple(conn.execute('SELECT COUNT(*), MAX(rowid) FROM candidates').fetchone())
+
+    def _load(self):
+        """Read every candidate's name, vector and skills into memory (call with the lock held)"""
+        import numpy as np
+
+        self._ids = []
+        self._positions = {}
+        self._names = []
+        self._vector_rows = []
+        self._skill_rows = []
+        self._skill_vocabulary = SkillVocabulary()
+        self._matrices = None
+
+        with self._connect() as conn:
+            # One read transaction, so the state matches the rows read
+            conn.execute('BEGIN')
+            self._state = self._table_state(conn)
+            rows = conn.execute(
+                'SELECT id, name, skills, vector_indices, vector_values FROM candidates ORDER BY rowid'
+            )
+            for candidate_id, name, skills, indices, values in rows:
+                self._append(
+                    candidate_id, name, json.loads(skills),
+                    np.frombuffer(indices, dtype=np.int32), np.frombuffer(values, dtype=np.float32)
+                )
+
+    def _refresh(self):
+        """Reload if another process changed the table since it was loaded (call with the lock held)"""
+        with self._connect() as conn:
+            state = self._table_state(conn)
+        if state != self._state:
+            self._load()
+
+    def _append(self, candidate_id: str, name: str, skills: List[str], indices, values):
+        """Add one candidate to the in-memory rows (call with the lock held)"""
+        self._positions[candidate_id] = len(self._ids)
+        self._ids.append(candidate_id)
+        self._names.append(name)
+        self._vector_rows.append((indices, values))
+        self._skill_rows.append(self._skill_vocabulary.to_ids(skills))
+        self._matrices = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._ids)
+
+    def __contains__(self, candidate_id: str) -> bool:
+        with self._lock:
+            self._refresh()
+            return candidate_id in self._positions
+
+    @staticmethod
+    def make_id(pdf_bytes: bytes) -> str:
+        """Candidate id: a hash of the PDF content, so re-adding a file is a no-op"""
+        return hashlib.sha256(pdf_bytes).hexdigest()
+
+    def add(self, pdf: PdfSource, name: Optional[str] = None) -> Dict[str, any]:
+        """
+        Parse a resume and add it to the index
+
+        Args:
+            pdf: Path, bytes or binary stream of the PDF resume
+            name: Display name (defaults to the file name)
+
+        Returns:
+            Dictionary with success flag, error message and the candidate id and name
+        """
+        return self.add_many([pdf], [name] if name else None)[0]
+
+    def add_many(self, pdfs: List[PdfSource], names: Optional[List[str]] = None) -> List[Dict[str, any]]:
+        """
+        Parse resumes in one batch and add them to the index
+
+        Args:
+            pdfs: Paths, bytes or binary streams of the PDF resumes
+            names: Display name for each resume (defaults to the file name)
+
+        Returns:
+            List of add results in the same order as pdfs
+        """
+        if names is None:
+            names = [
+                os.path.basename(pdf) if isinstance(pdf, str) else f"resume_{index + 1}.pdf"
+                for index, pdf in enumerate(pdfs)
+            ]
+
+        contents = []
+        for pdf in pdfs:
+            if isinstance(pdf, str):
+                with open(pdf, 'rb') as f:
+                    pdf = f.read()
+            elif hasattr(pdf, 'read'):
+                pdf = pdf.read()
+            contents.append(pdf)
+
+        with self._lock:
+            self._refresh()
+            indexed = set(self._positions)
+
+        results = [None] * len(pdfs)
+        pending = {}
+        seen = set()
+        for index, (content, name) in enumerate(zip(contents, names)):
+            candidate_id = self.make_id(content)
+            results[index] = {
+                'success': True,
+                'error': None,
+                'data': {'candidate_id': candidate_id, 'name': name}
+            }
+            if candidate_id not in indexed and candidate_id not in seen:
+                pending[index] = candidate_id
+                seen.add(candidate_id)
+
+        if not pending:
+            return results
+
+        parse_results = self.matcher.resume_parser.parse_resumes([contents[index] for index in pending])
+        parsed = []
+        for (index, candidate_id), parse_result in zip(pending.items(), parse_results):
+            if parse_result['success']:
+                parsed.append((index, candidate_id, parse_result['data']))
+            else:
+                results[index] = parse_result
+
+        if not parsed:
+            return results
+
+        vectors = self.matcher.vectorize([
+            NormalizedText.from_cleaned(resume_data['cleaned_text']) for _, _, resume_data in parsed
+        ]).tocsr()
+
+        now = time.time()
+        records = []
+        rows = []
+        for row, (index, candidate_id, resume_data) in enumerate(parsed):
+            vector = vectors[row]
+            indices = vector.indices.astype('int32')
+            values = vector.data.astype('float32')
+            skills = sorted(set(skill.lower() for skill in resume_data['extracted_skills']))
+            stored = {key: value for key, value in resume_data.items() if key not in UNSTORED_FIELDS}
+
+            records.append((
+                candidate_id, names[index], zlib.compress(json.dumps(stored).encode()),
+                json.dumps(skills), indices.tobytes(), values.tobytes(), now
+            ))
+            rows.append((candidate_id, names[index], skills, indices, values))
+
+        with self._lock:
+            # Another thread may have added the same file while this one parsed
+            fresh = [position for position, row in enumerate(rows) if row[0] not in self._positions]
+            with self._connect() as conn:
+                conn.execute('BEGIN IMMEDIATE')
+                before = self._table_state(conn)
+                conn.executemany(
+                    'INSERT OR REPLACE INTO candidates '
+                    '(id, name, data, skills, vector_indices, vector_values, added_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    [records[position] for position in fresh]
+                )
+                after = self._table_state(conn)
+
+            if before == self._state:
+                for position in fresh:
+                    self._append(*rows[position])
+                self._state = after
+            else:
+                # Another process wrote in between; its rows are not in memory
+                self._load()
+
+        return results
+
+    def remove(self, candidate_id: str) -> bool:
+        """Remove a candidate; returns whether it was in the index"""
+        with self._lock:
+            with self._connect() as conn:
+                removed = conn.execute('DELETE FROM candidates WHERE id = ?', (candidate_id,)).rowcount
+            if removed:
+                self._load()
+        return bool(removed)
+
+    def _get_matrices(self):
+        """Candidate vector matrix, skill bit matrix and skill counts, rebuilt
+        after changes (call with the lock held)"""
+        import numpy as np
+        from scipy.sparse import csr_matrix
+
+        if self._matrices is None:
+            vector_matrix = csr_matrix(
+                (
+                    np.concatenate([values for _, values in self._vector_rows]),
+                    np.concatenate([indices for indices, _ in self._vector_rows]),
+                    np.concatenate([[0], np.cumsum([len(values) for _, values in self._vector_rows])])
+                ),
+                shape=(len(self._ids), self.matcher.vector_space.n_features)
+            )
+            skill_bits = self._skill_vocabulary.pack(self._skill_rows)
+            skill_counts = np.array([len(ids) for ids in self._skill_rows], dtype=np.int64)
+            self._matrices = vector_matrix, skill_bits, skill_counts
+        return self._matrices
+
+    def _load_resume_data(self, candidate_ids: List[str]) -> Dict[str, Dict]:
+        """Read the stored resume data of the given candidates"""
+        found = {}
+        with self._connect() as conn:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(candidate_ids), 500):
+                chunk = candidate_ids[start:start + 500]
+                placeholders = ', '.join('?' * len(chunk))
+                rows = conn.execute(
+                    f'SELECT id, data FROM candidates WHERE id IN ({placeholders})', chunk
+                )
+                for candidate_id, data in rows:
+                    found[candidate_id] = json.loads(zlib.decompress(data))
+        return found
+
+    def query(self, jd_text: str, k: int = 10,
+              fields: Optional[Iterable[str]] = None) -> List[Dict[str, any]]:
+        """
+        Rank every indexed candidate against a job description
+
+        Args:
+            jd_text: Job description text
+            k: Number of candidates to return
+            fields: Report fields to include (defaults to all of REPORT_FIELDS)
+
+        Returns:
+            Top-k match analyses, shaped like batch_analyze results (with
+            'candidate_id' and 'resume_name') but scored without embeddings
+            and without 'semantic_score', sorted by match score
+        """
+        import numpy as np
+
+        profile_result = self.matcher.compile_job_profile(jd_text)
+        if not profile_result['success'] or k <= 0:
+            return []
+        job_profile = profile_result['data']
+
+        # Score a consistent snapshot; adds and reloads after this point do
+        # not touch the matrices, ids or names taken here
+        with self._lock:
+            self._refresh()
+            if not self._ids:
+                return []
+            ids = list(self._ids)
+            names = list(self._names)
+            vector_matrix, skill_bits, skill_counts = self._get_matrices()
+            jd_bits = self._skill_vocabulary.encode(job_profile.skill_set, add=False)
+
+        # Text similarity of every candidate (rows are L2-normalized)
+        similarities = np.asarray((vector_matrix @ job_profile.vector.T).todense()).ravel()
+
+        # Matched JD skills of every candidate, from the packed skill bits
+        overlap = skill_overlap(
+            skill_bits,
+            jd_bits,
+            len(job_profile.skills),
+            skill_counts
+        )
+        ratios = overlap['skill_match_ratio']
+
+        scores = [
+            calculate_match_percentage(self.matcher.calculate_weighted_score(similarity, ratio))
+            for similarity, ratio in zip(similarities.tolist(), ratios.tolist())
+        ]
+        top = heapq.nlargest(k, range(len(scores)), key=scores.__getitem__)
+
+        resume_data = self._load_resume_data([ids[position] for position in top])
+        results = []
+        for position in top:
+            candidate_id = ids[position]
+            if candidate_id not in resume_data:
+                # Removed by another process since this index was loaded
+                continue
+            result = self.matcher._build_match_result(
+                resume_data[candidate_id], job_profile, float(similarities[position]), fields=fields
+            )
+            if result['success']:
+                result['candidate_id'] = candidate_id
+                result['resume_name'] = names[position]
+                results.append(result)
+
+        results.sort(key=lambda x: x['data']['match_score'], reverse=True)
+        return results
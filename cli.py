@@ -2,17 +2,161 @@
 """
 Command Line Interface for Resume Shortlisting Tool
 Usage: python cli.py <resume_path> <job_description_file>
+       python cli.py matrix --resumes <pdf or dir>... --jds <txt or dir>... [--top-k N]
+       python cli.py cascade --resumes <pdf or dir>... --jd <txt> [--top-n N] [--top-k K]
+
+Set VECTOR_SPACE to 'hashing' or to a fitted vector space artifact to score
+in a fixed vector space (see vector_space.py), and EMBEDDING_MODEL to a local
+sentence-transformers model directory to add semantic scoring.
 """
 
 import sys
 import os
-from match_engine import ResumeJobMatcher
+import argparse
+from match_engine import ResumeJobMatcher, CASCADE_TOP_N
+from vector_space import load_vector_space
+from embeddings import load_embedding_backend
+
+def _collect_files(paths, extension):
+    """Expand directories into the files with the given extension they contain"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(path, name) for name in sorted(os.listdir(path))
+                if name.lower().endswith(extension)
+            )
+        else:
+            files.append(path)
+    return files
+
+def _load_matcher():
+    """Create the matcher with the vector space and embedding model set in the environment"""
+    try:
+        vector_space = load_vector_space(os.environ.get('VECTOR_SPACE'))
+    except Exception as e:
+        print(f"Error loading vector space: {e}")
+        sys.exit(1)
+    embedding_backend = load_embedding_backend(
+        os.environ.get('EMBEDDING_MODEL'),
+        os.environ.get('EMBEDDING_CACHE_PATH', os.path.join('cache', 'embeddings.sqlite3')),
+        os.environ.get('EMBEDDING_CACHE_DTYPE', 'float16')
+    )
+    return ResumeJobMatcher(vector_space=vector_space, embedding_backend=embedding_backend)
+
+def run_matrix(argv):
+    """Score every resume against every job description"""
+    parser = argparse.ArgumentParser(
+        prog='python cli.py matrix',
+        description='Score many resumes against many job descriptions'
+    )
+    parser.add_argument('--resumes', nargs='+', required=True, help='Resume PDFs or directories of them')
+    parser.add_argument('--jds', nargs='+', required=True, help='Job description files or directories of them')
+    parser.add_argument('--top-k', type=int, default=5, help='Matches to list per JD and per resume')
+    args = parser.parse_args(argv)
+    
+    resume_paths = _collect_files(args.resumes, '.pdf')
+    jd_paths = _collect_files(args.jds, '.txt')
+    for path in resume_paths + jd_paths:
+        if not os.path.exists(path):
+            print(f"Error: File '{path}' not found.")
+            sys.exit(1)
+    
+    jd_texts = []
+    for path in jd_paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            jd_texts.append(f.read())
+    
+    print("Initializing Resume Shortlisting Tool...")
+    matcher = _load_matcher()
+    
+    print(f"\nScoring {len(resume_paths)} resumes against {len(jd_paths)} job descriptions")
+    print("-" * 50)
+    
+    result = matcher.matrix_analyze(
+        resume_paths, jd_texts, k=args.top_k,
+        jd_names=[os.path.basename(path) for path in jd_paths]
+    )
+    if not result['success']:
+        print(f"Error: {result['error']}")
+        sys.exit(1)
+    
+    data = result['data']
+    for error in data['errors']:
+        print(f"Skipped {error}")
+    
+    print("\n=== TOP RESUMES PER JOB ===")
+    for entry in data['top_resumes_per_jd']:
+        print(f"\n{entry['jd_name']}")
+        for rank, match in enumerate(entry['matches'], 1):
+            print(f"  {rank}. {match['resume_name']:<40} {match['data']['match_score']:.1f}%")
+    
+    print("\n=== TOP JOBS PER RESUME ===")
+    for entry in data['top_jds_per_resume']:
+        print(f"\n{entry['resume_name']}")
+        for rank, match in enumerate(entry['matches'], 1):
+            print(f"  {rank}. {match['jd_name']:<40} {match['data']['match_score']:.1f}%")
+
+def run_cascade(argv):
+    """Prescreen many resumes by keywords, then fully analyze the best of them"""
+    parser = argparse.ArgumentParser(
+        prog='python cli.py cascade',
+        description='Rank many resumes against one job description in two stages'
+    )
+    parser.add_argument('--resumes', nargs='+', required=True, help='Resume PDFs or directories of them')
+    parser.add_argument('--jd', required=True, help='Job description file')
+    parser.add_argument('--top-n', type=int, default=CASCADE_TOP_N,
+                        help='Resumes passed from the keyword prescreen to full analysis')
+    parser.add_argument('--top-k', type=int, default=None, help='Resumes to list (defaults to all analyzed)')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes')
+    args = parser.parse_args(argv)
+    
+    resume_paths = _collect_files(args.resumes, '.pdf')
+    for path in resume_paths + [args.jd]:
+        if not os.path.exists(path):
+            print(f"Error: File '{path}' not found.")
+            sys.exit(1)
+    
+    with open(args.jd, 'r', encoding='utf-8') as f:
+        job_description = f.read()
+    
+    print("Initializing Resume Shortlisting Tool...")
+    matcher = _load_matcher()
+    
+    print(f"\nRanking {len(resume_paths)} resumes against {args.jd}")
+    print("-" * 50)
+    
+    result = matcher.cascade_analyze(
+        resume_paths, job_description, top_n=args.top_n,
+        workers=args.workers, top_k=args.top_k
+    )
+    if not result['success']:
+        print(f"Error: {result['error']}")
+        sys.exit(1)
+    
+    stages = result['data']['stages']
+    print(f"Stage 1 (keyword prescreen): {stages['prescreened']} resumes, {stages['unreadable']} unreadable")
+    print(f"Stage 2 (full analysis):     {stages['analyzed']} resumes")
+    
+    print("\n=== RANKED SHORTLIST ===")
+    for rank, match in enumerate(result['data']['results'], 1):
+        print(f"  {rank}. {match['resume_name']:<40} {match['data']['match_score']:.1f}%")
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == 'matrix':
+        run_matrix(sys.argv[2:])
+        return
+    
+    if len(sys.argv) > 1 and sys.argv[1] == 'cascade':
+        run_cascade(sys.argv[2:])
+        return
+    
     if len(sys.argv) != 3:
         print("Usage: python cli.py <resume_path> <job_description_file>")
         print("\nExample:")
         print("python cli.py sample_resumes/resume.pdf sample_jds/senior_python_developer.txt")
+        print("python cli.py matrix --resumes sample_resumes/ --jds sample_jds/ --top-k 3")
+        print("python cli.py cascade --resumes sample_resumes/ --jd sample_jds/senior_python_developer.txt --top-n 50")
         sys.exit(1)
     
     resume_path = sys.argv[1]
@@ -37,7 +181,7 @@ def main():
     
     # Initialize matcher
     print("Initializing Resume Shortlisting Tool...")
-    matcher = ResumeJobMatcher()
+    matcher = _load_matcher()
     
     # Analyze match
     print(f"\nAnalyzing resume: {resume_path}")
@@ -53,6 +197,8 @@ def main():
         # Additional details
         print("\n=== DETAILED ANALYSIS ===")
         print(f"Text Similarity Score: {data['similarity_score']:.3f}")
+        if data['semantic_score'] is not None:
+            print(f"Semantic Similarity Score: {data['semantic_score']:.3f}")
         print(f"Skills Match Ratio: {data['skill_match_ratio']:.3f}")
         
         skills_analysis = data['skills_analysis']
@@ -0,0 +1,269 @@
+"""
+Embeddings Module
+Optional semantic scoring with a local sentence-transformers model on CPU,
+backed by a persistent cache of compact embeddings
+"""
+
+# numpy and sentence-transformers are imported where they are first needed
+import hashlib
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import List, Optional
+
+# Texts per model.encode batch
+EMBEDDING_BATCH_SIZE = int(os.environ.get('EMBEDDING_BATCH_SIZE', 64))
+
+# Small embedding models read at most a few hundred tokens; cutting the text
+# first saves tokenizing the rest of long resumes
+EMBEDDING_MAX_CHARS = 4000
+
+EMBEDDING_DTYPES = ('float16', 'int8')
+
+class EmbeddingCache:
+    """
+    SQLite store of text embeddings keyed by model and content hash
+
+    Vectors are L2-normalized before storing, as float16 or as int8 with a
+    per-vector scale, so each takes 2 or 1 bytes per dimension.
+    """
+
+    def __init__(self, path: str, dtype: str = 'float16'):
+        """
+        Args:
+            path: Path of the SQLite database file
+            dtype: 'float16' or 'int8'
+        """
+        if dtype not in EMBEDDING_DTYPES:
+            raise ValueError(f"Embedding dtype must be one of {', '.join(EMBEDDING_DTYPES)}")
+
+        self.path = path
+        self.dtype = dtype
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS embeddings ('
+                'key TEXT PRIMARY KEY, dtype TEXT NOT NULL, '
+                'scale REAL NOT NULL, data BLOB NOT NULL)'
+            )
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection that commits on success and is always closed"""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(text: str, model_id: str) -> str:
+        """Cache key of a text embedded by a model"""
+        digest = hashlib.sha256(model_id.encode())
+        digest.update(b'\0' + text.encode())
+        return digest.hexdigest()
+
+    def _encode(self, vector) -> tuple:
+        """Compact (scale, bytes) form of a normalized vector"""
+        import numpy as np
+
+        if self.dtype == 'int8':
+            scale = float(np.abs(vector).max()) / 127 or 1.0
+            return scale, np.round(vector / scale).astype(np.int8).tobytes()
+        return 1.0, vector.astype(np.float16).tobytes()
+
+    @staticmethod
+    def _decode(dtype: str, scale: float, data: bytes):
+        """float32 vector from its stored form"""
+        import numpy as np
+
+        return np.frombuffer(data, dtype=dtype).astype(np.float32) * scale
+
+    def quantize(self, vector):
+        """The vector as it reads back from the cache"""
+        return self._decode(self.dtype, *self._encode(vector))
+
+    def get_many(self, keys: List[str]) -> dict:
+        """Return the cached vectors found for keys, keyed by key"""
+        found = {}
+        try:
+            with self._connect() as conn:
+                # Stay under SQLite's bound-parameter limit
+                for start in range(0, len(keys), 500):
+                    chunk = keys[start:start + 500]
+                    placeholders = ', '.join('?' * len(chunk))
+                    rows = conn.execute(
+                        f'SELECT key, dtype, scale, data FROM embeddings WHERE key IN ({placeholders})',
+                        chunk
+                    )
+                    for key, dtype, scale, data in rows:
+                        found[key] = self._decode(dtype, scale, data)
+        except Exception as e:
+            print(f"Error reading embedding cache: {str(e)}")
+        return found
+
+    def put_many(self, items: dict):
+        """Store normalized vectors, keyed by key"""
+        try:
+            records = [
+                (key, self.dtype) + self._encode(vector)
+                for key, vector in items.items()
+            ]
+            with self._connect() as conn:
+                conn.executemany(
+                    'INSERT OR REPLACE INTO embeddings (key, dtype, scale, data) VALUES (?, ?, ?, ?)',
+                    records
+                )
+        except Exception as e:
+            print(f"Error writing embedding cache: {str(e)}")
+
+def model_fingerprint(model_path: str) -> str:
+    """
+    Identify a saved model by its location and files
+
+    Args:
+        model_path: Directory of a saved sentence-transformers model
+
+    Returns:
+        Hash of the resolved absolute path and of every file's relative
+        path, size and modification time, so two models with the same
+        directory name, or a model whose weights were replaced, get
+        different ids
+    """
+    root = os.path.realpath(model_path)
+    digest = hashlib.sha256(root.encode())
+    for directory, subdirectories, files in os.walk(root):
+        subdirectories.sort()
+        for name in sorted(files):
+            path = os.path.join(directory, name)
+            stat = os.stat(path)
+            digest.update(
+                f"\0{os.path.relpath(path, root)}\0{stat.st_size}\0{stat.st_mtime_ns}".encode()
+            )
+    return digest.hexdigest()
+
+class EmbeddingBackend:
+    """
+    Semantic similarity from a sentence-transformers model run on CPU
+
+    The model is loaded from a local path on first use, with the Hugging
+    Face hub switched to offline mode, and texts are encoded in batches.
+    Each text is embedded once per model when a cache is given.
+    """
+
+    def __init__(self, model_path: str, cache: Optional[EmbeddingCache] = None,
+                 batch_size: Optional[int] = None):
+        """
+        Args:
+            model_path: Directory of a saved sentence-transformers model
+            cache: Persistent embedding cache (optional)
+            batch_size: Texts per encode batch (defaults to EMBEDDING_BATCH_SIZE)
+        """
+        self.model_path = model_path
+        self.model_id = model_fingerprint(model_path)
+        self.cache = cache
+        self.batch_size = batch_size or EMBEDDING_BATCH_SIZE
+        self._model = None
+        self._model_lock = threading.Lock()
+
+    @property
+    def model(self):
+        """The sentence-transformers model, loaded once on first use"""
+        if self._model is None:
+            with self._model_lock:
+                # Threads that waited for the lock find the model loaded
+                if self._model is None:
+                    # Never reach out to the hub; the model must be on disk
+                    os.environ.setdefault('HF_HUB_OFFLINE', '1')
+                    os.environ.setdefault('TRANSFORMERS_OFFLINE', '1')
+                    from sentence_transformers import SentenceTransformer
+                    self._model = SentenceTransformer(self.model_path, device='cpu')
+        return self._model
+
+    def embed(self, texts: List[str]):
+        """
+        Embed texts, reusing cached vectors
+
+        Args:
+            texts: Cleaned texts
+
+        Returns:
+            float32 array of L2-normalized embeddings, one row per text
+        """
+        import numpy as np
+
+        texts = [text[:EMBEDDING_MAX_CHARS] for text in texts]
+        keys = [EmbeddingCache.make_key(text, self.model_id) for text in texts]
+        vectors = self.cache.get_many(list(set(keys))) if self.cache else {}
+
+        # Encode each distinct uncached text once
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors:
+                missing.setdefault(key, text)
+
+        if missing:
+            encoded = self.model.encode(
+                list(missing.values()),
+                batch_size=self.batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            ).astype(np.float32)
+            new_vectors = dict(zip(missing, encoded))
+            if self.cache:
+                self.cache.put_many(new_vectors)
+                # Score with the stored precision so later cache hits agree
+                new_vectors = {key: self.cache.quantize(vector) for key, vector in new_vectors.items()}
+            vectors.update(new_vectors)
+
+        return np.vstack([vectors[key] for key in keys])
+
+    def similarities(self, resume_texts: List[str], jd_texts: List[str]):
+        """
+        Cosine similarity of every resume against every job description
+
+        Returns:
+            Array of shape (len(resume_texts), len(jd_texts)), clipped to 0-1
+        """
+        import numpy as np
+
+        embeddings = self.embed(list(jd_texts) + list(resume_texts))
+        jd_count = len(jd_texts)
+        scores = embeddings[jd_count:] @ embeddings[:jd_count].T
+        return np.clip(scores, 0.0, 1.0)
+
+def load_embedding_backend(model_path: Optional[str], cache_path: Optional[str] = None,
+                           dtype: str = 'float16') -> Optional[EmbeddingBackend]:
+    """
+    Create the embedding backend if a model path is configured
+
+    Args:
+        model_path: Directory of a saved sentence-transformers model, or empty
+        cache_path: Path of the embedding cache database (optional)
+        dtype: Storage type of cached embeddings, 'float16' or 'int8'
+
+    Returns:
+        The backend, or None if no model is configured or it cannot be used
+    """
+    if not model_path:
+        return None
+
+    if not os.path.isdir(model_path):
+        print(f"Warning: embedding model '{model_path}' not found; semantic scoring is disabled.")
+        return None
+
+    try:
+        import sentence_transformers  # noqa: F401
+    except ImportError:
+        print("Warning: sentence-transformers is not installed; semantic scoring is disabled.")
+        print("Please install it using: pip install sentence-transformers")
+        return None
+
+    cache = EmbeddingCache(cache_path, dtype) if cache_path else None
+    return EmbeddingBackend(model_path, cache=cache)
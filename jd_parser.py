@@ -4,204 +4,268 @@ Handles job description text processing and analysis
 """
 
 import re
-from typing import Dict, List
-from utils import clean_text, load_spacy_model, extract_skills_from_text
+from typing import Dict, List, Optional, Union
+from utils import (
+    load_spacy_model, extract_skills_from_text, extract_skills_from_texts,
+    NormalizedText, normalize_text, StageBudget
+)
+
+# Longest job description text processed; anything beyond is dropped and flagged
+MAX_JD_CHARS = 100000
+
+# Wall-clock seconds for one job description before NER is skipped and the
+# result is flagged as degraded
+JD_TIME_BUDGET = 5.0
+
+# A candidate header line: a short title, optionally followed by a colon and
+# inline content. Matched against the lowercased text one line at a time.
+HEADER_LINE_PATTERN = re.compile(
+    r"^[ \t]*(?P<title>[a-z][a-z '’&/()-]{0,60}?)[ \t]*(?::[ \t]*(?P<inline>[^\n]*)|$)",
+    re.MULTILINE
+)
+
+# Header categories in priority order, each with the JD section it starts and
+# the requirement block ('required' / 'preferred') it belongs to, if any
+HEADER_CATEGORIES = [
+    ('qualifications', 'preferred', re.compile(r"\b(?:preferred|nice to have|bonus|plus)\b")),
+    ('requirements', 'required', re.compile(
+        r"\b(?:required|requirements|must have|essential|qualifications|what we(?:'re| are) looking for)\b"
+    )),
+    ('responsibilities', None, re.compile(r"\b(?:responsibilities|duties|what you(?:'ll| will) do|role description)\b")),
+    ('benefits', None, re.compile(r"\b(?:benefits|compensation|what we offer|perks)\b")),
+    ('overview', None, re.compile(r"\b(?:job summary|overview|about the role|description|about us)\b")),
+]
+
+# Headers without a colon must be this short to count
+MAX_BARE_HEADER_WORDS = 4
+
+EXPERIENCE_PATTERNS = [
+    re.compile(r'(\d+)[+\-\s]*years?\s+(?:of\s+)?experience'),
+    re.compile(r'(\d+)[+\-\s]*yrs?\s+(?:of\s+)?experience'),
+    re.compile(r'\b(entry[\s\-]?level|junior|mid[\s\-]?level|senior|lead|principal)\b')
+]
+
+EDUCATION_PATTERNS = [
+    re.compile(r"\b(bachelor|master|phd|doctorate|associate)(?:'s)?\b"),
+    re.compile(r'\b(bs|ms|mba|ma|ba|bsc|msc)\b(?:\s+degree)?'),
+    re.compile(r'degree\s+in\s+([^,\n]+)')
+]
+
+EMPLOYMENT_PATTERNS = [
+    re.compile(r'(full[\s\-]?time|part[\s\-]?time|contract|temporary|intern|remote)'),
+    re.compile(r'(permanent|freelance|consultant)')
+]
+
+TITLE_PATTERNS = [
+    re.compile(r'job title[:\s]+([^\n]+)'),
+    re.compile(r'position[:\s]+([^\n]+)'),
+    re.compile(r'role[:\s]+([^\n]+)')
+]
+
+def _classify_header(title: str) -> Optional[tuple]:
+    """Return (section, block) for a header title, or None if unrecognised"""
+    for section, block, pattern in HEADER_CATEGORIES:
+        if pattern.search(title):
+            return section, block
+    return None
 
 class JobDescriptionParser:
-    def __init__(self):
-        """Initialize the job description parser with spaCy model"""
-        self.nlp = load_spacy_model()
+    @property
+    def nlp(self):
+        """Shared spaCy model, loaded on first use"""
+        return load_spacy_model()
     
-    def extract_requirements(self, text: str) -> Dict[str, List[str]]:
+    def segment_job_description(self, text: Union[str, NormalizedText]) -> Dict[str, any]:
+        """
+        Segment a job description in one linear pass
+        
+        Header lines split the text into sections; every required or
+        preferred header also contributes its body to the matching
+        requirement block. Experience level, education and employment type
+        are read from the same lowercased text.
+        
+        Args:
+            text: Job description text, or a NormalizedText built from it
+            
+        Returns:
+            Dictionary with sections, required/preferred blocks, experience
+            level, education and employment type
+        """
+        text_lower = normalize_text(text).lower
+        
+        sections = {
+            'overview': '',
+            'responsibilities': '',
+            'requirements': '',
+            'qualifications': '',
+            'benefits': ''
+        }
+        blocks = {'required': [], 'preferred': []}
+        
+        # Walk the header lines once; each body runs to the next header
+        current = None
+        body_start = 0
+        
+        def close(end: int):
+            if current is None:
+                return
+            body = text_lower[body_start:end].strip()
+            section, block = current
+            if not sections[section]:
+                sections[section] = body
+            if block and body:
+                blocks[block].append(body)
+        
+        for match in HEADER_LINE_PATTERN.finditer(text_lower):
+            title = match.group('title').strip()
+            inline = match.group('inline')
+            category = _classify_header(title)
+            
+            if category is None:
+                # Unrecognised "Title:" lines still end the current section,
+                # but "Company: Acme" style fields do not
+                if inline is None or inline.strip():
+                    continue
+            elif inline is None and len(title.split()) > MAX_BARE_HEADER_WORDS:
+                continue
+            
+            close(match.start())
+            current = category
+            body_start = match.start('inline') if inline else match.end()
+        
+        close(len(text_lower))
+        
+        experience_level = ''
+        for pattern in EXPERIENCE_PATTERNS:
+            match = pattern.search(text_lower)
+            if match:
+                experience_level = match.group(1)
+                break
+        
+        education = []
+        for pattern in EDUCATION_PATTERNS:
+            education.extend(match for match in pattern.findall(text_lower) if match)
+        
+        employment_type = ''
+        for pattern in EMPLOYMENT_PATTERNS:
+            match = pattern.search(text_lower)
+            if match:
+                employment_type = match.group(1)
+                break
+        
+        return {
+            'sections': sections,
+            'required_blocks': blocks['required'],
+            'preferred_blocks': blocks['preferred'],
+            'experience_level': experience_level,
+            'education': education,
+            'employment_type': employment_type
+        }
+    
+    def extract_requirements(self, text: str, segments: Optional[Dict[str, any]] = None,
+                             use_ner: bool = True) -> Dict[str, List[str]]:
         """
         Extract different types of requirements from job description
         
         Args:
             text: Job description text
+            segments: Output of segment_job_description for text (optional)
+            use_ner: Run NER over the requirement blocks, not only keyword matching
             
         Returns:
             Dictionary with categorized requirements
         """
-        text_lower = text.lower()
+        if segments is None:
+            segments = self.segment_job_description(text)
         
         requirements = {
             'required_skills': [],
             'preferred_skills': [],
-            'experience_level': '',
-            'education': [],
+            'experience_level': segments['experience_level'],
+            'education': segments['education'],
             'certifications': []
         }
         
-        # Extract required vs preferred skills
-        required_patterns = [
-            r'required[:\s]+(.*?)(?=preferred|nice to have|plus|bonus|$)',
-            r'must have[:\s]+(.*?)(?=preferred|nice to have|plus|bonus|$)',
-            r'essential[:\s]+(.*?)(?=preferred|nice to have|plus|bonus|$)'
-        ]
-        
-        preferred_patterns = [
-            r'preferred[:\s]+(.*?)(?=required|must have|essential|$)',
-            r'nice to have[:\s]+(.*?)(?=required|must have|essential|$)',
-            r'plus[:\s]+(.*?)(?=required|must have|essential|$)',
-            r'bonus[:\s]+(.*?)(?=required|must have|essential|$)'
-        ]
-        
-        # Extract required skills
-        for pattern in required_patterns:
-            match = re.search(pattern, text_lower, re.DOTALL | re.IGNORECASE)
-            if match:
-                requirements['required_skills'].extend(
-                    self._extract_skills_from_section(match.group(1))
-                )
+        required_sections = segments['required_blocks']
+        preferred_sections = segments['preferred_blocks']
         
-        # Extract preferred skills
-        for pattern in preferred_patterns:
-            match = re.search(pattern, text_lower, re.DOTALL | re.IGNORECASE)
-            if match:
-                requirements['preferred_skills'].extend(
-                    self._extract_skills_from_section(match.group(1))
-                )
-        
-        # Extract experience level
-        experience_patterns = [
-            r'(\d+)[+\-\s]*years?\s+(?:of\s+)?experience',
-            r'(\d+)[+\-\s]*yrs?\s+(?:of\s+)?experience',
-            r'(entry[\s\-]?level|junior|mid[\s\-]?level|senior|lead|principal)'
-        ]
-        
-        for pattern in experience_patterns:
-            match = re.search(pattern, text_lower)
-            if match:
-                requirements['experience_level'] = match.group(1)
-                break
-        
-        # Extract education requirements
-        education_patterns = [
-            r'(bachelor|master|phd|doctorate|associate)[\s\']*(?:degree|\'s)?',
-            r'(bs|ms|mba|ma|ba|bsc|msc)(?:\s+degree)?',
-            r'degree\s+in\s+([^,\n]+)'
-        ]
-        
-        for pattern in education_patterns:
-            matches = re.findall(pattern, text_lower)
-            requirements['education'].extend([match for match in matches if match])
+        # Extract skills from every block in one batch
+        section_skills = self._extract_skills_from_sections(required_sections + preferred_sections, use_ner)
+        for skills in section_skills[:len(required_sections)]:
+            requirements['required_skills'].extend(skills)
+        for skills in section_skills[len(required_sections):]:
+            requirements['preferred_skills'].extend(skills)
         
         return requirements
     
     def _extract_skills_from_section(self, section_text: str) -> List[str]:
         """Extract skills from a specific section of text"""
-        skills = extract_skills_from_text(section_text, self.nlp)
-        
-        # Also look for skills in bullet points and lists
-        lines = section_text.split('\n')
-        for line in lines:
-            line = line.strip()
-            if line.startswith('•') or line.startswith('-') or line.startswith('*'):
-                line_skills = extract_skills_from_text(line, self.nlp)
-                skills.extend(line_skills)
+        return self._extract_skills_from_sections([section_text])[0]
+    
+    def _extract_skills_from_sections(self, section_texts: List[str], use_ner: bool = True) -> List[List[str]]:
+        """
+        Extract skills from several sections of text in one pass
         
-        return list(set(skills))  # Remove duplicates
+        Bullet points and list items are lines of their section, so the
+        single keyword and NER pass over each section already covers them.
+        """
+        return extract_skills_from_texts(section_texts, self.nlp if use_ner else None)
     
-    def extract_job_info(self, text: str) -> Dict[str, str]:
+    def extract_job_info(self, text: str, segments: Optional[Dict[str, any]] = None) -> Dict[str, str]:
         """
         Extract basic job information from job description
         
         Args:
             text: Job description text
+            segments: Output of segment_job_description for text (optional)
             
         Returns:
             Dictionary with job information
         """
+        if segments is None:
+            segments = self.segment_job_description(text)
+        
         job_info = {
             'title': '',
             'company': '',
             'location': '',
-            'employment_type': ''
+            'employment_type': segments['employment_type']
         }
         
-        text_lines = text.split('\n')
+        text_lines = text.split('\n', 5)
         first_few_lines = ' '.join(text_lines[:5]).lower()
         
         # Extract job title (usually in the first line or two)
-        title_patterns = [
-            r'job title[:\s]+([^\n]+)',
-            r'position[:\s]+([^\n]+)',
-            r'role[:\s]+([^\n]+)'
-        ]
-        
-        for pattern in title_patterns:
-            match = re.search(pattern, first_few_lines)
+        for pattern in TITLE_PATTERNS:
+            match = pattern.search(first_few_lines)
             if match:
                 job_info['title'] = match.group(1).strip()
                 break
         
-        # Extract employment type
-        employment_patterns = [
-            r'(full[\s\-]?time|part[\s\-]?time|contract|temporary|intern|remote)',
-            r'(permanent|freelance|consultant)'
-        ]
-        
-        for pattern in employment_patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                job_info['employment_type'] = match.group(1)
-                break
-        
         return job_info
     
-    def categorize_jd_sections(self, text: str) -> Dict[str, str]:
+    def categorize_jd_sections(self, text: str, segments: Optional[Dict[str, any]] = None) -> Dict[str, str]:
         """
         Categorize job description into different sections
         
         Args:
             text: Job description text
+            segments: Output of segment_job_description for text (optional)
             
         Returns:
             Dictionary with different JD sections
         """
-        sections = {
-            'overview': '',
-            'responsibilities': '',
-            'requirements': '',
-            'qualifications': '',
-            'benefits': ''
-        }
-        
-        text_lower = text.lower()
-        
-        section_patterns = {
-            'overview': [
-                r'(job summary|overview|about the role|description)(.*?)(?=responsibilities|requirements|qualifications|$)',
-                r'(company overview|about us)(.*?)(?=responsibilities|requirements|qualifications|$)'
-            ],
-            'responsibilities': [
-                r'(responsibilities|duties|what you\'ll do|role description)(.*?)(?=requirements|qualifications|benefits|$)'
-            ],
-            'requirements': [
-                r'(requirements|qualifications|what we\'re looking for)(.*?)(?=benefits|compensation|$)',
-                r'(required skills|must have)(.*?)(?=preferred|benefits|$)'
-            ],
-            'qualifications': [
-                r'(preferred qualifications|nice to have|preferred skills)(.*?)(?=benefits|compensation|$)'
-            ],
-            'benefits': [
-                r'(benefits|compensation|what we offer|perks)(.*?)$'
-            ]
-        }
-        
-        for section, patterns in section_patterns.items():
-            for pattern in patterns:
-                match = re.search(pattern, text_lower, re.DOTALL | re.IGNORECASE)
-                if match:
-                    sections[section] = match.group(2).strip()
-                    break
-        
-        return sections
+        if segments is None:
+            segments = self.segment_job_description(text)
+        return segments['sections']
     
     def preprocess_job_description(self, text: str) -> Dict[str, any]:
         """
         Comprehensive preprocessing of job description text
         
+        The text is normalized once and every stage below reads from the
+        same NormalizedText.
+        
         Args:
             text: Raw job description text
             
@@ -216,35 +280,44 @@ class JobDescriptionParser:
                 'sections': {},
                 'requirements': {},
                 'extracted_skills': [],
-                'word_count': 0
+                'word_count': 0,
+                'truncated': False,
+                'degraded': False
             }
         
-        # Clean the text
-        cleaned_text = clean_text(text)
+        # Bound the work done on oversized input
+        document = NormalizedText(text, MAX_JD_CHARS)
+        text = document.raw
+        budget = StageBudget(JD_TIME_BUDGET)
+        
+        # Segment the text once for every extraction below
+        segments = self.segment_job_description(document)
         
         # Extract job information
-        job_info = self.extract_job_info(text)
+        job_info = self.extract_job_info(text, segments)
         
         # Categorize sections
-        sections = self.categorize_jd_sections(text)
+        sections = self.categorize_jd_sections(text, segments)
         
-        # Extract requirements
-        requirements = self.extract_requirements(text)
+        # Both skill stages check the budget right before their NER call and
+        # only match keywords once it is spent
+        degraded = budget.exhausted()
+        requirements = self.extract_requirements(text, segments, use_ner=not degraded)
         
         # Extract all skills mentioned
-        extracted_skills = extract_skills_from_text(cleaned_text, self.nlp)
-        
-        # Calculate word count
-        word_count = len(cleaned_text.split())
+        degraded = degraded or budget.exhausted()
+        extracted_skills = extract_skills_from_text(document, None if degraded else self.nlp)
         
         return {
             'raw_text': text,
-            'cleaned_text': cleaned_text,
+            'cleaned_text': document.cleaned,
             'job_info': job_info,
             'sections': sections,
             'requirements': requirements,
             'extracted_skills': extracted_skills,
-            'word_count': word_count
+            'word_count': document.word_count,
+            'truncated': document.truncated,
+            'degraded': degraded
         }
     
     def parse_job_description(self, text: str) -> Dict[str, any]:
@@ -3,48 +3,220 @@ Match Engine Module
 Core engine for computing similarity between resumes and job descriptions
 """
 
-import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from typing import Dict, List, Tuple, Optional
-import matplotlib.pyplot as plt
-import seaborn as sns
+# numpy, scikit-learn and matplotlib are imported where they are first
+# needed so that importing this module (and app.py / cli.py) stays fast
+from typing import Dict, Iterable, List, Tuple, Optional, Union
 import io
+import os
+import heapq
+import itertools
+from functools import lru_cache
 import base64
+from concurrent.futures import ProcessPoolExecutor
 
-from resume_parser import ResumeParser
+from resume_parser import ResumeParser, PdfSource, MAX_RESUME_CHARS
+from resume_cache import ResumeCache
 from jd_parser import JobDescriptionParser
-from utils import calculate_match_percentage, get_improvement_suggestions, format_skills_list
+from svg_charts import render_match_chart_svg
+from vector_space import VectorSpace
+from embeddings import EmbeddingBackend
+from skill_bitsets import SkillVocabulary, popcount, skill_overlap
+from utils import (
+    calculate_match_percentage, max_match_percentage, get_improvement_suggestions,
+    format_skills_list, get_skill_matcher, NormalizedText
+)
+
+# Resumes scored per step once a top-k shortlist is full
+SHORTLIST_CHUNK_SIZE = 32
+
+# Resumes cascade_analyze passes from the keyword prescreen to full analysis
+CASCADE_TOP_N = 100
+
+# Fields of a match report, in report order (see generate_match_report)
+REPORT_FIELDS = (
+    'match_score', 'similarity_score', 'semantic_score', 'skill_match_ratio',
+    'skills_analysis', 'contact_info', 'suggestions', 'resume_quality',
+    'jd_requirements', 'formatted_output'
+)
+
+class JobProfile:
+    """
+    A job description compiled once so that many resumes can be scored
+    against it without re-parsing the JD for every candidate
+    """
+
+    def __init__(self, jd_data: Dict[str, any], terms: List[str]):
+        """
+        Args:
+            jd_data: Processed job description data from JobDescriptionParser
+            terms: JD text already run through ResumeJobMatcher.document_terms
+        """
+        self.jd_data = jd_data
+        self.cleaned_text = jd_data['cleaned_text']
+        self.skills = jd_data['extracted_skills']
+        self.skill_set = set(skill.lower() for skill in self.skills)
+        self.requirements = jd_data.get('requirements', {})
+        self.terms = terms
+        # Set by the matcher when it scores in a fixed vector space
+        self.vector = None
 
 class ResumeJobMatcher:
-    def __init__(self):
-        """Initialize the matcher with parsers and vectorizer"""
-        self.resume_parser = ResumeParser()
+    def __init__(self, resume_cache: Optional[ResumeCache] = None,
+                 vector_space: Optional[VectorSpace] = None,
+                 embedding_backend: Optional[EmbeddingBackend] = None):
+        """
+        Initialize the matcher with parsers and vectorizer
+        
+        Args:
+            resume_cache: Cache of parsed resumes shared with the parser (optional)
+            vector_space: Fixed vector space to score in (optional); without
+                one the TF-IDF vectorizer is fitted for every comparison
+            embedding_backend: Semantic similarity backend (optional); its
+                score is blended with the TF-IDF score
+        """
+        self.resume_cache = resume_cache
+        self.vector_space = vector_space
+        self.embedding_backend = embedding_backend
+        self.resume_parser = ResumeParser(cache=resume_cache)
         self.jd_parser = JobDescriptionParser()
-        self.vectorizer = TfidfVectorizer(
-            max_features=5000,
-            stop_words='english',
-            ngram_range=(1, 2),
-            lowercase=True
-        )
+        self._vectorizer = None
+        self._stop_words = None
     
-    def compute_similarity(self, resume_text: str, jd_text: str) -> float:
+    @property
+    def vectorizer(self):
+        """
+        TF-IDF configuration template, created on first use
+        
+        It is cloned before every fit so the matcher holds no mutable state
+        and can be shared across threads.
+        """
+        if self._vectorizer is None:
+            from sklearn.feature_extraction.text import TfidfVectorizer
+            self._vectorizer = TfidfVectorizer(
+                max_features=5000,
+                stop_words='english',
+                ngram_range=(1, 2),
+                lowercase=True
+            )
+        return self._vectorizer
+    
+    @property
+    def stop_words(self) -> frozenset:
+        """Stop words of the vectorizer"""
+        if self._stop_words is None:
+            self._stop_words = frozenset(self.vectorizer.get_stop_words() or ())
+        return self._stop_words
+    
+    def document_terms(self, document: Union[str, NormalizedText]) -> List[str]:
+        """
+        Terms of a document as the vectorizer's analyzer would produce them
+        
+        Works from the document's shared word tokens (keeping tokens of two
+        or more characters, dropping stop words, then adding n-grams) rather
+        than lowercasing and tokenizing the text again.
+        
+        Args:
+            document: Cleaned text, or a NormalizedText
+            
+        Returns:
+            List of unigram and n-gram terms
+        """
+        if not isinstance(document, NormalizedText):
+            document = NormalizedText.from_cleaned(document)
+        
+        stop_words = self.stop_words
+        words = [token for token in document.tokens if len(token) > 1 and token not in stop_words]
+        
+        min_n, max_n = self.vectorizer.ngram_range
+        terms = list(words) if min_n == 1 else []
+        for n in range(max(min_n, 2), max_n + 1):
+            terms.extend(' '.join(words[i:i + n]) for i in range(len(words) - n + 1))
+        return terms
+    
+    def compile_job_profile(self, jd_text: str) -> Dict[str, any]:
+        """
+        Parse a job description once into a reusable JobProfile
+        
+        Args:
+            jd_text: Job description text
+            
+        Returns:
+            Dictionary with success flag, error message and the JobProfile
+        """
+        jd_result = self.jd_parser.parse_job_description(jd_text)
+        if not jd_result['success']:
+            return {
+                'success': False,
+                'error': jd_result['error'],
+                'data': None
+            }
+        
+        jd_data = jd_result['data']
+        profile = JobProfile(jd_data, self.document_terms(jd_data['cleaned_text']))
+        if self.vector_space is not None:
+            profile.vector = self.vector_space.transform([profile.terms])
+        
+        return {
+            'success': True,
+            'error': None,
+            'data': profile
+        }
+    
+    def vectorize(self, texts: List[Union[str, NormalizedText]]):
+        """
+        Compute vectors in the configured fixed vector space
+        
+        The rows can be stored and compared later: the dot product of any
+        two is their cosine similarity.
+        
+        Args:
+            texts: Cleaned texts, or NormalizedText documents
+            
+        Returns:
+            Sparse matrix with one L2-normalized row per text
+        """
+        if self.vector_space is None:
+            raise ValueError("No vector space configured")
+        return self.vector_space.transform([self.document_terms(text) for text in texts])
+    
+    def compute_similarity(self, resume_text: str, jd_text: str,
+                           jd_terms: Optional[List[str]] = None) -> float:
         """
         Compute cosine similarity between resume and job description
         
         Args:
             resume_text: Cleaned resume text
             jd_text: Cleaned job description text
+            jd_terms: Pre-analyzed JD terms from a JobProfile (optional)
             
         Returns:
             Cosine similarity score (0-1)
         """
+        from sklearn.base import clone
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.metrics.pairwise import cosine_similarity
+        
         try:
-            # Combine texts for fitting the vectorizer
-            documents = [resume_text, jd_text]
-            
-            # Create TF-IDF vectors
-            tfidf_matrix = self.vectorizer.fit_transform(documents)
+            if self.vector_space is not None:
+                # Both vectors come from the fixed space; nothing is fitted
+                tfidf_matrix = self.vector_space.transform([
+                    self.document_terms(resume_text),
+                    jd_terms if jd_terms is not None else self.document_terms(jd_text)
+                ])
+            elif jd_terms is not None:
+                # Reuse the JD tokenization and only analyze the resume
+                vectorizer = TfidfVectorizer(
+                    max_features=self.vectorizer.max_features,
+                    analyzer=lambda terms: terms
+                )
+                tfidf_matrix = vectorizer.fit_transform([self.document_terms(resume_text), jd_terms])
+            else:
+                # Combine texts for fitting the vectorizer
+                documents = [resume_text, jd_text]
+                
+                # Create TF-IDF vectors on a private copy so that concurrent
+                # calls never share fitted state
+                tfidf_matrix = clone(self.vectorizer).fit_transform(documents)
             
             # Compute cosine similarity
             similarity_matrix = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])
@@ -86,7 +258,8 @@ class ResumeJobMatcher:
         }
     
     def calculate_weighted_score(self, similarity_score: float, skill_match_ratio: float, 
-                               experience_match: bool = True) -> float:
+                               experience_match: bool = True,
+                               semantic_score: Optional[float] = None) -> float:
         """
         Calculate a weighted match score considering multiple factors
         
@@ -94,6 +267,7 @@ class ResumeJobMatcher:
             similarity_score: Text similarity score
             skill_match_ratio: Ratio of matched skills
             experience_match: Whether experience requirements are met
+            semantic_score: Embedding similarity score (optional)
             
         Returns:
             Weighted match score (0-1)
@@ -103,6 +277,14 @@ class ResumeJobMatcher:
         skill_weight = 0.4
         experience_weight = 0.2
         
+        # Share of the text weight given to the semantic score, if there is one
+        semantic_share = 0.5
+        if semantic_score is not None:
+            similarity_score = (
+                similarity_score * (1 - semantic_share) +
+                semantic_score * semantic_share
+            )
+        
         # Calculate weighted score
         weighted_score = (
             similarity_score * text_weight +
@@ -113,15 +295,24 @@ class ResumeJobMatcher:
         return min(1.0, weighted_score)
     
     def generate_match_report(self, resume_data: Dict, jd_data: Dict, 
-                            similarity_score: float, skill_analysis: Dict) -> Dict[str, any]:
+                            similarity_score: float, skill_analysis: Dict,
+                            semantic_score: Optional[float] = None,
+                            fields: Optional[Iterable[str]] = None) -> Dict[str, any]:
         """
         Generate a comprehensive match report
         
+        Only the requested fields are built, so skipping 'resume_quality',
+        'suggestions' or 'formatted_output' also skips their work.
+        'match_score' is always included; 'semantic_score' only when there
+        is one, i.e. when an embedding backend is configured.
+        
         Args:
             resume_data: Processed resume data
             jd_data: Processed job description data
             similarity_score: Similarity score
             skill_analysis: Skill overlap analysis
+            semantic_score: Embedding similarity score (optional)
+            fields: Report fields to include (defaults to all of REPORT_FIELDS)
             
         Returns:
             Comprehensive match report
@@ -132,23 +323,28 @@ class ResumeJobMatcher:
         skill_match_ratio = matched_skills / total_jd_skills if total_jd_skills > 0 else 0
         
         # Calculate weighted score
-        weighted_score = self.calculate_weighted_score(similarity_score, skill_match_ratio)
+        weighted_score = self.calculate_weighted_score(
+            similarity_score, skill_match_ratio, semantic_score=semantic_score
+        )
         
         # Convert to percentage
         match_percentage = calculate_match_percentage(weighted_score)
         
-        # Generate suggestions
-        suggestions = get_improvement_suggestions(
-            skill_analysis['missing_skills'], 
-            match_percentage
-        )
+        # Suggestions feed two fields, so generate them at most once
+        @lru_cache(maxsize=None)
+        def suggestions() -> str:
+            return get_improvement_suggestions(
+                skill_analysis['missing_skills'], 
+                match_percentage
+            )
         
-        # Create detailed report
-        report = {
-            'match_score': match_percentage,
-            'similarity_score': similarity_score,
-            'skill_match_ratio': skill_match_ratio,
-            'skills_analysis': {
+        # Each field is built on demand
+        builders = {
+            'match_score': lambda: match_percentage,
+            'similarity_score': lambda: similarity_score,
+            'semantic_score': lambda: semantic_score,
+            'skill_match_ratio': lambda: skill_match_ratio,
+            'skills_analysis': lambda: {
                 'total_resume_skills': len(resume_data['extracted_skills']),
                 'total_jd_skills': len(jd_data['extracted_skills']),
                 'matched_skills': matched_skills,
@@ -156,13 +352,19 @@ class ResumeJobMatcher:
                 'missing_skills': skill_analysis['missing_skills'][:10],  # Top 10
                 'extra_skills': skill_analysis['extra_skills'][:5]  # Top 5
             },
-            'contact_info': resume_data.get('contact_info', {}),
+            'contact_info': lambda: resume_data.get('contact_info', {}),
             'suggestions': suggestions,
-            'resume_quality': self.resume_parser.validate_resume(resume_data),
-            'jd_requirements': jd_data.get('requirements', {}),
-            'formatted_output': self._format_output(match_percentage, skill_analysis, suggestions)
+            'resume_quality': lambda: self.resume_parser.validate_resume(resume_data),
+            'jd_requirements': lambda: jd_data.get('requirements', {}),
+            'formatted_output': lambda: self._format_output(match_percentage, skill_analysis, suggestions())
         }
         
+        # Create detailed report
+        wanted = set(REPORT_FIELDS if fields is None else fields) | {'match_score'}
+        if semantic_score is None:
+            wanted.discard('semantic_score')
+        report = {field: builders[field]() for field in REPORT_FIELDS if field in wanted}
+        
         return report
     
     def _format_output(self, match_percentage: float, skill_analysis: Dict, suggestions: str) -> str:
@@ -182,92 +384,172 @@ Suggestions: {suggestions}
         """
         return output.strip()
     
-    def create_match_visualization(self, match_score: float, skill_analysis: Dict) -> str:
+    def create_match_visualization(self, match_score: float, skill_analysis: Dict,
+                                   chart_format: str = 'png') -> str:
         """
         Create a visualization of the match results
         
         Args:
             match_score: Match percentage
             skill_analysis: Skill analysis results
+            chart_format: 'png' for a base64 encoded image or 'svg' for markup
             
         Returns:
-            Base64 encoded plot image
+            Base64 encoded plot image, or SVG markup
         """
-        try:
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
-            
-            # 1. Match Score Gauge
-            ax1.pie([match_score, 100-match_score], 
-                   startangle=90, counterclock=False,
-                   colors=['#2E8B57', '#F5F5F5'],
-                   wedgeprops=dict(width=0.3))
-            ax1.text(0, 0, f'{match_score:.1f}%', ha='center', va='center', 
-                    fontsize=16, fontweight='bold')
-            ax1.set_title('Overall Match Score', fontweight='bold')
-            
-            # 2. Skills Breakdown
-            skills_data = [
+        return CHART_RENDERERS[chart_format](
+            round(float(match_score), 1),
+            (
                 len(skill_analysis['common_skills']),
                 len(skill_analysis['missing_skills']),
                 len(skill_analysis['extra_skills'])
-            ]
-            skills_labels = ['Matched', 'Missing', 'Extra']
-            colors = ['#2E8B57', '#DC143C', '#4682B4']
-            
-            ax2.pie(skills_data, labels=skills_labels, autopct='%1.1f%%', 
-                   colors=colors, startangle=90)
-            ax2.set_title('Skills Distribution', fontweight='bold')
-            
-            # 3. Top Missing Skills
-            missing_skills = skill_analysis['missing_skills'][:5]
-            if missing_skills:
-                y_pos = range(len(missing_skills))
-                ax3.barh(y_pos, [1]*len(missing_skills), color='#DC143C', alpha=0.7)
-                ax3.set_yticks(y_pos)
-                ax3.set_yticklabels([skill.title() for skill in missing_skills])
-                ax3.set_xlabel('Priority')
-                ax3.set_title('Top Missing Skills', fontweight='bold')
-            else:
-                ax3.text(0.5, 0.5, 'No Missing Skills!', ha='center', va='center',
-                        transform=ax3.transAxes, fontsize=14)
-                ax3.set_title('Missing Skills', fontweight='bold')
-            
-            # 4. Top Matched Skills
-            common_skills = skill_analysis['common_skills'][:5]
-            if common_skills:
-                y_pos = range(len(common_skills))
-                ax4.barh(y_pos, [1]*len(common_skills), color='#2E8B57', alpha=0.7)
-                ax4.set_yticks(y_pos)
-                ax4.set_yticklabels([skill.title() for skill in common_skills])
-                ax4.set_xlabel('Match')
-                ax4.set_title('Top Matched Skills', fontweight='bold')
+            ),
+            tuple(skill_analysis['missing_skills'][:5]),
+            tuple(skill_analysis['common_skills'][:5])
+        )
+    
+    def create_report_visualization(self, report: Dict[str, any], chart_format: str = 'png') -> str:
+        """
+        Create the match visualization from a match report
+        
+        Args:
+            report: Report from generate_match_report (only match_score and
+                skills_analysis are read)
+            chart_format: 'png' for a base64 encoded image or 'svg' for markup
+            
+        Returns:
+            Base64 encoded plot image, or SVG markup
+        """
+        skills = report['skills_analysis']
+        matched = skills['matched_skills']
+        return CHART_RENDERERS[chart_format](
+            round(float(report['match_score']), 1),
+            (
+                matched,
+                skills['total_jd_skills'] - matched,
+                skills['total_resume_skills'] - matched
+            ),
+            tuple(skills['missing_skills'][:5]),
+            tuple(skills['common_skills'][:5])
+        )
+    
+    def compute_similarities(self, resume_texts: List[str], jd_text: str,
+                             jd_terms: Optional[List[str]] = None) -> 'np.ndarray':
+        """
+        Compute cosine similarity of one job description against many resumes
+        
+        The vectorizer is fitted once on the JD plus every resume, so IDF
+        reflects the whole candidate corpus, and all scores come from a
+        single sparse matrix-vector product. With a fixed vector space the
+        vectors are taken from it instead and nothing is fitted.
+        
+        Args:
+            resume_texts: Cleaned resume texts
+            jd_text: Cleaned job description text
+            jd_terms: Pre-analyzed JD terms from a JobProfile (optional)
+            
+        Returns:
+            Array of cosine similarity scores (0-1), one per resume
+        """
+        import numpy as np
+        from sklearn.base import clone
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        
+        if not resume_texts:
+            return np.zeros(0)
+        
+        try:
+            if self.vector_space is not None:
+                jd_terms = jd_terms if jd_terms is not None else self.document_terms(jd_text)
+                tfidf_matrix = self.vector_space.transform(
+                    [jd_terms] + [self.document_terms(text) for text in resume_texts]
+                )
             else:
-                ax4.text(0.5, 0.5, 'No Matched Skills', ha='center', va='center',
-                        transform=ax4.transAxes, fontsize=14)
-                ax4.set_title('Matched Skills', fontweight='bold')
+                if jd_terms is not None:
+                    vectorizer = TfidfVectorizer(
+                        max_features=self.vectorizer.max_features,
+                        analyzer=lambda terms: terms
+                    )
+                    documents = [jd_terms] + [self.document_terms(text) for text in resume_texts]
+                else:
+                    vectorizer = clone(self.vectorizer)
+                    documents = [jd_text] + list(resume_texts)
+                
+                tfidf_matrix = vectorizer.fit_transform(documents)
+            
+            # Rows are L2-normalized, so dot products are cosine similarities
+            scores = tfidf_matrix[1:] @ tfidf_matrix[0].T
+            
+            return np.asarray(scores.todense()).ravel()
+            
+        except Exception as e:
+            print(f"Error computing similarities: {str(e)}")
+            return np.zeros(len(resume_texts))
+    
+    def _parse_resumes_for_batch(self, resume_paths: List[PdfSource],
+                                 texts: Optional[List[Optional[str]]] = None) -> List[Dict[str, any]]:
+        """Parse resumes in one batch, turning unexpected errors into failed results"""
+        try:
+            return self.resume_parser.parse_resumes(resume_paths, texts=texts)
+        except Exception as e:
+            return [{
+                'success': False,
+                'error': f"Error analyzing match: {str(e)}",
+                'data': None
+            } for _ in resume_paths]
+    
+    def _build_match_result(self, resume_data: Dict, job_profile: JobProfile,
+                            similarity_score: float,
+                            include_visualization: bool = False,
+                            semantic_score: Optional[float] = None,
+                            fields: Optional[Iterable[str]] = None) -> Dict[str, any]:
+        """Assemble the match result for a parsed resume and its similarity scores"""
+        try:
+            jd_data = job_profile.jd_data
             
-            plt.tight_layout()
+            # Analyze skill overlap
+            skill_analysis = self.analyze_skill_overlap(
+                resume_data['extracted_skills'],
+                jd_data['extracted_skills']
+            )
             
-            # Convert to base64 string
-            img_buffer = io.BytesIO()
-            plt.savefig(img_buffer, format='png', bbox_inches='tight', dpi=150)
-            img_buffer.seek(0)
-            img_base64 = base64.b64encode(img_buffer.getvalue()).decode()
-            plt.close()
+            # Generate comprehensive report
+            match_report = self.generate_match_report(
+                resume_data, jd_data, similarity_score, skill_analysis, semantic_score, fields
+            )
             
-            return img_base64
+            # Charts are opt-in; clients usually fetch them separately
+            if include_visualization:
+                match_report['visualization'] = self.create_match_visualization(
+                    match_report['match_score'], skill_analysis
+                )
+            
+            return {
+                'success': True,
+                'error': None,
+                'data': match_report
+            }
             
         except Exception as e:
-            print(f"Error creating visualization: {str(e)}")
-            return ""
+            return {
+                'success': False,
+                'error': f"Error analyzing match: {str(e)}",
+                'data': None
+            }
     
-    def analyze_match(self, resume_path: str, jd_text: str) -> Dict[str, any]:
+    def analyze_match(self, resume_path: PdfSource, jd_text: str,
+                      job_profile: Optional[JobProfile] = None,
+                      include_visualization: bool = False,
+                      fields: Optional[Iterable[str]] = None) -> Dict[str, any]:
         """
         Main method to analyze match between resume and job description
         
         Args:
-            resume_path: Path to resume PDF file
+            resume_path: Path to resume PDF file, its bytes, or a binary stream
             jd_text: Job description text
+            job_profile: Pre-compiled profile of jd_text (optional)
+            include_visualization: Render the match chart into the report
+            fields: Report fields to include (defaults to all of REPORT_FIELDS)
             
         Returns:
             Complete match analysis
@@ -282,46 +564,284 @@ Suggestions: {suggestions}
                     'data': None
                 }
             
-            # Parse job description
-            jd_result = self.jd_parser.parse_job_description(jd_text)
-            if not jd_result['success']:
-                return {
-                    'success': False,
-                    'error': jd_result['error'],
-                    'data': None
-                }
+            # Parse job description unless it was compiled up front
+            if job_profile is None:
+                profile_result = self.compile_job_profile(jd_text)
+                if not profile_result['success']:
+                    return profile_result
+                job_profile = profile_result['data']
             
             resume_data = resume_result['data']
-            jd_data = jd_result['data']
             
             # Compute similarity
             similarity_score = self.compute_similarity(
                 resume_data['cleaned_text'],
-                jd_data['cleaned_text']
+                job_profile.cleaned_text,
+                jd_terms=job_profile.terms
             )
+            semantic_score = None
+            if self.embedding_backend is not None:
+                semantic_score = float(self.embedding_backend.similarities(
+                    [resume_data['cleaned_text']], [job_profile.cleaned_text]
+                )[0, 0])
             
-            # Analyze skill overlap
-            skill_analysis = self.analyze_skill_overlap(
-                resume_data['extracted_skills'],
-                jd_data['extracted_skills']
+            return self._build_match_result(
+                resume_data, job_profile, similarity_score, include_visualization, semantic_score, fields
             )
             
-            # Generate comprehensive report
-            match_report = self.generate_match_report(
-                resume_data, jd_data, similarity_score, skill_analysis
-            )
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f"Error analyzing match: {str(e)}",
+                'data': None
+            }
+    
+    def batch_analyze(self, resume_paths: List[PdfSource], jd_text: Union[str, JobProfile],
+                      workers: Optional[int] = None,
+                      resume_names: Optional[List[str]] = None,
+                      min_score: Optional[float] = None,
+                      top_k: Optional[int] = None,
+                      fields: Optional[Iterable[str]] = None) -> List[Dict[str, any]]:
+        """
+        Analyze multiple resumes against a single job description
+        
+        Text similarity is computed for the whole batch at once with
+        compute_similarities, so IDF is taken over all submitted resumes
+        unless the matcher scores in a fixed vector space.
+        
+        Given min_score and/or top_k, only the shortlist is scored in full
+        and reported on (see shortlist); the results are the same as
+        filtering the full analysis.
+        
+        Args:
+            resume_paths: List of resume PDF file paths, bytes or binary streams
+            jd_text: Job description text, or a compiled JobProfile
+            workers: Number of worker processes; None or 1 runs serially
+            resume_names: Display name for each resume (defaults to the file name)
+            min_score: Lowest match score to return (optional)
+            top_k: Largest number of resumes to return (optional)
+            fields: Report fields to include (defaults to all of REPORT_FIELDS)
             
-            # Create visualization
-            visualization = self.create_match_visualization(
-                match_report['match_score'], skill_analysis
+        Returns:
+            List of match analyses sorted by match score
+        """
+        resume_paths, resume_names = _read_batch_inputs(resume_paths, resume_names)
+        
+        # Parse the job description once for the whole batch
+        if isinstance(jd_text, JobProfile):
+            job_profile = jd_text
+        else:
+            profile_result = self.compile_job_profile(jd_text)
+            if not profile_result['success']:
+                return []
+            job_profile = profile_result['data']
+        
+        return self._analyze_batch(resume_paths, resume_names, job_profile, workers,
+                                   min_score=min_score, top_k=top_k, fields=fields)
+    
+    def _analyze_batch(self, resume_paths: List[Union[str, bytes]], resume_names: List[str],
+                       job_profile: JobProfile, workers: Optional[int] = None,
+                       min_score: Optional[float] = None,
+                       top_k: Optional[int] = None,
+                       fields: Optional[Iterable[str]] = None,
+                       texts: Optional[List[Optional[str]]] = None) -> List[Dict[str, any]]:
+        """batch_analyze for read inputs and a compiled job profile, optionally
+        with the text already extracted from each PDF"""
+        results = []
+        texts = texts if texts is not None else [None] * len(resume_paths)
+        
+        workers = min(workers or 1, os.cpu_count() or 1, len(resume_paths))
+        if workers > 1:
+            # Each worker builds its own matcher (and spaCy model) once
+            # and runs NER over its share of resumes in batches
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=_init_batch_worker,
+                                     initargs=(job_profile, self.resume_cache)) as executor:
+                parse_results = list(itertools.chain.from_iterable(
+                    executor.map(_parse_in_worker, _worker_chunks(list(zip(resume_paths, texts)), workers))
+                ))
+        else:
+            parse_results = self._parse_resumes_for_batch(resume_paths, texts)
+        
+        parsed = []
+        for index, resume_result in enumerate(parse_results):
+            if resume_result['success']:
+                parsed.append((index, resume_result['data']))
+        
+        if min_score is not None or top_k is not None:
+            selected = self.shortlist(
+                [resume_data for _, resume_data in parsed], job_profile,
+                min_score=min_score, top_k=top_k
+            )
+            jobs = [
+                (parsed[position][1], score, semantic_score)
+                for position, score, semantic_score in selected
+            ]
+            parsed = [parsed[position] for position, _, _ in selected]
+        else:
+            # Score every resume against the JD in one pass
+            similarity_scores = self.compute_similarities(
+                [resume_data['cleaned_text'] for _, resume_data in parsed],
+                job_profile.cleaned_text,
+                jd_terms=job_profile.terms
             )
             
-            match_report['visualization'] = visualization
+            # Embed the whole batch at once (cached embeddings are reused)
+            semantic_scores = [None] * len(parsed)
+            if self.embedding_backend is not None and parsed:
+                semantic_scores = self.embedding_backend.similarities(
+                    [resume_data['cleaned_text'] for _, resume_data in parsed],
+                    [job_profile.cleaned_text]
+                )[:, 0].tolist()
+            
+            jobs = [
+                (resume_data, float(score), semantic_score)
+                for (_, resume_data), score, semantic_score in zip(parsed, similarity_scores, semantic_scores)
+            ]
+        
+        # Reports are cheap next to parsing; building them here avoids
+        # shipping every parsed resume back to a worker
+        for (index, _), (resume_data, score, semantic_score) in zip(parsed, jobs):
+            result = self._build_match_result(resume_data, job_profile, score,
+                                              semantic_score=semantic_score, fields=fields)
+            if result['success']:
+                if isinstance(resume_paths[index], str):
+                    result['resume_path'] = resume_paths[index]
+                result['resume_name'] = resume_names[index]
+                results.append(result)
+        
+        # Sort by match score (descending)
+        results.sort(key=lambda x: x['data']['match_score'], reverse=True)
+        
+        return results
+    
+    def prescreen_scores(self, resume_paths: List[PdfSource],
+                         job_profile: JobProfile) -> List[Optional[float]]:
+        """
+        Rough weighted scores from keyword features only
+        
+        Each PDF's text is extracted (or its cached parse reused) and
+        matched against the skill vocabulary, without spaCy, sections or
+        validation. The cosine similarity of the resume's and the JD's word
+        sets stands in for TF-IDF similarity. The scores are only meant for
+        ranking.
+        
+        Args:
+            resume_paths: List of resume PDF file paths or bytes
+            job_profile: Compiled job description
+            
+        Returns:
+            Weighted score (0-1) of each resume, or None if no text could
+            be extracted
+        """
+        return [score for score, _ in self._prescreen(resume_paths, job_profile)]
+    
+    def _prescreen(self, resume_paths: List[PdfSource],
+                   job_profile: JobProfile) -> List[Tuple[Optional[float], Optional[str]]]:
+        """prescreen_scores, paired with the text extracted from each PDF
+        (None where the cached parse was used)"""
+        skill_matcher = get_skill_matcher()
+        stop_words = self.stop_words
+        jd_words = frozenset(term for term in job_profile.terms if ' ' not in term)
+        
+        scores = []
+        for resume_path in resume_paths:
+            pdf = self.resume_parser.load_pdf(resume_path)
+            cached_data = self.resume_parser.get_cached(pdf)
+            if cached_data is not None:
+                text = None
+                document = NormalizedText.from_cleaned(cached_data['cleaned_text'])
+            else:
+                text = self.resume_parser.extract_text_from_pdf(pdf)
+                if not text.strip():
+                    scores.append((None, text))
+                    continue
+                document = NormalizedText(text, MAX_RESUME_CHARS)
+            
+            words = set(token for token in document.tokens if len(token) > 1 and token not in stop_words)
+            similarity = len(jd_words & words) / (len(jd_words) * len(words)) ** 0.5 if jd_words and words else 0
+            
+            matched = job_profile.skill_set.intersection(skill_matcher.find_tokens(document.tokens))
+            skill_match_ratio = len(matched) / len(job_profile.skills) if job_profile.skills else 0
+            scores.append((self.calculate_weighted_score(similarity, skill_match_ratio), text))
+        return scores
+    
+    def cascade_analyze(self, resume_paths: List[PdfSource], jd_text: str,
+                        top_n: Optional[int] = None,
+                        workers: Optional[int] = None,
+                        resume_names: Optional[List[str]] = None,
+                        min_score: Optional[float] = None,
+                        top_k: Optional[int] = None,
+                        fields: Optional[Iterable[str]] = None) -> Dict[str, any]:
+        """
+        Rank a large pile of resumes in two stages
+        
+        Stage one scores every resume with prescreen_scores. Stage two runs
+        the full batch_analyze pipeline (NER, sections, validation and
+        report) on the top_n resumes of stage one only, reusing the text
+        stage one extracted. Without a fixed vector space, stage two fits
+        IDF over those top_n resumes.
+        
+        Args:
+            resume_paths: List of resume PDF file paths, bytes or binary streams
+            jd_text: Job description text
+            top_n: Resumes passed to stage two (defaults to CASCADE_TOP_N)
+            workers: Number of worker processes; None or 1 runs serially
+            resume_names: Display name for each resume (defaults to the file name)
+            min_score: Lowest match score to return from stage two (optional)
+            top_k: Largest number of resumes to return from stage two (optional)
+            fields: Report fields to include (defaults to all of REPORT_FIELDS)
+            
+        Returns:
+            Dictionary with 'results' (shaped like batch_analyze results)
+            and 'stages', the number of resumes each stage handled
+        """
+        try:
+            top_n = CASCADE_TOP_N if top_n is None else top_n
+            resume_paths, resume_names = _read_batch_inputs(resume_paths, resume_names)
+            
+            profile_result = self.compile_job_profile(jd_text)
+            if not profile_result['success']:
+                return profile_result
+            job_profile = profile_result['data']
+            
+            # Stage one: text extraction and keyword matching for everyone
+            workers = min(workers or 1, os.cpu_count() or 1, len(resume_paths))
+            if workers > 1:
+                with ProcessPoolExecutor(max_workers=workers,
+                                         initializer=_init_batch_worker,
+                                         initargs=(job_profile, self.resume_cache)) as executor:
+                    prescreened = list(itertools.chain.from_iterable(
+                        executor.map(_prescreen_in_worker, _worker_chunks(resume_paths, workers))
+                    ))
+            else:
+                prescreened = self._prescreen(resume_paths, job_profile)
+            scores = [score for score, _ in prescreened]
+            
+            readable = [index for index, score in enumerate(scores) if score is not None]
+            head = heapq.nlargest(top_n, readable, key=scores.__getitem__)
+            
+            # Stage two: the full pipeline for the head of the ranking
+            results = self._analyze_batch(
+                [resume_paths[index] for index in head],
+                [resume_names[index] for index in head],
+                job_profile, workers,
+                min_score=min_score, top_k=top_k, fields=fields,
+                texts=[prescreened[index][1] for index in head]
+            )
             
             return {
                 'success': True,
                 'error': None,
-                'data': match_report
+                'data': {
+                    'results': results,
+                    'stages': {
+                        'prescreened': len(resume_paths),
+                        'unreadable': len(resume_paths) - len(readable),
+                        'analyzed': len(head),
+                        'returned': len(results)
+                    }
+                }
             }
             
         except Exception as e:
@@ -331,29 +851,480 @@ Suggestions: {suggestions}
                 'data': None
             }
     
-    def batch_analyze(self, resume_paths: List[str], jd_text: str) -> List[Dict[str, any]]:
+    def similarity_bounds(self, resume_texts: List[Union[str, NormalizedText]],
+                          job_profile: JobProfile) -> Optional[List[float]]:
         """
-        Analyze multiple resumes against a single job description
+        Upper bounds of text similarity that need only each resume's words
+        
+        A JD term adds to the cosine similarity only if every word of it
+        occurs in the resume, so the similarity is at most the norm of the
+        JD vector over those terms. Checking words is much cheaper than
+        building a resume's n-grams and vector.
         
         Args:
-            resume_paths: List of resume PDF file paths
-            jd_text: Job description text
+            resume_texts: Cleaned resume texts, or NormalizedText documents
+            job_profile: Job description compiled in the matcher's vector space
             
         Returns:
-            List of match analyses sorted by match score
+            One bound per resume, or None if the vector space does not map
+            columns to terms (as with hashing)
         """
-        results = []
+        vocabulary = self.vector_space.vocabulary if self.vector_space is not None else None
+        if vocabulary is None or job_profile.vector is None:
+            return None
         
-        for resume_path in resume_paths:
-            result = self.analyze_match(resume_path, jd_text)
-            if result['success']:
-                result['resume_path'] = resume_path
-                results.append(result)
+        columns = {column: term for term, column in vocabulary.items()}
+        vector = job_profile.vector.tocsr()
+        features = [
+            (frozenset(columns[column].split(' ')), weight * weight)
+            for column, weight in zip(vector.indices.tolist(), vector.data.tolist())
+        ]
+        jd_words = frozenset().union(*(words for words, _ in features))
         
-        # Sort by match score (descending)
-        results.sort(key=lambda x: x['data']['match_score'], reverse=True)
+        bounds = []
+        for document in resume_texts:
+            if not isinstance(document, NormalizedText):
+                document = NormalizedText.from_cleaned(document)
+            present = jd_words.intersection(document.tokens)
+            squared = sum(weight for words, weight in features if words <= present)
+            # Leave room for rounding in the exact dot product
+            bounds.append(min(1.0, squared ** 0.5 + 1e-9))
+        return bounds
+    
+    def shortlist(self, resumes: List[Dict], job_profile: JobProfile,
+                  min_score: Optional[float] = None,
+                  top_k: Optional[int] = None) -> List[Tuple[int, float, Optional[float]]]:
+        """
+        Find the resumes above a score cutoff and/or among the best top_k
         
-        return results
+        Skill match ratios are cheap, so they come first. Together with an
+        upper bound on the text similarity (see similarity_bounds) and a
+        semantic similarity of 1 they bound the best score each resume can
+        reach; resumes whose bound is below min_score are never scored.
+        The rest are scored best bound first, and scoring stops once no
+        remaining bound can beat the k-th best score found so far.
+        
+        With a fixed vector space only the scored resumes are vectorized.
+        Otherwise IDF is fitted over the whole batch as in batch_analyze,
+        so every resume takes part in the text similarity pass, and the
+        pruning saves the embedding and report work.
+        
+        Args:
+            resumes: Processed resume data
+            job_profile: Compiled job description
+            min_score: Lowest match score to keep (optional)
+            top_k: Largest number of resumes to keep (optional)
+            
+        Returns:
+            (index into resumes, similarity score, semantic score) of each
+            kept resume, by match score descending, ties in input order
+        """
+        if not resumes or (top_k is not None and top_k <= 0):
+            return []
+        
+        vocabulary = SkillVocabulary()
+        ratios = skill_overlap(
+            vocabulary.encode_many([resume_data['extracted_skills'] for resume_data in resumes]),
+            vocabulary.encode(job_profile.skill_set, add=False),
+            len(job_profile.skills)
+        )['skill_match_ratio'].tolist()
+        
+        # Tokenized once for both the similarity bounds and the vectors
+        texts = [NormalizedText.from_cleaned(resume_data['cleaned_text']) for resume_data in resumes]
+        similarities = {}
+        similarity_bounds = None
+        if self.vector_space is None:
+            similarities = dict(enumerate(self.compute_similarities(
+                texts, job_profile.cleaned_text, jd_terms=job_profile.terms
+            ).tolist()))
+        else:
+            similarity_bounds = self.similarity_bounds(texts, job_profile)
+        if similarity_bounds is None:
+            similarity_bounds = [1.0] * len(resumes)
+        
+        # Semantic similarity is only known after embedding, so take the best case
+        semantic_bound = 1.0 if self.embedding_backend is not None else None
+        bounds = [
+            max_match_percentage(self.calculate_weighted_score(
+                similarities.get(index, similarity_bounds[index]), ratio, semantic_score=semantic_bound
+            ))
+            for index, ratio in enumerate(ratios)
+        ]
+        candidates = [
+            index for index, bound in enumerate(bounds)
+            if min_score is None or bound >= min_score
+        ]
+        candidates.sort(key=bounds.__getitem__, reverse=True)
+        
+        # Min-heap of (score, -index): the root is the weakest kept resume,
+        # the later one on ties, as a stable sort of the full list would rank it
+        kept = []
+        start = 0
+        while start < len(candidates):
+            # Fill the heap first, then score small chunks until the bounds
+            # fall below the weakest kept score
+            chunk = candidates[start:start + max(SHORTLIST_CHUNK_SIZE, (top_k or 0) - len(kept))]
+            if top_k is not None and len(kept) == top_k:
+                floor = kept[0][0][0]
+                chunk = [index for index in chunk if bounds[index] >= floor]
+                if not chunk:
+                    break
+            start += len(chunk)
+            
+            if self.vector_space is not None:
+                scores = self.compute_similarities(
+                    [texts[index] for index in chunk],
+                    job_profile.cleaned_text,
+                    jd_terms=job_profile.terms
+                ).tolist()
+                similarities.update(zip(chunk, scores))
+            
+            semantic_scores = [None] * len(chunk)
+            if self.embedding_backend is not None:
+                semantic_scores = self.embedding_backend.similarities(
+                    [resumes[index]['cleaned_text'] for index in chunk], [job_profile.cleaned_text]
+                )[:, 0].tolist()
+            
+            for index, semantic_score in zip(chunk, semantic_scores):
+                similarity = float(similarities[index])
+                match_score = calculate_match_percentage(self.calculate_weighted_score(
+                    similarity, ratios[index], semantic_score=semantic_score
+                ))
+                if min_score is not None and match_score < min_score:
+                    continue
+                entry = ((match_score, -index), similarity, semantic_score)
+                if top_k is None or len(kept) < top_k:
+                    heapq.heappush(kept, entry)
+                elif entry[0] > kept[0][0]:
+                    heapq.heapreplace(kept, entry)
+        
+        kept.sort(key=lambda entry: entry[0], reverse=True)
+        return [
+            (-key[1], similarity, semantic_score)
+            for key, similarity, semantic_score in kept
+        ]
+    
+    def compute_similarity_matrix(self, resume_texts: List[str],
+                                  jd_terms_list: List[List[str]]) -> 'np.ndarray':
+        """
+        Compute cosine similarity of every resume against every job description
+        
+        Vectors come from the fixed vector space if one is configured;
+        otherwise TF-IDF is fitted once over all JDs and resumes together.
+        
+        Args:
+            resume_texts: Cleaned resume texts
+            jd_terms_list: Pre-analyzed terms of each job description
+            
+        Returns:
+            Array of shape (len(resume_texts), len(jd_terms_list))
+        """
+        import numpy as np
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        
+        if not resume_texts or not jd_terms_list:
+            return np.zeros((len(resume_texts), len(jd_terms_list)))
+        
+        documents = list(jd_terms_list) + [self.document_terms(text) for text in resume_texts]
+        if self.vector_space is not None:
+            tfidf_matrix = self.vector_space.transform(documents)
+        else:
+            vectorizer = TfidfVectorizer(
+                max_features=self.vectorizer.max_features,
+                analyzer=lambda terms: terms
+            )
+            tfidf_matrix = vectorizer.fit_transform(documents)
+        
+        # Rows are L2-normalized, so dot products are cosine similarities
+        jd_count = len(jd_terms_list)
+        scores = tfidf_matrix[jd_count:] @ tfidf_matrix[:jd_count].T
+        return np.asarray(scores.todense())
+    
+    def compute_skill_match_matrix(self, resume_skills: List[List[str]],
+                                   jd_skill_sets: List[set]) -> 'np.ndarray':
+        """
+        Count the JD skills each resume has, for every resume and JD pair
+        
+        Args:
+            resume_skills: Skills extracted from each resume
+            jd_skill_sets: Lowercase skill set of each job description
+            
+        Returns:
+            Array of matched skill counts, shape (len(resume_skills), len(jd_skill_sets))
+        """
+        import numpy as np
+        
+        # Each JD is one AND / popcount over the packed resume skill bits
+        vocabulary = SkillVocabulary()
+        resume_bits = vocabulary.encode_many(resume_skills)
+        resume_counts = popcount(resume_bits)
+        
+        matched = np.zeros((len(resume_skills), len(jd_skill_sets)), dtype=np.int64)
+        for column, skill_set in enumerate(jd_skill_sets):
+            matched[:, column] = skill_overlap(
+                resume_bits, vocabulary.encode(skill_set, add=False), len(skill_set), resume_counts
+            )['matched']
+        return matched
+    
+    def matrix_analyze(self, resume_paths: List[PdfSource], jd_texts: List[str], k: int = 5,
+                       resume_names: Optional[List[str]] = None,
+                       jd_names: Optional[List[str]] = None,
+                       fields: Optional[Iterable[str]] = None) -> Dict[str, any]:
+        """
+        Score many resumes against many job descriptions at once
+        
+        Every document is parsed once. Text similarity and skill overlap for
+        all pairs come from two matrix products, and full reports are only
+        built for the pairs that make a top-k list.
+        
+        Args:
+            resume_paths: List of resume PDF file paths, bytes or binary streams
+            jd_texts: Job description texts
+            k: Number of matches to list per JD and per resume
+            resume_names: Display name for each resume (defaults to the file name)
+            jd_names: Display name for each JD (defaults to 'jd_<n>')
+            fields: Report fields to include (defaults to all of REPORT_FIELDS)
+            
+        Returns:
+            Dictionary with success flag, error message and data holding the
+            match score matrix, the top-k resumes per JD and the top-k JDs
+            per resume (each entry shaped like a batch_analyze result)
+        """
+        try:
+            resume_paths, resume_names = _read_batch_inputs(resume_paths, resume_names)
+            if jd_names is None:
+                jd_names = [f"jd_{index + 1}" for index in range(len(jd_texts))]
+            
+            errors = []
+            
+            # Parse every job description and resume once
+            profiles = []
+            for name, jd_text in zip(jd_names, jd_texts):
+                profile_result = self.compile_job_profile(jd_text)
+                if profile_result['success']:
+                    profiles.append((name, profile_result['data']))
+                else:
+                    errors.append(f"{name}: {profile_result['error']}")
+            
+            resumes = []
+            for name, resume_result in zip(resume_names, self._parse_resumes_for_batch(resume_paths)):
+                if resume_result['success']:
+                    resumes.append((name, resume_result['data']))
+                else:
+                    errors.append(f"{name}: {resume_result['error']}")
+            
+            # Score every pair with one similarity and one skill matrix product
+            similarities = self.compute_similarity_matrix(
+                [resume_data['cleaned_text'] for _, resume_data in resumes],
+                [profile.terms for _, profile in profiles]
+            )
+            matched = self.compute_skill_match_matrix(
+                [resume_data['extracted_skills'] for _, resume_data in resumes],
+                [profile.skill_set for _, profile in profiles]
+            )
+            semantic = None
+            if self.embedding_backend is not None and resumes and profiles:
+                semantic = self.embedding_backend.similarities(
+                    [resume_data['cleaned_text'] for _, resume_data in resumes],
+                    [profile.cleaned_text for _, profile in profiles]
+                )
+            
+            def semantic_score(row: int, column: int) -> Optional[float]:
+                return None if semantic is None else float(semantic[row, column])
+            
+            scores = []
+            for row in range(len(resumes)):
+                scores.append([
+                    calculate_match_percentage(self.calculate_weighted_score(
+                        float(similarities[row, column]),
+                        matched[row, column] / len(profile.skills) if profile.skills else 0,
+                        semantic_score=semantic_score(row, column)
+                    ))
+                    for column, (_, profile) in enumerate(profiles)
+                ])
+            
+            # Full reports only for pairs on a top-k list, each built once
+            reports = {}
+            
+            def match(row: int, column: int) -> Dict[str, any]:
+                if (row, column) not in reports:
+                    result = self._build_match_result(
+                        resumes[row][1], profiles[column][1], float(similarities[row, column]),
+                        semantic_score=semantic_score(row, column), fields=fields
+                    )
+                    result['resume_name'] = resumes[row][0]
+                    result['jd_name'] = profiles[column][0]
+                    reports[row, column] = result
+                return reports[row, column]
+            
+            per_jd = []
+            for column, (jd_name, _) in enumerate(profiles):
+                top = heapq.nlargest(k, range(len(resumes)), key=lambda row: scores[row][column])
+                per_jd.append({'jd_name': jd_name, 'matches': [match(row, column) for row in top]})
+            
+            per_resume = []
+            for row, (resume_name, _) in enumerate(resumes):
+                top = heapq.nlargest(k, range(len(profiles)), key=scores[row].__getitem__)
+                per_resume.append({'resume_name': resume_name, 'matches': [match(row, column) for column in top]})
+            
+            return {
+                'success': True,
+                'error': None,
+                'data': {
+                    'resume_names': [name for name, _ in resumes],
+                    'jd_names': [name for name, _ in profiles],
+                    'match_scores': scores,
+                    'top_resumes_per_jd': per_jd,
+                    'top_jds_per_resume': per_resume,
+                    'errors': errors
+                }
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f"Error analyzing matches: {str(e)}",
+                'data': None
+            }
+
+@lru_cache(maxsize=256)
+def render_match_chart(match_score: float, skill_counts: Tuple[int, int, int],
+                       missing_skills: Tuple[str, ...], common_skills: Tuple[str, ...]) -> str:
+    """
+    Render the 2x2 match chart as a base64 encoded PNG
+    
+    Results are cached on the chart inputs, so the same report is only
+    rendered once.
+    
+    Args:
+        match_score: Match percentage
+        skill_counts: Number of matched, missing and extra skills
+        missing_skills: Top missing skills to list
+        common_skills: Top matched skills to list
+        
+    Returns:
+        Base64 encoded plot image
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    
+    try:
+        # Use a standalone figure rather than pyplot, whose global state
+        # is not safe to share between request threads
+        fig = Figure(figsize=(12, 8))
+        FigureCanvasAgg(fig)
+        ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
+        
+        # 1. Match Score Gauge
+        ax1.pie([match_score, 100-match_score], 
+               startangle=90, counterclock=False,
+               colors=['#2E8B57', '#F5F5F5'],
+               wedgeprops=dict(width=0.3))
+        ax1.text(0, 0, f'{match_score:.1f}%', ha='center', va='center', 
+                fontsize=16, fontweight='bold')
+        ax1.set_title('Overall Match Score', fontweight='bold')
+        
+        # 2. Skills Breakdown
+        skills_data = list(skill_counts)
+        skills_labels = ['Matched', 'Missing', 'Extra']
+        colors = ['#2E8B57', '#DC143C', '#4682B4']
+        
+        ax2.pie(skills_data, labels=skills_labels, autopct='%1.1f%%', 
+               colors=colors, startangle=90)
+        ax2.set_title('Skills Distribution', fontweight='bold')
+        
+        # 3. Top Missing Skills
+        if missing_skills:
+            y_pos = range(len(missing_skills))
+            ax3.barh(y_pos, [1]*len(missing_skills), color='#DC143C', alpha=0.7)
+            ax3.set_yticks(y_pos)
+            ax3.set_yticklabels([skill.title() for skill in missing_skills])
+            ax3.set_xlabel('Priority')
+            ax3.set_title('Top Missing Skills', fontweight='bold')
+        else:
+            ax3.text(0.5, 0.5, 'No Missing Skills!', ha='center', va='center',
+                    transform=ax3.transAxes, fontsize=14)
+            ax3.set_title('Missing Skills', fontweight='bold')
+        
+        # 4. Top Matched Skills
+        if common_skills:
+            y_pos = range(len(common_skills))
+            ax4.barh(y_pos, [1]*len(common_skills), color='#2E8B57', alpha=0.7)
+            ax4.set_yticks(y_pos)
+            ax4.set_yticklabels([skill.title() for skill in common_skills])
+            ax4.set_xlabel('Match')
+            ax4.set_title('Top Matched Skills', fontweight='bold')
+        else:
+            ax4.text(0.5, 0.5, 'No Matched Skills', ha='center', va='center',
+                    transform=ax4.transAxes, fontsize=14)
+            ax4.set_title('Matched Skills', fontweight='bold')
+        
+        fig.tight_layout()
+        
+        # Convert to base64 string
+        img_buffer = io.BytesIO()
+        fig.savefig(img_buffer, format='png', bbox_inches='tight', dpi=150)
+        img_buffer.seek(0)
+        img_base64 = base64.b64encode(img_buffer.getvalue()).decode()
+        
+        return img_base64
+        
+    except Exception as e:
+        print(f"Error creating visualization: {str(e)}")
+        return ""
+
+# Chart renderers by output format; both take the same cached inputs
+CHART_RENDERERS = {
+    'png': render_match_chart,
+    'svg': render_match_chart_svg
+}
+
+def _read_batch_inputs(resume_paths: List[PdfSource],
+                       resume_names: Optional[List[str]] = None) -> Tuple[List[Union[str, bytes]], List[str]]:
+    """
+    Read binary streams into bytes, since streams cannot be sent to worker
+    processes or read twice, and name each resume after its file unless
+    names are given
+    """
+    resume_paths = [
+        resume_path.read() if hasattr(resume_path, 'read') else resume_path
+        for resume_path in resume_paths
+    ]
+    if resume_names is None:
+        resume_names = [
+            os.path.basename(resume_path) if isinstance(resume_path, str) else f"resume_{index + 1}.pdf"
+            for index, resume_path in enumerate(resume_paths)
+        ]
+    return resume_paths, resume_names
+
+def _worker_chunks(items: List, workers: int) -> List[List]:
+    """Split work into about four chunks per worker process"""
+    chunk_size = -(-len(items) // (workers * 4))
+    return [items[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+
+# Per-process state for parallel batch_analyze
+_worker_matcher = None
+_worker_profile = None
+
+def _init_batch_worker(job_profile: JobProfile, resume_cache: Optional[ResumeCache]):
+    """Load the matcher once per worker process"""
+    global _worker_matcher, _worker_profile
+    _worker_matcher = ResumeJobMatcher(resume_cache=resume_cache)
+    _worker_profile = job_profile
+
+def _parse_in_worker(chunk: List[Tuple[PdfSource, Optional[str]]]) -> List[Dict[str, any]]:
+    """Parse a chunk of (resume, extracted text or None) pairs in a worker process"""
+    resume_paths, texts = zip(*chunk)
+    results = _worker_matcher._parse_resumes_for_batch(list(resume_paths), list(texts))
+    # Batch reports never use the raw text; don't send it back
+    for result in results:
+        if result['success']:
+            result['data'].pop('raw_text', None)
+    return results
+
+def _prescreen_in_worker(resume_paths: List[PdfSource]) -> List[Tuple[Optional[float], Optional[str]]]:
+    """Prescreen a chunk of resumes in a worker process"""
+    return _worker_matcher._prescreen(resume_paths, _worker_profile)
 
 # Example usage
 if __name__ == "__main__":
@@ -0,0 +1,114 @@
+"""
+Resume Cache Module
+Content-addressed on-disk cache of parsed resumes
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+class ResumeCache:
+    """
+    SQLite store of processed resume data keyed by a hash of the PDF bytes
+
+    Entries are evicted least-recently-used first once the stored data
+    grows past max_bytes. A connection is opened per operation, so one
+    cache object can be shared by threads and handed to worker processes.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Args:
+            path: Path of the SQLite database file
+            max_bytes: Maximum total size of the stored (compressed) entries
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS resumes ('
+                'key TEXT PRIMARY KEY, data BLOB NOT NULL, '
+                'size INTEGER NOT NULL, last_access REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS resumes_lru ON resumes (last_access)')
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection that commits on success and is always closed"""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(pdf_bytes: bytes, version: str) -> str:
+        """
+        Build the cache key for a PDF
+
+        Args:
+            pdf_bytes: Raw bytes of the PDF file
+            version: Parser version, so parser changes invalidate old entries
+
+        Returns:
+            Hex digest identifying the parsed content
+        """
+        digest = hashlib.sha256(pdf_bytes)
+        digest.update(b'\0' + version.encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, any]]:
+        """Return the cached resume data for key, or None on a miss"""
+        try:
+            with self._connect() as conn:
+                row = conn.execute('SELECT data FROM resumes WHERE key = ?', (key,)).fetchone()
+                if row is None:
+                    return None
+                conn.execute('UPDATE resumes SET last_access = ? WHERE key = ?', (time.time(), key))
+            return json.loads(zlib.decompress(row[0]))
+        except Exception as e:
+            print(f"Error reading resume cache: {str(e)}")
+            return None
+
+    def put(self, key: str, data: Dict[str, any]):
+        """Store resume data under key and evict old entries if over size"""
+        try:
+            blob = zlib.compress(json.dumps(data).encode())
+            with self._connect() as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO resumes (key, data, size, last_access) VALUES (?, ?, ?, ?)',
+                    (key, blob, len(blob), time.time())
+                )
+                self._evict(conn)
+        except Exception as e:
+            print(f"Error writing resume cache: {str(e)}")
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Delete least recently used entries until the cache fits max_bytes"""
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM resumes').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        expired = []
+        for key, size in conn.execute('SELECT key, size FROM resumes ORDER BY last_access'):
+            if total <= self.max_bytes:
+                break
+            expired.append((key,))
+            total -= size
+        conn.executemany('DELETE FROM resumes WHERE key = ?', expired)
+
+    def clear(self):
+        """Remove every entry"""
+        with self._connect() as conn:
+            conn.execute('DELETE FROM resumes')
@@ -3,36 +3,141 @@ Resume Parser Module
 Handles PDF text extraction and resume preprocessing
 """
 
-import fitz  # PyMuPDF
 import re
-from typing import Dict, Optional
-from utils import clean_text, extract_email, extract_phone, load_spacy_model, extract_skills_from_text
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
+from utils import (
+    extract_email, extract_phone, load_spacy_model, extract_skills_from_text,
+    extract_skills_from_texts, NormalizedText, normalize_text, StageBudget
+)
+from resume_cache import ResumeCache
+
+# Bump whenever preprocess_resume output changes so cached parses are not reused
+PARSER_VERSION = '4'
+
+# Header lines that start each resume section; 'other' headers only end
+# the section before them
+SECTION_HEADERS = {
+    'experience': [
+        'work experience', 'professional experience', 'experience',
+        'employment history', 'professional background', 'career history'
+    ],
+    'education': ['education', 'academic background', 'qualifications'],
+    'skills': ['skills', 'technical skills', 'core competencies', 'expertise'],
+    'summary': ['summary', 'professional summary', 'objective', 'career objective', 'profile', 'about', 'about me'],
+    'other': [
+        'projects', 'certifications', 'awards', 'publications', 'languages',
+        'interests', 'references', 'volunteer experience'
+    ]
+}
+
+# What may follow a header on its line: a qualifying word ("Experience
+# Summary") and/or a joined second topic ("Education & Certifications").
+# Kept this narrow so sentences like "Experience with Python" are not headers
+SECTION_HEADER_QUALIFIER = (
+    r'(?:[ \t]+(?:summary|history|highlights|details|overview))?'
+    r'(?:[ \t]*(?:&|\band\b|/)[ \t]*[a-z]+(?:[ \t]+[a-z]+)?)?'
+)
+
+# One alternation over every header, anchored to whole lines, so the text is
+# scanned once regardless of how many headers there are
+SECTION_HEADER_PATTERN = re.compile(
+    r'^[ \t]*(?:' + '|'.join(
+        f"(?P<{section}>{'|'.join(re.escape(header) for header in sorted(headers, key=len, reverse=True))})"
+        for section, headers in SECTION_HEADERS.items()
+    ) + r')' + SECTION_HEADER_QUALIFIER + r'[ \t]*(?::|$)',
+    re.IGNORECASE | re.MULTILINE
+)
+
+def _strip_span(text: str, start: int, end: int) -> Tuple[int, int]:
+    """Shrink a span so it excludes leading and trailing whitespace"""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+# Longest resume text processed; anything beyond is dropped and flagged
+MAX_RESUME_CHARS = 100000
+
+# Wall-clock seconds for the text stages of one resume before optional
+# stages (section detection, NER) are skipped and the result is flagged
+RESUME_TIME_BUDGET = 5.0
+
+# A PDF given as a file path, its raw bytes, or a readable binary stream
+PdfSource = Union[str, bytes, BinaryIO]
 
 class ResumeParser:
-    def __init__(self):
-        """Initialize the resume parser with spaCy model"""
-        self.nlp = load_spacy_model()
+    def __init__(self, cache: Optional[ResumeCache] = None):
+        """
+        Initialize the resume parser
+        
+        Args:
+            cache: Cache of parsed resumes keyed by PDF content (optional)
+        """
+        self.cache = cache
     
-    def extract_text_from_pdf(self, pdf_path: str) -> str:
+    @property
+    def nlp(self):
+        """Shared spaCy model, loaded on first use"""
+        return load_spacy_model()
+    
+    def load_pdf(self, pdf: PdfSource) -> Union[str, bytes]:
+        """
+        Normalize a PDF source to a path or bytes
+        
+        Streams are read into memory once. Paths are read into bytes only
+        when the cache needs the content for its key.
+        
+        Args:
+            pdf: Path, bytes or readable binary stream
+            
+        Returns:
+            Path or PDF bytes
+        """
+        if hasattr(pdf, 'read'):
+            return pdf.read()
+        if isinstance(pdf, str) and self.cache is not None:
+            try:
+                with open(pdf, 'rb') as pdf_file:
+                    return pdf_file.read()
+            except OSError:
+                return pdf
+        return pdf
+    
+    def extract_text_from_pdf(self, pdf: PdfSource) -> str:
         """
         Extract text from PDF file using PyMuPDF
         
         Args:
-            pdf_path: Path to the PDF file
+            pdf: Path to the PDF file, its bytes, or a binary stream
             
         Returns:
             Extracted text as string
         """
+        import fitz  # PyMuPDF
+        
         try:
-            doc = fitz.open(pdf_path)
-            text = ""
+            if hasattr(pdf, 'read'):
+                pdf = pdf.read()
+            
+            if isinstance(pdf, str):
+                doc = fitz.open(pdf)
+            else:
+                doc = fitz.open(stream=pdf, filetype='pdf')
+            pages = []
+            length = 0
             
             for page_num in range(doc.page_count):
                 page = doc[page_num]
-                text += page.get_text()
+                pages.append(page.get_text())
+                length += len(pages[-1])
+                
+                # Stop once past the cap; preprocessing truncates and flags it
+                if length > MAX_RESUME_CHARS:
+                    break
             
             doc.close()
-            return text
+            return "".join(pages)
             
         except Exception as e:
             print(f"Error extracting text from PDF: {str(e)}")
@@ -55,12 +160,43 @@ class ResumeParser:
         
         return contact_info
     
-    def extract_sections(self, text: str) -> Dict[str, str]:
+    def find_section_spans(self, text: str) -> Dict[str, Tuple[int, int]]:
+        """
+        Locate resume sections in one pass over the text
+        
+        A section starts at a line holding only a known header, optionally
+        with a qualifier ("Experience Summary", "Education & Certifications")
+        and a colon with inline content, and runs until the next header
+        line. The first occurrence of each section wins.
+        
+        Args:
+            text: Resume text with newline line breaks (see NormalizedText.lower)
+            
+        Returns:
+            Dictionary of section name -> (start, end) offsets of its body
+        """
+        spans = {}
+        current = None
+        body_start = 0
+        
+        for match in SECTION_HEADER_PATTERN.finditer(text):
+            if current and current not in spans:
+                spans[current] = _strip_span(text, body_start, match.start())
+            current = match.lastgroup
+            body_start = match.end()
+        
+        if current and current not in spans:
+            spans[current] = _strip_span(text, body_start, len(text))
+        
+        spans.pop('other', None)
+        return spans
+    
+    def extract_sections(self, text: Union[str, NormalizedText]) -> Dict[str, str]:
         """
         Extract different sections from resume
         
         Args:
-            text: Resume text
+            text: Resume text, or a NormalizedText built from it
             
         Returns:
             Dictionary with different resume sections
@@ -72,91 +208,124 @@ class ResumeParser:
             'summary': ''
         }
         
-        # Convert to lowercase for pattern matching
-        text_lower = text.lower()
-        
-        # Define section patterns
-        section_patterns = {
-            'experience': [
-                r'(work experience|professional experience|experience|employment history)(.*?)(?=education|skills|projects|certifications|$)',
-                r'(professional background|career history)(.*?)(?=education|skills|projects|$)'
-            ],
-            'education': [
-                r'(education|academic background|qualifications)(.*?)(?=experience|skills|projects|certifications|$)'
-            ],
-            'skills': [
-                r'(skills|technical skills|core competencies|expertise)(.*?)(?=experience|education|projects|certifications|$)'
-            ],
-            'summary': [
-                r'(summary|objective|profile|about)(.*?)(?=experience|education|skills|$)'
-            ]
-        }
+        # Convert to lowercase for consistent output
+        text_lower = normalize_text(text).lower
         
-        for section, patterns in section_patterns.items():
-            for pattern in patterns:
-                match = re.search(pattern, text_lower, re.DOTALL | re.IGNORECASE)
-                if match:
-                    sections[section] = match.group(2).strip()
-                    break
+        for section, (start, end) in self.find_section_spans(text_lower).items():
+            sections[section] = text_lower[start:end]
         
         return sections
     
-    def preprocess_resume(self, text: str) -> Dict[str, any]:
+    def preprocess_resume(self, text: Union[str, NormalizedText],
+                          extracted_skills: Optional[List[str]] = None) -> Dict[str, any]:
         """
         Comprehensive preprocessing of resume text
         
+        The text is normalized once and every stage below reads from the
+        same NormalizedText.
+        
         Args:
-            text: Raw resume text
+            text: Raw resume text, or a NormalizedText built from it
+            extracted_skills: Skills already extracted, to skip skill extraction (optional)
             
         Returns:
             Dictionary with processed resume information
         """
-        if not text:
+        # Bound the work done on oversized text layers
+        if not isinstance(text, NormalizedText):
+            text = NormalizedText(text, MAX_RESUME_CHARS)
+        document = text
+        
+        if not document.raw:
             return {
                 'raw_text': '',
                 'cleaned_text': '',
                 'contact_info': {},
                 'sections': {},
                 'extracted_skills': [],
-                'word_count': 0
+                'word_count': 0,
+                'truncated': False,
+                'degraded': False
             }
         
-        # Clean the text
-        cleaned_text = clean_text(text)
+        processed_data, budget = self._preprocess_stages(document)
         
-        # Extract contact information
-        contact_info = self.extract_contact_info(text)
+        # Extract skills, checking the budget right before the NER call and
+        # keyword matching only once it is spent
+        if extracted_skills is None:
+            if budget.exhausted():
+                extracted_skills = extract_skills_from_text(document)
+                processed_data['degraded'] = True
+            else:
+                extracted_skills = extract_skills_from_text(document, self.nlp)
+        processed_data['extracted_skills'] = extracted_skills
         
-        # Extract sections
-        sections = self.extract_sections(text)
+        return processed_data
+    
+    def _preprocess_stages(self, document: NormalizedText) -> Tuple[Dict[str, any], StageBudget]:
+        """
+        Run every preprocessing stage except skill extraction
         
-        # Extract skills
-        extracted_skills = extract_skills_from_text(cleaned_text, self.nlp)
+        Returns:
+            The processed resume information with no skills yet, and the
+            parse's time budget for the caller to check before running NER
+        """
+        budget = StageBudget(RESUME_TIME_BUDGET)
+        
+        # Extract contact information
+        contact_info = self.extract_contact_info(document.raw)
         
-        # Calculate word count
-        word_count = len(cleaned_text.split())
+        # Extract sections
+        degraded = budget.exhausted()
+        sections = {} if degraded else self.extract_sections(document)
         
         return {
-            'raw_text': text,
-            'cleaned_text': cleaned_text,
+            'raw_text': document.raw,
+            'cleaned_text': document.cleaned,
             'contact_info': contact_info,
             'sections': sections,
-            'extracted_skills': extracted_skills,
-            'word_count': word_count
-        }
+            'extracted_skills': [],
+            'word_count': document.word_count,
+            'truncated': document.truncated,
+            'degraded': degraded
+        }, budget
+    
+    def _cache_key(self, pdf: Union[str, bytes]) -> Optional[str]:
+        """Return the cache key for loaded PDF bytes, or None when caching is off"""
+        if self.cache is None or not isinstance(pdf, bytes):
+            return None
+        return ResumeCache.make_key(pdf, PARSER_VERSION)
+    
+    def get_cached(self, pdf: Union[str, bytes]) -> Optional[Dict[str, any]]:
+        """Return the cached parse of loaded PDF bytes, or None on a miss or when caching is off"""
+        cache_key = self._cache_key(pdf)
+        return self.cache.get(cache_key) if cache_key else None
     
-    def parse_resume(self, pdf_path: str) -> Dict[str, any]:
+    def parse_resume(self, pdf: PdfSource) -> Dict[str, any]:
         """
         Main method to parse a resume PDF file
         
         Args:
-            pdf_path: Path to the PDF resume file
+            pdf: Path to the PDF resume file, its bytes, or a binary stream
             
         Returns:
             Dictionary with all extracted and processed resume information
         """
+        pdf = self.load_pdf(pdf)
+        
+        # Serve repeat uploads of the same PDF from the cache
+        cache_key = self._cache_key(pdf)
+        if cache_key:
+            cached_data = self.cache.get(cache_key)
+            if cached_data is not None:
+                return {
+                    'success': True,
+                    'error': None,
+                    'data': cached_data
+                }
+        
         # Extract text from PDF
-        raw_text = self.extract_text_from_pdf(pdf_path)
+        raw_text = self.extract_text_from_pdf(pdf)
         
         if not raw_text:
             return {
@@ -168,12 +337,104 @@ class ResumeParser:
         # Preprocess the extracted text
         processed_data = self.preprocess_resume(raw_text)
         
+        # A parse cut short by its time budget is not what a fresh parse
+        # gives, so it must not be served to later uploads
+        if cache_key and not processed_data['degraded']:
+            self.cache.put(cache_key, processed_data)
+        
         return {
             'success': True,
             'error': None,
             'data': processed_data
         }
     
+    def parse_resumes(self, pdfs: List[PdfSource], batch_size: Optional[int] = None,
+                      n_process: int = 1,
+                      texts: Optional[List[Optional[str]]] = None) -> List[Dict[str, any]]:
+        """
+        Parse many resume PDF files, running NER over them in batches
+        
+        Args:
+            pdfs: Paths, bytes or binary streams of the PDF resume files
+            batch_size: Documents per spaCy batch (optional)
+            n_process: Number of processes for spaCy
+            texts: Text already extracted from each PDF, or None where it
+                still has to be extracted (optional)
+            
+        Returns:
+            List of parse results in the same order as pdfs
+        """
+        results = [None] * len(pdfs)
+        cache_keys = {}
+        raw_texts = {}
+        
+        for index, pdf in enumerate(pdfs):
+            pdf = self.load_pdf(pdf)
+            cache_key = self._cache_key(pdf)
+            if cache_key:
+                cached_data = self.cache.get(cache_key)
+                if cached_data is not None:
+                    results[index] = {
+                        'success': True,
+                        'error': None,
+                        'data': cached_data
+                    }
+                    continue
+                cache_keys[index] = cache_key
+            
+            if texts is not None and texts[index] is not None:
+                raw_text = texts[index]
+            else:
+                raw_text = self.extract_text_from_pdf(pdf)
+            if raw_text:
+                raw_texts[index] = raw_text
+            else:
+                results[index] = {
+                    'success': False,
+                    'error': 'Could not extract text from PDF',
+                    'data': None
+                }
+        
+        # Run the other stages first so each resume's budget is checked right
+        # before NER; the resumes still within budget share one nlp.pipe call
+        processed = {}
+        documents = {}
+        for index, raw_text in raw_texts.items():
+            document = NormalizedText(raw_text, MAX_RESUME_CHARS)
+            try:
+                processed_data, budget = self._preprocess_stages(document)
+            except Exception as e:
+                results[index] = {
+                    'success': False,
+                    'error': f"Error parsing resume: {str(e)}",
+                    'data': None
+                }
+                continue
+            processed[index] = processed_data
+            if budget.exhausted():
+                processed_data['extracted_skills'] = extract_skills_from_text(document)
+                processed_data['degraded'] = True
+            else:
+                documents[index] = document
+        
+        skills = extract_skills_from_texts(
+            list(documents.values()), self.nlp,
+            batch_size=batch_size, n_process=n_process
+        )
+        for index, extracted_skills in zip(documents, skills):
+            processed[index]['extracted_skills'] = extracted_skills
+        
+        for index, processed_data in processed.items():
+            if index in cache_keys and not processed_data['degraded']:
+                self.cache.put(cache_keys[index], processed_data)
+            results[index] = {
+                'success': True,
+                'error': None,
+                'data': processed_data
+            }
+        
+        return results
+    
     def validate_resume(self, processed_data: Dict[str, any]) -> Dict[str, any]:
         """
         Validate resume completeness and quality
@@ -62,7 +62,7 @@ def create_directories():
     """Create necessary directories"""
     print("\nCreating necessary directories...")
     
-    directories = ['uploads', 'sample_resumes', 'sample_jds']
+    directories = ['sample_resumes', 'sample_jds']
     
     for directory in directories:
         if not os.path.exists(directory):
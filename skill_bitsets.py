@@ -0,0 +1,175 @@
+"""
+Skill Bitsets Module
+Packed bit-vector skill sets, so skill overlap of one job description with
+thousands of resumes is a handful of vectorized AND / popcount operations
+"""
+
+# numpy is imported where it is first needed, like in match_engine
+from typing import Dict, Iterable, List, Optional
+
+from utils import get_technical_skills
+
+WORD_BITS = 64
+
+# Set bits in every byte value, for numpy versions without bitwise_count
+_BYTE_POPCOUNT = None
+
+def _bit_counts(words) -> 'np.ndarray':
+    """Set bits of each uint64 word, elementwise"""
+    import numpy as np
+
+    global _BYTE_POPCOUNT
+
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words)
+
+    if _BYTE_POPCOUNT is None:
+        _BYTE_POPCOUNT = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+    as_bytes = np.ascontiguousarray(words).view(np.uint8).reshape(np.shape(words) + (8,))
+    return _BYTE_POPCOUNT[as_bytes].sum(axis=-1, dtype=np.uint8)
+
+def popcount(words) -> 'np.ndarray':
+    """
+    Count the set bits of packed uint64 words
+
+    Args:
+        words: uint64 array of shape (..., n_words)
+
+    Returns:
+        Array of bit counts with the last axis summed away
+    """
+    import numpy as np
+
+    return _bit_counts(words).sum(axis=-1, dtype=np.int64)
+
+class SkillVocabulary:
+    """
+    Integer ids for skills
+
+    Starts from the fixed technical skill list, in sorted order. Skills
+    outside it (such as named entities) get the next free id the first
+    time they are added, so existing ids never change.
+    """
+
+    def __init__(self, skills: Optional[Iterable[str]] = None):
+        """
+        Args:
+            skills: Base vocabulary (defaults to get_technical_skills())
+        """
+        self.skills: List[str] = []
+        self.ids: Dict[str, int] = {}
+        for skill in sorted(set(skills if skills is not None else get_technical_skills())):
+            self.add(skill)
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    @property
+    def n_words(self) -> int:
+        """uint64 words needed for one bit per skill"""
+        return max(1, -(-len(self.skills) // WORD_BITS))
+
+    def add(self, skill: str) -> int:
+        """Return the id of a lowercase skill, assigning one if it is new"""
+        skill_id = self.ids.get(skill)
+        if skill_id is None:
+            skill_id = self.ids[skill] = len(self.skills)
+            self.skills.append(skill)
+        return skill_id
+
+    def to_ids(self, skills: Iterable[str], add: bool = True) -> List[int]:
+        """
+        Map skills to their ids
+
+        Args:
+            skills: Skills in any case
+            add: Assign ids to unknown skills; otherwise they are dropped
+
+        Returns:
+            Sorted distinct ids
+        """
+        lowered = set(skill.lower() for skill in skills)
+        if add:
+            return sorted(self.add(skill) for skill in lowered)
+        return sorted(self.ids[skill] for skill in lowered if skill in self.ids)
+
+    def pack(self, id_lists: List[List[int]], n_words: Optional[int] = None) -> 'np.ndarray':
+        """
+        Pack skill id lists into a bit matrix
+
+        Args:
+            id_lists: Skill ids of each document
+            n_words: Row width in words (defaults to the current vocabulary)
+
+        Returns:
+            uint64 array of shape (len(id_lists), n_words)
+        """
+        import numpy as np
+
+        n_words = n_words or self.n_words
+        bits = np.zeros((len(id_lists), n_words), dtype=np.uint64)
+        lengths = [len(ids) for ids in id_lists]
+        if not sum(lengths):
+            return bits
+
+        rows = np.repeat(np.arange(len(id_lists)), lengths)
+        columns = np.concatenate([np.asarray(ids, dtype=np.int64) for ids in id_lists if len(ids)])
+        np.bitwise_or.at(
+            bits,
+            (rows, columns // WORD_BITS),
+            np.left_shift(np.uint64(1), (columns % WORD_BITS).astype(np.uint64))
+        )
+        return bits
+
+    def encode(self, skills: Iterable[str], add: bool = True) -> 'np.ndarray':
+        """Bit vector of one skill list (see to_ids for add)"""
+        ids = self.to_ids(skills, add)
+        return self.pack([ids])[0]
+
+    def encode_many(self, skill_lists: List[Iterable[str]], add: bool = True) -> 'np.ndarray':
+        """Bit matrix of many skill lists (see to_ids for add)"""
+        id_lists = [self.to_ids(skills, add) for skills in skill_lists]
+        return self.pack(id_lists)
+
+    def decode(self, bits) -> List[str]:
+        """Skills whose bits are set in a bit vector"""
+        import numpy as np
+
+        unpacked = np.unpackbits(np.ascontiguousarray(bits).view(np.uint8), bitorder='little')
+        return [self.skills[skill_id] for skill_id in np.flatnonzero(unpacked) if skill_id < len(self.skills)]
+
+def skill_overlap(candidate_bits, jd_bits, jd_total: int,
+                  candidate_counts=None) -> Dict[str, 'np.ndarray']:
+    """
+    Skill overlap of one job description with every candidate
+
+    Args:
+        candidate_bits: uint64 bit matrix of the candidates' skills
+        jd_bits: uint64 bit vector of the JD's skills; words past the width
+            of candidate_bits hold skills none of the candidates have
+        jd_total: Number of JD skills, including any outside the vocabulary
+        candidate_counts: popcount of each candidate row (optional, reused
+            across queries when given)
+
+    Returns:
+        Dictionary of per-candidate arrays: matched, missing and extra
+        skill counts and skill_match_ratio
+    """
+    import numpy as np
+
+    if candidate_counts is None:
+        candidate_counts = popcount(candidate_bits)
+
+    # Only the words where the JD has skills can contribute, and a JD
+    # usually touches few of them, so AND those columns one at a time
+    matched = np.zeros(len(candidate_bits), dtype=np.int64)
+    for word in np.flatnonzero(jd_bits[:candidate_bits.shape[1]]):
+        matched += _bit_counts(candidate_bits[:, word] & jd_bits[word])
+    ratio = matched / jd_total if jd_total else np.zeros(len(matched))
+
+    return {
+        'matched': matched,
+        'missing': jd_total - matched,
+        'extra': candidate_counts - matched,
+        'skill_match_ratio': ratio
+    }
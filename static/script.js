@@ -113,9 +113,11 @@ function displayResults(data) {
     // Display contact information if available
     displayContactInfo(data.contact_info);
     
-    // Display visualization if available
+    // Display visualization if available, otherwise fetch it separately
     if (data.visualization) {
         displayVisualization(data.visualization);
+    } else {
+        loadVisualization(data);
     }
     
     // Show results section with animation
@@ -179,10 +181,34 @@ function displayContactInfo(contactInfo) {
     contactSection.style.display = 'block';
 }
 
-function displayVisualization(base64Image) {
+async function loadVisualization(data) {
+    try {
+        const response = await fetch('/api/visualization', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                match_score: data.match_score,
+                skills_analysis: data.skills_analysis
+            })
+        });
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            displayVisualization(result.data.visualization, result.data.format);
+        }
+        
+    } catch (error) {
+        console.error('Error loading visualization:', error);
+    }
+}
+
+function displayVisualization(chart, format = 'png') {
     const container = document.getElementById('matchVisualization');
-    if (base64Image) {
-        container.innerHTML = `<img src="data:image/png;base64,${base64Image}" class="img-fluid border-rounded" alt="Match Visualization">`;
+    if (chart && format === 'svg') {
+        container.innerHTML = chart;
+    } else if (chart) {
+        container.innerHTML = `<img src="data:image/png;base64,${chart}" class="img-fluid border-rounded" alt="Match Visualization">`;
     }
 }
 
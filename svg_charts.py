@@ -0,0 +1,164 @@
+"""
+SVG Charts Module
+Renders the match report panels as SVG markup without matplotlib
+"""
+
+import math
+from functools import lru_cache
+from html import escape
+from typing import List, Tuple
+
+PANEL_WIDTH = 400
+PANEL_HEIGHT = 260
+
+MATCH_COLOR = '#2E8B57'
+MISSING_COLOR = '#DC143C'
+EXTRA_COLOR = '#4682B4'
+TRACK_COLOR = '#F5F5F5'
+
+CHART_TEMPLATE = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+    'width="100%" font-family="Helvetica, Arial, sans-serif" role="img" '
+    'aria-label="Match Visualization">{panels}</svg>'
+)
+
+PANEL_TEMPLATE = (
+    '<g transform="translate({x} {y})">'
+    '<text x="{center}" y="24" text-anchor="middle" font-size="15" font-weight="bold">{title}</text>'
+    '{body}</g>'
+)
+
+CIRCLE_PATH_TEMPLATE = (
+    'M {x1:.2f} {cy:.2f} A {r} {r} 0 1 1 {x2:.2f} {cy:.2f} '
+    'A {r} {r} 0 1 1 {x1:.2f} {cy:.2f} Z'
+)
+
+SEGMENT_TEMPLATE = '<path d="{path}" fill="{color}" fill-rule="evenodd"/>'
+
+TEXT_TEMPLATE = (
+    '<text x="{x:.1f}" y="{y:.1f}" text-anchor="{anchor}" dominant-baseline="middle" '
+    'font-size="{size}"{weight}>{text}</text>'
+)
+
+BAR_TEMPLATE = (
+    '<rect x="{x}" y="{y}" width="{width}" height="{height}" fill="{color}" fill-opacity="0.7"/>'
+)
+
+def _text(x: float, y: float, text: str, size: int = 12, anchor: str = 'middle',
+          bold: bool = False) -> str:
+    """Render an escaped text element"""
+    weight = ' font-weight="bold"' if bold else ''
+    return TEXT_TEMPLATE.format(x=x, y=y, anchor=anchor, size=size, weight=weight, text=escape(text))
+
+def _point(cx: float, cy: float, r: float, turn: float) -> Tuple[float, float]:
+    """Point at a fraction of a clockwise turn from 12 o'clock"""
+    angle = 2 * math.pi * turn
+    return cx + r * math.sin(angle), cy - r * math.cos(angle)
+
+def _segment(cx: float, cy: float, r: float, inner: float, color: str,
+             fraction: float, start: float = 0.0) -> str:
+    """
+    Render a clockwise ring segment (or pie slice when inner is 0)
+    starting at a fraction of a turn from 12 o'clock
+    """
+    if fraction >= 1.0:
+        # A full turn has no distinct end point, so draw whole circles
+        path = CIRCLE_PATH_TEMPLATE.format(x1=cx - r, x2=cx + r, cy=cy, r=r)
+        if inner:
+            path += ' ' + CIRCLE_PATH_TEMPLATE.format(x1=cx - inner, x2=cx + inner, cy=cy, r=inner)
+        return SEGMENT_TEMPLATE.format(path=path, color=color)
+
+    large = 1 if fraction > 0.5 else 0
+    ox1, oy1 = _point(cx, cy, r, start)
+    ox2, oy2 = _point(cx, cy, r, start + fraction)
+    path = f'M {ox1:.2f} {oy1:.2f} A {r} {r} 0 {large} 1 {ox2:.2f} {oy2:.2f}'
+    if inner:
+        ix1, iy1 = _point(cx, cy, inner, start)
+        ix2, iy2 = _point(cx, cy, inner, start + fraction)
+        path += f' L {ix2:.2f} {iy2:.2f} A {inner} {inner} 0 {large} 0 {ix1:.2f} {iy1:.2f} Z'
+    else:
+        path += f' L {cx:.2f} {cy:.2f} Z'
+    return SEGMENT_TEMPLATE.format(path=path, color=color)
+
+def _panel(index: int, title: str, body: List[str]) -> str:
+    """Place a panel in the 2x2 grid"""
+    return PANEL_TEMPLATE.format(
+        x=(index % 2) * PANEL_WIDTH, y=(index // 2) * PANEL_HEIGHT,
+        center=PANEL_WIDTH / 2, title=escape(title), body=''.join(body)
+    )
+
+def _gauge_panel(match_score: float) -> str:
+    """Donut gauge of the overall match score"""
+    cx, cy, r = PANEL_WIDTH / 2, 140, 95
+    fraction = min(1.0, max(0.0, match_score / 100))
+    body = [_segment(cx, cy, r, r - 30, TRACK_COLOR, 1.0)]
+    if fraction > 0:
+        body.append(_segment(cx, cy, r, r - 30, MATCH_COLOR, fraction))
+    body.append(_text(cx, cy, f'{match_score:.1f}%', size=20, bold=True))
+    return _panel(0, 'Overall Match Score', body)
+
+def _distribution_panel(skill_counts: Tuple[int, int, int]) -> str:
+    """Pie chart of matched, missing and extra skills"""
+    cx, cy, r = PANEL_WIDTH / 2, 142, 90
+    total = sum(skill_counts)
+    if not total:
+        return _panel(1, 'Skills Distribution', [_text(cx, cy, 'No Skills Found', size=14)])
+
+    body = []
+    start = 0.0
+    slices = zip(skill_counts, ('Matched', 'Missing', 'Extra'), (MATCH_COLOR, MISSING_COLOR, EXTRA_COLOR))
+    for count, label, color in slices:
+        if not count:
+            continue
+        fraction = count / total
+        body.append(_segment(cx, cy, r, 0, color, fraction, start))
+
+        dx, dy = _point(0, 0, 1, start + fraction / 2)
+        body.append(_text(cx + dx * r * 0.6, cy + dy * r * 0.6, f'{fraction * 100:.1f}%', size=11))
+        body.append(_text(cx + dx * r * 1.2, cy + dy * r * 1.2, label, size=12,
+                          anchor='start' if dx > 0.1 else 'end' if dx < -0.1 else 'middle'))
+        start += fraction
+
+    return _panel(1, 'Skills Distribution', body)
+
+def _skills_panel(index: int, skills: Tuple[str, ...], color: str, title: str,
+                  empty_title: str, empty_text: str) -> str:
+    """Horizontal bars listing the top skills"""
+    if not skills:
+        return _panel(index, empty_title, [_text(PANEL_WIDTH / 2, 142, empty_text, size=14)])
+
+    body = []
+    bar_x, bar_width, row_height = 150, 220, 36
+    for row, skill in enumerate(skills):
+        y = 48 + row * row_height
+        body.append(BAR_TEMPLATE.format(x=bar_x, y=y, width=bar_width, height=row_height - 10, color=color))
+        body.append(_text(bar_x - 8, y + (row_height - 10) / 2, skill.title(), anchor='end'))
+    return _panel(index, title, body)
+
+@lru_cache(maxsize=256)
+def render_match_chart_svg(match_score: float, skill_counts: Tuple[int, int, int],
+                           missing_skills: Tuple[str, ...], common_skills: Tuple[str, ...]) -> str:
+    """
+    Render the four match chart panels as a single SVG document
+
+    Takes the same inputs as match_engine.render_match_chart and is cached
+    on them the same way.
+
+    Args:
+        match_score: Match percentage
+        skill_counts: Number of matched, missing and extra skills
+        missing_skills: Top missing skills to list
+        common_skills: Top matched skills to list
+
+    Returns:
+        SVG markup
+    """
+    panels = [
+        _gauge_panel(match_score),
+        _distribution_panel(skill_counts),
+        _skills_panel(2, missing_skills, MISSING_COLOR, 'Top Missing Skills',
+                      'Missing Skills', 'No Missing Skills!'),
+        _skills_panel(3, common_skills, MATCH_COLOR, 'Top Matched Skills',
+                      'Matched Skills', 'No Matched Skills'),
+    ]
+    return CHART_TEMPLATE.format(width=PANEL_WIDTH * 2, height=PANEL_HEIGHT * 2, panels=''.join(panels))
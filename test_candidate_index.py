@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Candidate index test for the Resume Shortlisting Tool
+Checks that resumes added to a persistent CandidateIndex rank against a job
+description exactly as batch_analyze ranks the same PDFs, that the index
+survives being reopened, and that writes made through another instance or
+from several threads are seen by every reader
+"""
+
+import os
+import sys
+import tempfile
+import threading
+
+from test_concurrency import SAMPLE_JD, _write_resume_pdfs
+
+TOP_K = 4
+
+def _ranking(results):
+    """Reduce ranked results to the values that must match"""
+    return [
+        (result['resume_name'], round(float(result['data']['match_score']), 4))
+        for result in results
+    ]
+
+def test_index_matches_batch_analyze():
+    """Top-k from the index equals the top-k of a full batch analysis"""
+    print("Testing candidate index queries...")
+
+    from candidate_index import CandidateIndex
+    from match_engine import ResumeJobMatcher
+    from vector_space import load_vector_space
+
+    matcher = ResumeJobMatcher(vector_space=load_vector_space('hashing'))
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = _write_resume_pdfs(directory)
+        index_path = os.path.join(directory, 'candidates.sqlite3')
+
+        # Add incrementally, including a file that is already indexed
+        index = CandidateIndex(index_path, matcher)
+        index.add_many(paths[:3])
+        results = index.add_many(paths[2:])
+        assert all(result['success'] for result in results)
+        assert len(index) == len(paths), f"Expected {len(paths)} candidates, got {len(index)}"
+
+        expected = matcher.batch_analyze(paths, SAMPLE_JD)[:TOP_K]
+        reopened = CandidateIndex(index_path, matcher)
+        ranked = reopened.query(SAMPLE_JD, TOP_K)
+
+        assert _ranking(ranked) == _ranking(expected), "Index ranking differs from batch_analyze"
+        assert set(ranked[0]['data']) == set(expected[0]['data']), "Index reports have a different shape"
+        assert 'semantic_score' not in ranked[0]['data'], "Index reports claim a semantic score"
+
+        assert reopened.remove(ranked[0]['candidate_id'])
+        assert len(reopened) == len(paths) - 1
+
+    print(f"✓ Index top-{TOP_K} matched batch_analyze")
+
+def test_shared_index():
+    """Instances on one file see each other's writes; threads can add at once"""
+    print("Testing shared candidate index...")
+
+    from candidate_index import CandidateIndex
+    from match_engine import ResumeJobMatcher
+    from vector_space import load_vector_space
+
+    matcher = ResumeJobMatcher(vector_space=load_vector_space('hashing'))
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = _write_resume_pdfs(directory)
+        index_path = os.path.join(directory, 'candidates.sqlite3')
+
+        # Stands in for two worker processes sharing one database file
+        writer = CandidateIndex(index_path, matcher)
+        reader = CandidateIndex(index_path, matcher)
+        assert not reader.query(SAMPLE_JD, TOP_K)
+
+        writer.add_many(paths[:2])
+        assert len(reader) == 2, f"Reader saw {len(reader)} candidates instead of 2"
+        assert len(reader.query(SAMPLE_JD, TOP_K)) == 2
+
+        # Writes through the reader after the writer's are merged, not lost
+        reader.add_many(paths[2:3])
+        writer.add_many(paths[3:4])
+        assert len(writer) == len(reader) == 4
+
+        errors = []
+
+        def add(path):
+            try:
+                assert writer.add(path)['success']
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=add, args=(path,)) for path in paths * 2]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors, f"Concurrent adds failed: {errors}"
+        assert len(writer) == len(reader) == len(paths), f"Expected {len(paths)} candidates, got {len(writer)}"
+        assert len(writer.query(SAMPLE_JD, len(paths))) == len(paths)
+
+        assert reader.remove(writer.query(SAMPLE_JD, 1)[0]['candidate_id'])
+        assert len(writer) == len(paths) - 1
+
+    print("✓ Writes were seen across instances and threads")
+
+def main():
+    """Main test function"""
+    print("=" * 60)
+    print("RESUME SHORTLISTING TOOL - CANDIDATE INDEX TEST")
+    print("=" * 60)
+
+    try:
+        test_index_matches_batch_analyze()
+        test_shared_index()
+    except AssertionError as e:
+        print(f"✗ Candidate index test FAILED: {e}")
+        return 1
+
+    print("✓ Candidate index test PASSED")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
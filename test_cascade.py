@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Cascade ranking test for the Resume Shortlisting Tool
+Checks that cascade_analyze fully analyzes only the head of its keyword
+prescreen, reports how many resumes each stage handled, matches
+batch_analyze when the head holds every resume, and extracts each PDF's
+text at most once
+"""
+
+import os
+import sys
+import tempfile
+
+from test_concurrency import SAMPLE_JD, _write_resume_pdfs
+
+TOP_N = 2
+
+def _ranking(results):
+    """Reduce ranked results to the values that must match, ignoring tie order"""
+    return sorted(
+        (result['resume_name'], round(float(result['data']['match_score']), 6))
+        for result in results
+    )
+
+def test_cascade_stages():
+    """Stage two sees top_n resumes, and all of them when top_n covers the batch"""
+    print("Testing cascade ranking...")
+
+    from match_engine import ResumeJobMatcher
+
+    matcher = ResumeJobMatcher()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = _write_resume_pdfs(directory)
+        sources = paths + [b'not a pdf']
+
+        result = matcher.cascade_analyze(sources, SAMPLE_JD, top_n=TOP_N)
+        assert result['success'], result['error']
+        stages = result['data']['stages']
+        assert stages == {
+            'prescreened': len(sources),
+            'unreadable': 1,
+            'analyzed': TOP_N,
+            'returned': TOP_N
+        }, f"Unexpected stage counts {stages}"
+
+        scores = [match['data']['match_score'] for match in result['data']['results']]
+        assert scores == sorted(scores, reverse=True), "Cascade results are not ranked"
+
+        full = matcher.cascade_analyze(paths, SAMPLE_JD, top_n=len(paths))
+        assert full['data']['stages']['analyzed'] == len(paths)
+        assert _ranking(full['data']['results']) == _ranking(matcher.batch_analyze(paths, SAMPLE_JD)), \
+            "Cascade over every resume differs from batch_analyze"
+
+        print(f"  stages: {stages}")
+
+    print("✓ Cascade stages handled the expected resumes")
+
+def test_single_extraction():
+    """Stage two reuses stage one's text, and cached parses skip extraction"""
+    print("Testing cascade text reuse...")
+
+    from match_engine import ResumeJobMatcher
+    from resume_cache import ResumeCache
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = _write_resume_pdfs(directory)
+        matcher = ResumeJobMatcher(resume_cache=ResumeCache(os.path.join(directory, 'cache.sqlite3')))
+
+        extractions = []
+        extract_text = matcher.resume_parser.extract_text_from_pdf
+
+        def counting_extract(pdf):
+            extractions.append(pdf)
+            return extract_text(pdf)
+
+        matcher.resume_parser.extract_text_from_pdf = counting_extract
+
+        first = matcher.cascade_analyze(paths, SAMPLE_JD, top_n=len(paths))
+        assert len(extractions) == len(paths), f"{len(extractions)} extractions for {len(paths)} resumes"
+
+        del extractions[:]
+        second = matcher.cascade_analyze(paths, SAMPLE_JD, top_n=len(paths))
+        assert not extractions, f"{len(extractions)} extractions despite cached parses"
+        assert _ranking(second['data']['results']) == _ranking(first['data']['results']), \
+            "Cached cascade ranked differently"
+
+    print("✓ Each PDF's text was extracted once")
+
+def main():
+    """Main test function"""
+    print("=" * 60)
+    print("RESUME SHORTLISTING TOOL - CASCADE RANKING TEST")
+    print("=" * 60)
+
+    try:
+        test_cascade_stages()
+        test_single_extraction()
+    except AssertionError as e:
+        print(f"✗ Cascade ranking test FAILED: {e}")
+        return 1
+
+    print("✓ Cascade ranking test PASSED")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Match chart test for the Resume Shortlisting Tool
+Checks that charts are cached on their inputs, that /api/visualization
+renders SVG and PNG charts, and that SVG charts are well-formed and escape
+skill names
+"""
+
+import base64
+import os
+import sys
+import xml.etree.ElementTree as ET
+
+SVG_NAMESPACE = '{http://www.w3.org/2000/svg}'
+
+SKILL_ANALYSIS = {
+    'common_skills': ['python', 'sql'],
+    'missing_skills': ['docker'],
+    'extra_skills': ['excel']
+}
+
+REPORT = {
+    'match_score': 72.5,
+    'skills_analysis': {
+        'common_skills': ['python', 'sql'],
+        'missing_skills': ['docker'],
+        'matched_skills': 2,
+        'total_jd_skills': 3,
+        'total_resume_skills': 3
+    }
+}
+
+def _is_png(encoded):
+    """Whether a base64 string holds a PNG image"""
+    return base64.b64decode(encoded).startswith(b'\x89PNG\r\n\x1a\n')
+
+def test_chart_cache():
+    """Rendering the same chart twice is served from the cache"""
+    print("Testing chart cache...")
+
+    from match_engine import ResumeJobMatcher, CHART_RENDERERS
+
+    matcher = ResumeJobMatcher()
+    for chart_format, renderer in CHART_RENDERERS.items():
+        renderer.cache_clear()
+        first = matcher.create_match_visualization(72.5, SKILL_ANALYSIS, chart_format)
+        second = matcher.create_match_visualization(72.5, SKILL_ANALYSIS, chart_format)
+        info = renderer.cache_info()
+        assert (info.hits, info.misses) == (1, 1), f"{chart_format} cache saw {info}"
+        assert first == second
+
+        # A report with the same inputs reuses the chart too
+        assert matcher.create_report_visualization(REPORT, chart_format) == first
+        assert renderer.cache_info().hits == 2, f"{chart_format} report chart was rendered again"
+
+    print("✓ Repeated charts came from the cache")
+
+def test_visualization_endpoint():
+    """The endpoint renders SVG by default and PNG on request"""
+    print("Testing /api/visualization...")
+
+    os.environ.setdefault('RESUME_CACHE_PATH', '')
+    from app import app
+
+    client = app.test_client()
+
+    response = client.post('/api/visualization', json=REPORT).get_json()
+    assert response['success'], response.get('error')
+    assert response['data']['format'] == 'svg'
+    assert ET.fromstring(response['data']['visualization']).tag == SVG_NAMESPACE + 'svg'
+
+    response = client.post('/api/visualization', json=dict(REPORT, format='png')).get_json()
+    assert response['success'], response.get('error')
+    assert _is_png(response['data']['visualization']), "PNG chart is not a PNG image"
+
+    response = client.post('/api/visualization', json=dict(REPORT, format='gif')).get_json()
+    assert not response['success'], "Unknown format was accepted"
+
+    response = client.post('/api/visualization', json={'match_score': 50}).get_json()
+    assert not response['success'], "Report without skills_analysis was accepted"
+
+    print("✓ Endpoint returned SVG and PNG charts")
+
+def test_svg_markup():
+    """SVG charts parse as XML and keep skill names intact"""
+    print("Testing SVG markup...")
+
+    from svg_charts import render_match_chart_svg
+
+    skills = ('<script>alert(1)</script>', 'r&d', 'c++ "quoted"')
+    cases = [
+        (72.5, (2, 3, 1), skills, ('python', 'sql')),
+        (0.0, (0, 0, 0), (), ()),
+        (100.0, (3, 0, 0), (), ('python',)),
+    ]
+    for match_score, skill_counts, missing_skills, common_skills in cases:
+        markup = render_match_chart_svg(match_score, skill_counts, missing_skills, common_skills)
+        try:
+            root = ET.fromstring(markup)
+        except ET.ParseError as e:
+            raise AssertionError(f"Chart for score {match_score} is not well-formed: {e}")
+
+        assert len(root.findall(SVG_NAMESPACE + 'g')) == 4, "Chart does not have four panels"
+        texts = [element.text for element in root.iter(SVG_NAMESPACE + 'text')]
+        for skill in missing_skills + common_skills:
+            assert skill.title() in texts, f"Skill {skill!r} was not rendered intact"
+
+    assert '<script>' not in render_match_chart_svg(72.5, (2, 3, 1), skills, ()), "Skill names were not escaped"
+
+    print("✓ SVG charts were well-formed and escaped")
+
+def main():
+    """Main test function"""
+    print("=" * 60)
+    print("RESUME SHORTLISTING TOOL - MATCH CHART TEST")
+    print("=" * 60)
+
+    try:
+        test_chart_cache()
+        test_visualization_endpoint()
+        test_svg_markup()
+    except AssertionError as e:
+        print(f"✗ Match chart test FAILED: {e}")
+        return 1
+
+    print("✓ Match chart test PASSED")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Concurrency stress test for the Resume Shortlisting Tool
+Checks that one shared ResumeJobMatcher gives the same scores when
+analyze_match is called from many threads at once as it does serially
+"""
+
+import os
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+THREADS = 16
+ROUNDS = 4
+
+SAMPLE_JD = """
+Senior Python Developer
+
+We are looking for an experienced Python developer to join our team.
+
+Requirements:
+- 3+ years of Python experience
+- Experience with Django or Flask
+- Knowledge of SQL databases
+- Git version control
+
+Preferred:
+- AWS experience
+- Docker knowledge
+- React experience
+"""
+
+SAMPLE_RESUMES = [
+    "Python developer with Django, Flask and PostgreSQL. Git, Docker and AWS daily.",
+    "Frontend engineer working in React, TypeScript, Redux and webpack.",
+    "Data scientist using pandas, numpy, scikit-learn and machine learning in Python.",
+    "Java backend developer with Spring, MySQL, Kubernetes and Jenkins pipelines.",
+    "DevOps engineer: Terraform, Ansible, AWS, Docker, Linux and bash scripting.",
+    "Full stack developer, Flask APIs, React frontends, SQL databases and Git.",
+]
+
+def _write_resume_pdfs(directory):
+    """Write the sample resumes to PDF files and return their paths"""
+    import fitz  # PyMuPDF
+
+    paths = []
+    for index, text in enumerate(SAMPLE_RESUMES):
+        doc = fitz.open()
+        page = doc.new_page()
+        page.insert_text((50, 72), f"Candidate {index}\nSkills\n{text}", fontsize=10)
+        path = os.path.join(directory, f"resume_{index}.pdf")
+        doc.save(path)
+        doc.close()
+        paths.append(path)
+    return paths
+
+def _scores(result):
+    """Reduce an analysis result to the values that must be reproducible"""
+    assert result['success'], result['error']
+    data = result['data']
+    return (
+        round(float(data['match_score']), 9),
+        round(float(data['similarity_score']), 9),
+        sorted(data['skills_analysis']['common_skills']),
+    )
+
+def test_threaded_analyze_match():
+    """Hammer analyze_match from many threads and compare with serial runs"""
+    print("Testing concurrent analyze_match...")
+
+    from match_engine import ResumeJobMatcher
+
+    matcher = ResumeJobMatcher()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = _write_resume_pdfs(directory)
+
+        expected = {path: _scores(matcher.analyze_match(path, SAMPLE_JD)) for path in paths}
+
+        jobs = paths * (THREADS * ROUNDS // len(paths) + 1)
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            results = list(executor.map(lambda path: matcher.analyze_match(path, SAMPLE_JD), jobs))
+
+        for path, result in zip(jobs, results):
+            assert _scores(result) == expected[path], f"Score mismatch for {os.path.basename(path)}"
+
+    print(f"✓ {len(jobs)} concurrent analyses matched the serial scores")
+
+def main():
+    """Main test function"""
+    print("=" * 60)
+    print("RESUME SHORTLISTING TOOL - CONCURRENCY TEST")
+    print("=" * 60)
+
+    try:
+        test_threaded_analyze_match()
+    except AssertionError as e:
+        print(f"✗ Concurrency test FAILED: {e}")
+        return 1
+
+    print("✓ Concurrency test PASSED")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Embedding cache test for the Resume Shortlisting Tool
+Checks that float16 and int8 cached embeddings read back close enough to
+the original vectors to leave cosine similarities practically unchanged,
+and that cache keys tell apart models that share a directory name
+"""
+
+import os
+import sys
+import tempfile
+
+DIMENSIONS = 384
+VECTORS = 50
+
+# Largest allowed change of a cosine similarity after a cache round trip
+TOLERANCE = {'float16': 1e-3, 'int8': 2e-2}
+
+def test_cache_round_trip():
+    """Cached vectors keep their similarities in every storage type"""
+    print("Testing embedding cache round trip...")
+
+    import numpy as np
+    from embeddings import EmbeddingCache, EMBEDDING_DTYPES
+
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(VECTORS, DIMENSIONS)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    keys = [EmbeddingCache.make_key(f"text {index}", 'test-model') for index in range(VECTORS)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        for dtype in EMBEDDING_DTYPES:
+            cache = EmbeddingCache(os.path.join(directory, f"{dtype}.sqlite3"), dtype)
+            cache.put_many(dict(zip(keys, vectors)))
+            found = cache.get_many(keys + ['missing'])
+
+            assert set(found) == set(keys), f"{dtype} cache lost entries"
+            restored = np.vstack([found[key] for key in keys])
+            error = np.abs(restored @ restored.T - vectors @ vectors.T).max()
+            assert error < TOLERANCE[dtype], f"{dtype} similarities drifted by {error:.4f}"
+
+            size = os.path.getsize(cache.path) / VECTORS
+            print(f"  {dtype:<8} max similarity error {error:.5f}, {size:.0f} bytes per vector on disk")
+
+    print("✓ Cached embeddings keep their similarities")
+
+def test_model_ids():
+    """Models with the same directory name or replaced weights get new ids"""
+    print("Testing embedding model ids...")
+
+    from embeddings import EmbeddingBackend
+
+    def save_model(directory, weights):
+        os.makedirs(directory)
+        with open(os.path.join(directory, 'config.json'), 'w') as f:
+            f.write('{"hidden_size": 384}')
+        with open(os.path.join(directory, 'model.safetensors'), 'wb') as f:
+            f.write(weights)
+
+    with tempfile.TemporaryDirectory() as directory:
+        first = os.path.join(directory, 'a', 'model')
+        second = os.path.join(directory, 'b', 'model')
+        save_model(first, b'weights')
+        save_model(second, b'weights')
+
+        model_id = EmbeddingBackend(first).model_id
+        assert EmbeddingBackend(first + os.sep).model_id == model_id, "Same model got a different id"
+        assert EmbeddingBackend(second).model_id != model_id, "Models named alike share an id"
+
+        with open(os.path.join(first, 'model.safetensors'), 'wb') as f:
+            f.write(b'retrained weights')
+        assert EmbeddingBackend(first).model_id != model_id, "Replaced weights kept the old id"
+
+    print("✓ Model ids follow the model's location and files")
+
+def main():
+    """Main test function"""
+    print("=" * 60)
+    print("RESUME SHORTLISTING TOOL - EMBEDDING CACHE TEST")
+    print("=" * 60)
+
+    try:
+        test_cache_round_trip()
+        test_model_ids()
+    except AssertionError as e:
+        print(f"✗ Embedding cache test FAILED: {e}")
+        return 1
+
+    print("✓ Embedding cache test PASSED")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
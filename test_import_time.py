@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Import-time budget check for the Resume Shortlisting Tool entry points
+Runs each entry point under `python -X importtime`, reports the slowest
+imports and fails if an entry point goes over budget or pulls in one of the
+heavy libraries that should only load when they are first used
+"""
+
+import os
+import subprocess
+import sys
+
+# Cumulative import time allowed for each entry point, in seconds
+IMPORT_BUDGETS = {
+    'cli': 0.5,
+    'match_engine': 0.5,
+    'app': 1.0,
+}
+
+# Libraries that must be imported lazily, never at module import
+DEFERRED_MODULES = ('numpy', 'sklearn', 'spacy', 'matplotlib', 'fitz', 'seaborn')
+
+REPORT_TOP = 8
+
+def measure_import(module):
+    """
+    Import a module in a fresh interpreter with -X importtime
+
+    Returns:
+        Dictionary of module name -> cumulative import time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True, check=True
+    )
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+def check_entry_point(module):
+    """Report and check the import time of one entry point"""
+    timings = measure_import(module)
+    total = timings[module] / 1e6
+
+    print(f"\n{module}: {total * 1000:.1f} ms (budget {IMPORT_BUDGETS[module] * 1000:.0f} ms)")
+    slowest = sorted(timings.items(), key=lambda item: item[1], reverse=True)
+    for name, cumulative in slowest[1:REPORT_TOP + 1]:
+        print(f"  {cumulative / 1000:9.1f} ms  {name}")
+
+    loaded = sorted({name.split('.')[0] for name in timings} & set(DEFERRED_MODULES))
+    assert not loaded, f"{module} imports {', '.join(loaded)} at import time"
+    assert total <= IMPORT_BUDGETS[module], f"{module} took {total:.2f}s to import"
+
+def test_import_budgets():
+    """Every entry point imports within budget and without heavy libraries"""
+    print("Testing import times...")
+
+    for module in IMPORT_BUDGETS:
+        check_entry_point(module)
+
+    print("\n✓ All entry points are within their import budgets")
+
+def main():
+    """Main test function"""
+    print("=" * 60)
+    print("RESUME SHORTLISTING TOOL - IMPORT TIME CHECK")
+    print("=" * 60)
+
+    try:
+        test_import_budgets()
+    except AssertionError as e:
+        print(f"✗ Import time check FAILED: {e}")
+        return 1
+
+    print("✓ Import time check PASSED")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -172,8 +172,7 @@ def test_file_structure():
         'templates',
         'static',
         'sample_resumes',
-        'sample_jds',
-        'uploads'
+        'sample_jds'
     ]
     
     missing_files = []
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Job description segmentation test for the Resume Shortlisting Tool
+Checks that segment_job_description finds bare and colon headers, inline
+requirement lists, and gives the same result for LF and CRLF line breaks
+"""
+
+import sys
+
+BARE_HEADERS_JD = """Senior Platform Engineer
+Requirements
+- Python
+- Docker and Kubernetes
+Nice to have
+- AWS
+Benefits
+- Health insurance
+"""
+
+COLON_HEADERS_JD = """Senior Platform Engineer
+Responsibilities:
+- Run the deployment pipeline
+Requirements:
+- Python
+- Docker and Kubernetes
+Preferred Qualifications:
+- AWS
+"""
+
+INLINE_JD = """Data Analyst
+Requirements: python, sql
+Nice to have: tableau
+Company: Acme
+"""
+
+def _segments(text):
+    """Segment text and reduce the result to the values under test"""
+    from jd_parser import JobDescriptionParser
+
+    parser = JobDescriptionParser()
+    segments = parser.segment_job_description(text)
+    requirements = parser.extract_requirements(text, segments)
+    return (
+        segments['sections'],
+        sorted(requirements['required_skills']),
+        sorted(requirements['preferred_skills'])
+    )
+
+def test_bare_headers():
+    """Headers on a line of their own start sections"""
+    print("Testing bare headers...")
+
+    sections, required, preferred = _segments(BARE_HEADERS_JD)
+    assert required == ['docker', 'kubernetes', 'python'], f"Required skills were {required}"
+    assert preferred == ['aws'], f"Preferred skills were {preferred}"
+    assert sections['benefits'] == '- health insurance', f"Benefits were {sections['benefits']!r}"
+
+    print("✓ Bare headers split the sections")
+
+def test_colon_headers():
+    """Headers ending in a colon start sections"""
+    print("Testing colon headers...")
+
+    sections, required, preferred = _segments(COLON_HEADERS_JD)
+    assert required == ['docker', 'kubernetes', 'python'], f"Required skills were {required}"
+    assert preferred == ['aws'], f"Preferred skills were {preferred}"
+    assert sections['responsibilities'] == '- run the deployment pipeline'
+
+    print("✓ Colon headers split the sections")
+
+def test_inline_requirements():
+    """Content after a header's colon belongs to that header"""
+    print("Testing inline requirements...")
+
+    sections, required, preferred = _segments(INLINE_JD)
+    assert required == ['python', 'sql'], f"Required skills were {required}"
+    assert preferred == ['tableau'], f"Preferred skills were {preferred}"
+    assert sections['requirements'] == 'python, sql', f"Requirements were {sections['requirements']!r}"
+
+    print("✓ Inline requirement lists were read")
+
+def test_crlf_line_breaks():
+    """CRLF and CR line breaks segment exactly like LF"""
+    print("Testing CRLF line breaks...")
+
+    for text in (BARE_HEADERS_JD, COLON_HEADERS_JD, INLINE_JD):
+        expected = _segments(text)
+        for line_break in ('\r\n', '\r'):
+            assert _segments(text.replace('\n', line_break)) == expected, \
+                f"{line_break!r} line breaks changed the segmentation"
+
+    print("✓ Line break style did not change the segmentation")
+
+def main():
+    """Main test function"""
+    print("=" * 60)
+    print("RESUME SHORTLISTING TOOL - JD SEGMENTATION TEST")
+    print("=" * 60)
+
+    try:
+        test_bare_headers()
+        test_colon_headers()
+        test_inline_requirements()
+        test_crlf_line_breaks()
+    except AssertionError as e:
+        print(f"✗ JD segmentation test FAILED: {e}")
+        return 1
+
+    print("✓ JD segmentation test PASSED")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Matrix scoring test for the Resume Shortlisting Tool
+Checks that matrix_analyze over several job descriptions gives the same
+scores and top-k lists as running batch_analyze once per job description
+"""
+
+import sys
+import tempfile
+
+from test_concurrency import _write_resume_pdfs
+from test_vector_space import _sample_jds
+
+TOP_K = 3
+
+def _ranking(results):
+    """Reduce ranked results to the values that must match"""
+    return [
+        (result['resume_name'], round(float(result['data']['match_score']), 6))
+        for result in results
+    ]
+
+def test_matrix_matches_batch_analyze():
+    """Each JD's top-k from the matrix equals its own batch analysis"""
+    print("Testing matrix scoring...")
+
+    from match_engine import ResumeJobMatcher
+    from vector_space import load_vector_space
+
+    # A fixed space makes every pair's score independent of the other documents
+    matcher = ResumeJobMatcher(vector_space=load_vector_space('hashing'))
+    jds = _sample_jds()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = _write_resume_pdfs(directory)
+        result = matcher.matrix_analyze(paths, jds, k=TOP_K)
+        assert result['success'], result['error']
+        data = result['data']
+
+        assert len(data['match_scores']) == len(paths)
+        assert all(len(row) == len(jds) for row in data['match_scores'])
+
+        for column, (jd_text, entry) in enumerate(zip(jds, data['top_resumes_per_jd'])):
+            expected = matcher.batch_analyze(paths, jd_text)
+            assert _ranking(entry['matches']) == _ranking(expected[:TOP_K]), \
+                f"Top resumes differ for {entry['jd_name']}"
+
+            by_name = {result['resume_name']: result['data']['match_score'] for result in expected}
+            for row, name in enumerate(data['resume_names']):
+                assert abs(data['match_scores'][row][column] - by_name[name]) < 1e-6
+
+        for entry in data['top_jds_per_resume']:
+            scores = [match['data']['match_score'] for match in entry['matches']]
+            assert scores == sorted(scores, reverse=True)
+            assert len(scores) == min(TOP_K, len(jds))
+
+    print(f"✓ Matrix scores matched batch_analyze for {len(jds)} job descriptions")
+
+def main():
+    """Main test function"""
+    print("=" * 60)
+    print("RESUME SHORTLISTING TOOL - MATRIX SCORING TEST")
+    print("=" * 60)
+
+    try:
+        test_matrix_matches_batch_analyze()
+    except AssertionError as e:
+        print(f"✗ Matrix scoring test FAILED: {e}")
+        return 1
+
+    print("✓ Matrix scoring test PASSED")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Pathological-input benchmark for the Resume Shortlisting Tool parsers
+Feeds adversarial text (repeated headers, no headers, one giant line, long
+address-like tokens, long digit runs) to the resume and job description
+parsers and checks that parse time grows linearly with input size, that
+oversized input is truncated and flagged, and that NER is skipped once a
+parse's time budget is spent
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+# Input sizes (in repetitions of each pattern) compared for linear growth,
+# kept below the parsers' truncation caps so the full input is processed
+BASE_REPEATS = 400
+SCALE = 4
+
+# Allowed growth of parse time when the input grows SCALE times; linear
+# code lands near SCALE, quadratic code near SCALE ** 2
+MAX_GROWTH = SCALE * 2.5
+
+# Times below this are dominated by noise and are not compared
+MIN_TIMED_SECONDS = 0.005
+
+ADVERSARIAL_INPUTS = {
+    'repeated headers': "Experience:\nSkills\nEducation:\n",
+    'no headers': "worked on python services and sql reporting for the team ",
+    'giant single line': "python django flask aws docker kubernetes ",
+    'long token without @': "a.b-c_d%e+f",
+    'long digit run': "1234567890 ",
+}
+
+def _best_time(function, text, runs=3):
+    """Fastest of a few runs of function(text), in seconds"""
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        function(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def _check_linear(name, function, unit):
+    """Assert that function scales linearly on a repeated unit of text"""
+    small = _best_time(function, unit * BASE_REPEATS)
+    large = _best_time(function, unit * (BASE_REPEATS * SCALE))
+    growth = large / max(small, MIN_TIMED_SECONDS)
+    print(f"  {name:<32} {small * 1000:8.1f} ms -> {large * 1000:8.1f} ms (x{growth:.1f})")
+    assert growth <= MAX_GROWTH, f"{name} grew x{growth:.1f} for x{SCALE} input"
+
+def test_contact_extraction_is_linear():
+    """Email and phone patterns do not backtrack on near-miss input"""
+    print("Testing contact extraction on adversarial input...")
+
+    from utils import EMAIL_PATTERN, PHONE_PATTERN, extract_email, extract_phone
+
+    # The patterns are timed directly since the extractors only scan a prefix
+    for name, unit in ADVERSARIAL_INPUTS.items():
+        _check_linear(f"email / {name}", EMAIL_PATTERN.search, unit)
+        _check_linear(f"phone / {name}", PHONE_PATTERN.search, unit)
+
+    assert extract_phone("Call +1 555-123-4567 today") == "+1 555-123-4567"
+    assert extract_email("Mail jane.doe@example.com now") == "jane.doe@example.com"
+    print("✓ Contact extraction scales linearly")
+
+def test_resume_preprocessing_is_linear():
+    """Resume preprocessing scales linearly on adversarial input"""
+    print("Testing resume preprocessing on adversarial input...")
+
+    from resume_parser import ResumeParser
+
+    parser = ResumeParser()
+    for name, unit in ADVERSARIAL_INPUTS.items():
+        _check_linear(name, parser.preprocess_resume, unit)
+
+    print("✓ Resume preprocessing scales linearly")
+
+def test_jd_preprocessing_is_linear():
+    """Job description preprocessing scales linearly on adversarial input"""
+    print("Testing job description preprocessing on adversarial input...")
+
+    from jd_parser import JobDescriptionParser
+
+    parser = JobDescriptionParser()
+    for name, unit in ADVERSARIAL_INPUTS.items():
+        _check_linear(name, parser.preprocess_job_description, unit)
+
+    print("✓ Job description preprocessing scales linearly")
+
+def test_oversized_input_is_truncated():
+    """Input past the size caps is cut and flagged"""
+    print("Testing oversized input...")
+
+    from resume_parser import ResumeParser, MAX_RESUME_CHARS
+    from jd_parser import JobDescriptionParser, MAX_JD_CHARS
+
+    resume = ResumeParser().preprocess_resume("python " * (MAX_RESUME_CHARS // 3))
+    assert resume['truncated'], "Oversized resume was not flagged"
+    assert len(resume['raw_text']) == MAX_RESUME_CHARS
+
+    jd = JobDescriptionParser().preprocess_job_description("python " * (MAX_JD_CHARS // 3))
+    assert jd['truncated'], "Oversized job description was not flagged"
+    assert len(jd['raw_text']) == MAX_JD_CHARS
+
+    assert not ResumeParser().preprocess_resume("Python developer")['truncated']
+    print("✓ Oversized input is truncated and flagged")
+
+class _NoNER:
+    """Stand-in spaCy model that fails the test if NER is run"""
+
+    def __getattr__(self, name):
+        raise AssertionError("NER ran after the time budget was spent")
+
+def test_spent_budget_skips_ner():
+    """Parsers fall back to keyword matching once the budget is spent"""
+    print("Testing spent time budgets...")
+
+    import jd_parser
+    import resume_parser
+    from resume_cache import ResumeCache
+    from test_concurrency import SAMPLE_JD, _write_resume_pdfs
+
+    class BudgetedResumeParser(resume_parser.ResumeParser):
+        nlp = _NoNER()
+
+    class BudgetedJDParser(jd_parser.JobDescriptionParser):
+        nlp = _NoNER()
+
+    budgets = resume_parser.RESUME_TIME_BUDGET, jd_parser.JD_TIME_BUDGET
+    resume_parser.RESUME_TIME_BUDGET = jd_parser.JD_TIME_BUDGET = 0.0
+    try:
+        resume = BudgetedResumeParser().preprocess_resume("Skills\nPython and Docker")
+        assert resume['degraded'], "Resume over budget was not flagged"
+        assert 'python' in resume['extracted_skills'], "Keyword skills were dropped"
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = _write_resume_pdfs(directory)
+            parser = BudgetedResumeParser(cache=ResumeCache(os.path.join(directory, 'cache.sqlite3')))
+            for result in parser.parse_resumes(paths):
+                assert result['success'], result['error']
+                assert result['data']['degraded'], "Batch resume over budget was not flagged"
+            assert parser.parse_resume(paths[0])['data']['degraded']
+
+            # Degraded parses are not cached for later uploads
+            for path in paths:
+                assert parser.get_cached(parser.load_pdf(path)) is None, "Degraded parse was cached"
+
+        jd = BudgetedJDParser().preprocess_job_description(SAMPLE_JD)
+        assert jd['degraded'], "Job description over budget was not flagged"
+        assert jd['requirements']['required_skills'], "Keyword requirement skills were dropped"
+    finally:
+        resume_parser.RESUME_TIME_BUDGET, jd_parser.JD_TIME_BUDGET = budgets
+
+    print("✓ Spent budgets skipped NER and flagged the result")
+
+def main():
+    """Main test function"""
+    print("=" * 60)
+    print("RESUME SHORTLISTING TOOL - PARSER LIMITS BENCHMARK")
+    print("=" * 60)
+
+    tests = [
+        test_contact_extraction_is_linear,
+        test_resume_preprocessing_is_linear,
+        test_jd_preprocessing_is_linear,
+        test_oversized_input_is_truncated,
+        test_spent_budget_skips_ner,
+    ]
+
+    try:
+        for test in tests:
+            test()
+    except AssertionError as e:
+        print(f"✗ Parser limits benchmark FAILED: {e}")
+        return 1
+
+    print("✓ Parser limits benchmark PASSED")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
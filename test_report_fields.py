@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Report field projection test for the Resume Shortlisting Tool
+Checks that requesting report fields returns only those fields, with the
+same values as the full report, that unrequested fields are never built,
+that semantic_score only appears with an embedding backend, and that the
+web endpoints honour a fields parameter and reject unknown field names
+"""
+
+import io
+import os
+import sys
+import tempfile
+
+from test_concurrency import SAMPLE_JD, _write_resume_pdfs
+
+FIELDS = ['skills_analysis', 'suggestions']
+
+def test_report_projection():
+    """Projected reports hold the requested fields and skip the rest"""
+    print("Testing report field projection...")
+
+    from match_engine import ResumeJobMatcher, REPORT_FIELDS
+
+    matcher = ResumeJobMatcher()
+    validations = []
+    validate_resume = matcher.resume_parser.validate_resume
+
+    def counting_validate(resume_data):
+        validations.append(resume_data)
+        return validate_resume(resume_data)
+
+    matcher.resume_parser.validate_resume = counting_validate
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = _write_resume_pdfs(directory)
+
+        # Without an embedding backend there is no semantic score to report
+        full = matcher.batch_analyze(paths, SAMPLE_JD)
+        default_fields = [field for field in REPORT_FIELDS if field != 'semantic_score']
+        assert all(list(result['data']) == default_fields for result in full), \
+            f"Default report fields were {list(full[0]['data'])}"
+        assert len(validations) == len(paths)
+
+        del validations[:]
+        projected = matcher.batch_analyze(paths, SAMPLE_JD, fields=FIELDS)
+        assert not validations, "resume_quality was built although it was not requested"
+
+        for expected, result in zip(full, projected):
+            assert set(result['data']) == set(FIELDS) | {'match_score'}, f"Unexpected fields {set(result['data'])}"
+            for field in result['data']:
+                assert result['data'][field] == expected['data'][field], f"{field} differs from the full report"
+
+    print(f"✓ Reports carried only {', '.join(FIELDS)} and match_score")
+
+def test_endpoint_fields():
+    """The parse and batch endpoints drop unrequested fields"""
+    print("Testing endpoint fields parameter...")
+
+    os.environ.setdefault('RESUME_CACHE_PATH', '')
+    from app import app, RESUME_DATA_FIELDS
+
+    client = app.test_client()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_resume_pdfs(directory)[0]
+        with open(path, 'rb') as f:
+            pdf = f.read()
+
+        response = client.post(
+            '/api/parse_resume',
+            data={'resume': (io.BytesIO(pdf), 'resume.pdf')},
+            content_type='multipart/form-data'
+        ).get_json()
+        assert set(response['data']) == set(RESUME_DATA_FIELDS), \
+            f"RESUME_DATA_FIELDS differs from the parse output {set(response['data'])}"
+
+        response = client.post(
+            '/api/parse_resume?fields=contact_info,extracted_skills',
+            data={'resume': (io.BytesIO(pdf), 'resume.pdf')},
+            content_type='multipart/form-data'
+        ).get_json()
+        assert response['success'], response.get('error')
+        assert set(response['data']) == {'contact_info', 'extracted_skills'}, \
+            f"Parse endpoint returned {set(response['data'])}"
+
+        response = client.post(
+            '/batch_upload',
+            data={
+                'job_description': SAMPLE_JD,
+                'fields': 'match_score',
+                'resumes': [(io.BytesIO(pdf), 'resume.pdf')]
+            },
+            content_type='multipart/form-data'
+        ).get_json()
+        assert response['success'], response.get('error')
+        assert set(response['data']['results'][0]) == {'filename', 'match_score'}, \
+            f"Batch endpoint returned {set(response['data']['results'][0])}"
+
+    print("✓ Endpoints returned only the requested fields")
+
+def test_unknown_fields():
+    """Unknown field names are rejected with the list of valid ones"""
+    print("Testing unknown fields...")
+
+    os.environ.setdefault('RESUME_CACHE_PATH', '')
+    from app import app, JD_DATA_FIELDS
+
+    client = app.test_client()
+
+    response = client.post('/api/parse_jd', json={'job_description': SAMPLE_JD}).get_json()
+    assert set(response['data']) == set(JD_DATA_FIELDS), \
+        f"JD_DATA_FIELDS differs from the parse output {set(response['data'])}"
+
+    response = client.post('/api/parse_jd?fields=requirments', json={'job_description': SAMPLE_JD})
+    assert response.status_code == 400, f"Status was {response.status_code}"
+    error = response.get_json()['error']
+    assert 'requirments' in error and 'requirements' in error, f"Error was {error!r}"
+
+    response = client.post('/api/candidates/query', json={'job_description': SAMPLE_JD, 'fields': ['match_scor']})
+    assert response.status_code == 400, f"Status was {response.status_code}"
+
+    response = client.post('/api/parse_jd', json={'job_description': SAMPLE_JD, 'fields': ['requirements']})
+    assert response.status_code == 200 and set(response.get_json()['data']) == {'requirements'}
+
+    print("✓ Unknown fields were rejected")
+
+def main():
+    """Main test function"""
+    print("=" * 60)
+    print("RESUME SHORTLISTING TOOL - REPORT FIELDS TEST")
+    print("=" * 60)
+
+    try:
+        test_report_projection()
+        test_endpoint_fields()
+        test_unknown_fields()
+    except AssertionError as e:
+        print(f"✗ Report fields test FAILED: {e}")
+        return 1
+
+    print("✓ Report fields test PASSED")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
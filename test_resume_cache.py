@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Resume cache test for the Resume Shortlisting Tool
+Checks that a cached parse skips PDF text extraction, that the least
+recently used entries are evicted once the cache outgrows its size limit,
+and that a new parser version invalidates earlier entries
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import zlib
+
+from test_concurrency import _write_resume_pdfs
+
+def _counting_parser(cache):
+    """ResumeParser on cache that records every PDF text extraction"""
+    from resume_parser import ResumeParser
+
+    parser = ResumeParser(cache=cache)
+    extractions = []
+    extract_text = parser.extract_text_from_pdf
+
+    def counting_extract(pdf):
+        extractions.append(pdf)
+        return extract_text(pdf)
+
+    parser.extract_text_from_pdf = counting_extract
+    return parser, extractions
+
+def test_cache_hit():
+    """A second parse of the same PDF is served without extracting text"""
+    print("Testing resume cache hits...")
+
+    from resume_cache import ResumeCache
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_resume_pdfs(directory)[0]
+        parser, extractions = _counting_parser(ResumeCache(os.path.join(directory, 'cache.sqlite3')))
+
+        first = parser.parse_resume(path)
+        assert first['success'], first['error']
+        assert len(extractions) == 1
+
+        second = parser.parse_resume(path)
+        assert len(extractions) == 1, "Cache hit still extracted the PDF text"
+        assert second['data'] == first['data'], "Cached parse differs from the original"
+
+        parser.parse_resumes([path, path])
+        assert len(extractions) == 1, "Batch parse missed the cache"
+
+    print("✓ Cached parses skipped extraction")
+
+def test_lru_eviction():
+    """Entries beyond max_bytes are evicted least recently used first"""
+    print("Testing resume cache eviction...")
+
+    from resume_cache import ResumeCache
+
+    entries = {f"key{index}": {'text': os.urandom(1000).hex()} for index in range(3)}
+    size = max(len(zlib.compress(json.dumps(data).encode())) for data in entries.values())
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Room for two entries but not three
+        cache = ResumeCache(os.path.join(directory, 'cache.sqlite3'), max_bytes=size * 5 // 2)
+
+        cache.put('key0', entries['key0'])
+        time.sleep(0.01)
+        cache.put('key1', entries['key1'])
+        time.sleep(0.01)
+        assert cache.get('key0') == entries['key0']
+        time.sleep(0.01)
+
+        # key1 is now the least recently used entry
+        cache.put('key2', entries['key2'])
+        assert cache.get('key1') is None, "Least recently used entry was kept"
+        assert cache.get('key0') == entries['key0'], "Recently read entry was evicted"
+        assert cache.get('key2') == entries['key2'], "Newest entry was evicted"
+
+    print("✓ Least recently used entries were evicted")
+
+def test_version_invalidation():
+    """Entries written by another parser version are not served"""
+    print("Testing resume cache invalidation...")
+
+    import resume_parser
+    from resume_cache import ResumeCache
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_resume_pdfs(directory)[0]
+        parser, extractions = _counting_parser(ResumeCache(os.path.join(directory, 'cache.sqlite3')))
+
+        parser.parse_resume(path)
+        version = resume_parser.PARSER_VERSION
+        try:
+            resume_parser.PARSER_VERSION = version + '-next'
+            parser.parse_resume(path)
+            assert len(extractions) == 2, "Entry from the old parser version was served"
+        finally:
+            resume_parser.PARSER_VERSION = version
+
+        parser.parse_resume(path)
+        assert len(extractions) == 2, "Entry for the current version was lost"
+
+    print("✓ A new parser version invalidated old entries")
+
+def main():
+    """Main test function"""
+    print("=" * 60)
+    print("RESUME SHORTLISTING TOOL - RESUME CACHE TEST")
+    print("=" * 60)
+
+    try:
+        test_cache_hit()
+        test_lru_eviction()
+        test_version_invalidation()
+    except AssertionError as e:
+        print(f"✗ Resume cache test FAILED: {e}")
+        return 1
+
+    print("✓ Resume cache test PASSED")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Resume section test for the Resume Shortlisting Tool
+Checks that find_section_spans and extract_sections recognise plain,
+qualified and colon headers, ignore sentences that start with a header
+word, and give the same sections for LF and CRLF line breaks
+"""
+
+import sys
+
+SAMPLE_RESUME = """Jane Doe
+jane@example.com
+
+Professional Summary
+Backend engineer who likes queues.
+
+Experience Summary
+Acme Corp - Senior Engineer
+Experience with Python and Kafka at scale.
+
+Education & Certifications
+BSc Computer Science
+
+Skills: Python, SQL, Docker
+
+Projects
+Side project
+"""
+
+EXPECTED_SECTIONS = {
+    'summary': 'backend engineer who likes queues.',
+    'experience': 'acme corp - senior engineer\nexperience with python and kafka at scale.',
+    'education': 'bsc computer science',
+    'skills': 'python, sql, docker'
+}
+
+def test_section_spans():
+    """Spans cover each section body and exclude 'other' sections"""
+    print("Testing section spans...")
+
+    from resume_parser import ResumeParser
+
+    text = SAMPLE_RESUME.lower()
+    spans = ResumeParser().find_section_spans(text)
+    assert set(spans) == set(EXPECTED_SECTIONS), f"Found sections {sorted(spans)}"
+    for section, (start, end) in spans.items():
+        assert text[start:end] == EXPECTED_SECTIONS[section], f"{section} span was {text[start:end]!r}"
+
+    print("✓ Section spans matched")
+
+def test_header_lines():
+    """Only whole header lines, possibly qualified, start sections"""
+    print("Testing header lines...")
+
+    from resume_parser import ResumeParser
+
+    parser = ResumeParser()
+    cases = {
+        'experience\nacme': {'experience'},
+        'work experience:\nacme': {'experience'},
+        'skills and tools\npython': {'skills'},
+        'career history / highlights\nacme': {'experience'},
+        'experience with python and django\nacme': set(),
+        'my skills include python\nsql': set(),
+    }
+    for text, expected in cases.items():
+        found = set(parser.find_section_spans(text))
+        assert found == expected, f"{text.splitlines()[0]!r} gave sections {found}"
+
+    print("✓ Header lines were recognised")
+
+def test_crlf_line_breaks():
+    """CRLF resumes give the same sections as LF ones"""
+    print("Testing CRLF line breaks...")
+
+    from resume_parser import ResumeParser
+
+    parser = ResumeParser()
+    expected = dict.fromkeys(['experience', 'education', 'skills', 'summary'], '')
+    expected.update(EXPECTED_SECTIONS)
+    for line_break in ('\n', '\r\n'):
+        sections = parser.extract_sections(SAMPLE_RESUME.replace('\n', line_break))
+        assert sections == expected, f"{line_break!r} line breaks gave {sections}"
+
+    print("✓ Line break style did not change the sections")
+
+def main():
+    """Main test function"""
+    print("=" * 60)
+    print("RESUME SHORTLISTING TOOL - RESUME SECTIONS TEST")
+    print("=" * 60)
+
+    try:
+        test_section_spans()
+        test_header_lines()
+        test_crlf_line_breaks()
+    except AssertionError as e:
+        print(f"✗ Resume sections test FAILED: {e}")
+        return 1
+
+    print("✓ Resume sections test PASSED")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Shortlist test for the Resume Shortlisting Tool
+Checks that batch_analyze with min_score and/or top_k returns exactly the
+resumes a full analysis would keep, and that the score and similarity
+bounds used for pruning never underestimate a resume
+"""
+
+import sys
+import tempfile
+
+from test_concurrency import SAMPLE_JD, _write_resume_pdfs
+from test_vector_space import _sample_jds
+
+TOP_K = 3
+
+def _ranking(results):
+    """Reduce ranked results to the values that must match"""
+    return [
+        (result['resume_name'], round(float(result['data']['match_score']), 6))
+        for result in results
+    ]
+
+def test_bound_covers_curve():
+    """The percentage bound is never below the percentage of a lower score"""
+    print("Testing match percentage bound...")
+
+    from utils import calculate_match_percentage, max_match_percentage
+
+    steps = [step / 1000 for step in range(1001)]
+    for upper in steps:
+        best = max(calculate_match_percentage(score) for score in steps if score <= upper)
+        assert max_match_percentage(upper) >= best - 1e-9, f"Bound too low at {upper}"
+
+    print("✓ Bound covers every lower score")
+
+def test_shortlist_matches_full_analysis():
+    """Shortlists equal the full ranking cut at min_score and top_k"""
+    print("Testing shortlist mode...")
+
+    from match_engine import ResumeJobMatcher
+    from vector_space import FittedVectorSpace, load_vector_space
+
+    plain = ResumeJobMatcher()
+    fitted = FittedVectorSpace.fit([plain.document_terms(text.lower()) for text in _sample_jds() + [SAMPLE_JD]])
+    matchers = {
+        'per-batch TF-IDF': plain,
+        'hashing space': ResumeJobMatcher(vector_space=load_vector_space('hashing')),
+        'fitted space': ResumeJobMatcher(vector_space=fitted)
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = _write_resume_pdfs(directory)
+        texts = [result['data']['cleaned_text'] for result in plain.resume_parser.parse_resumes(paths)]
+
+        for label, matcher in matchers.items():
+            full = matcher.batch_analyze(paths, SAMPLE_JD)
+
+            job_profile = matcher.compile_job_profile(SAMPLE_JD)['data']
+            bounds = matcher.similarity_bounds(texts, job_profile)
+            if bounds is not None:
+                similarities = matcher.compute_similarities(texts, job_profile.cleaned_text, jd_terms=job_profile.terms)
+                assert all(similarity <= bound for similarity, bound in zip(similarities, bounds)), \
+                    f"{label} similarity bound too low"
+            scores = [result['data']['match_score'] for result in full]
+            min_score = scores[len(scores) // 2]
+
+            cases = [
+                ({'top_k': TOP_K}, full[:TOP_K]),
+                ({'min_score': min_score}, [r for r in full if r['data']['match_score'] >= min_score]),
+                ({'min_score': min_score, 'top_k': 1}, full[:1]),
+                ({'min_score': scores[0] + 1}, []),
+                ({'top_k': 0}, [])
+            ]
+            for options, expected in cases:
+                shortlisted = matcher.batch_analyze(paths, SAMPLE_JD, **options)
+                assert _ranking(shortlisted) == _ranking(expected), f"{label} {options} differs"
+
+            print(f"  {label}: {len(cases)} shortlists matched")
+
+    print("✓ Shortlists matched the full analysis")
+
+def main():
+    """Main test function"""
+    print("=" * 60)
+    print("RESUME SHORTLISTING TOOL - SHORTLIST TEST")
+    print("=" * 60)
+
+    try:
+        test_bound_covers_curve()
+        test_shortlist_matches_full_analysis()
+    except AssertionError as e:
+        print(f"✗ Shortlist test FAILED: {e}")
+        return 1
+
+    print("✓ Shortlist test PASSED")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
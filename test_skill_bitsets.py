@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Skill bitset test for the Resume Shortlisting Tool
+Checks that packed skill bit vectors give the same matched, missing and
+extra counts as analyze_skill_overlap, and times the overlap of one job
+description with a large candidate pool against the per-candidate
+analyze_skill_overlap loop
+"""
+
+import random
+import sys
+import time
+
+CANDIDATES = 50000
+
+# Candidates timed through the per-candidate analyze_skill_overlap loop
+LOOP_CANDIDATES = 2000
+
+# Minimum per-candidate speedup of the bitset overlap over that loop; it
+# lands in the hundreds, so only a fall back to per-candidate work fails
+MIN_SPEEDUP = 20
+
+def _random_skill_lists(count, seed=0):
+    """Random resume skill lists, including skills outside the vocabulary"""
+    from utils import get_technical_skills
+
+    rng = random.Random(seed)
+    skills = sorted(get_technical_skills()) + [f"platform {index}" for index in range(100)]
+    return [rng.sample(skills, rng.randint(0, 30)) for _ in range(count)]
+
+def test_counts_match_skill_overlap():
+    """Bitset counts equal the set-based skill analysis"""
+    print("Testing skill bitset counts...")
+
+    from match_engine import ResumeJobMatcher
+    from skill_bitsets import SkillVocabulary, skill_overlap
+
+    matcher = ResumeJobMatcher()
+    vocabulary = SkillVocabulary()
+    resumes = _random_skill_lists(500)
+    bits = vocabulary.encode_many(resumes)
+
+    for jd_skills in _random_skill_lists(20, seed=1):
+        jd_skill_set = set(skill.lower() for skill in jd_skills)
+        overlap = skill_overlap(bits, vocabulary.encode(jd_skill_set, add=False), len(jd_skill_set))
+        for row, resume_skills in enumerate(resumes):
+            expected = matcher.analyze_skill_overlap(resume_skills, jd_skills)
+            assert overlap['matched'][row] == len(expected['common_skills'])
+            assert overlap['missing'][row] == len(expected['missing_skills'])
+            assert overlap['extra'][row] == len(expected['extra_skills'])
+
+    assert sorted(vocabulary.decode(bits[0])) == sorted(set(resumes[0]))
+    print("✓ Bitset counts matched analyze_skill_overlap")
+
+def _best_time(function, runs):
+    """Best wall-clock time of function over runs calls"""
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def test_overlap_speed():
+    """One JD against a large pool beats the per-candidate loop"""
+    print(f"Testing skill overlap speed on {CANDIDATES} candidates...")
+
+    from match_engine import ResumeJobMatcher
+    from skill_bitsets import SkillVocabulary, popcount, skill_overlap
+
+    matcher = ResumeJobMatcher()
+    vocabulary = SkillVocabulary()
+    resumes = _random_skill_lists(CANDIDATES)
+    bits = vocabulary.encode_many(resumes)
+    counts = popcount(bits)
+    jd_skills = _random_skill_lists(1, seed=2)[0]
+    jd_bits = vocabulary.encode(jd_skills, add=False)
+
+    def loop():
+        for resume_skills in resumes[:LOOP_CANDIDATES]:
+            matcher.analyze_skill_overlap(resume_skills, jd_skills)
+
+    bitset = _best_time(lambda: skill_overlap(bits, jd_bits, len(jd_skills), counts), 20) / CANDIDATES
+    looped = _best_time(loop, 3) / LOOP_CANDIDATES
+    speedup = looped / bitset
+    print(f"  {bitset * 1e9:.1f} ns vs {looped * 1e9:.1f} ns per candidate (x{speedup:.0f})")
+    assert speedup >= MIN_SPEEDUP, f"Skill overlap was only x{speedup:.1f} faster than the loop"
+    print("✓ Skill overlap beat the per-candidate loop")
+
+def main():
+    """Main test function"""
+    print("=" * 60)
+    print("RESUME SHORTLISTING TOOL - SKILL BITSET TEST")
+    print("=" * 60)
+
+    try:
+        test_counts_match_skill_overlap()
+        test_overlap_speed()
+    except AssertionError as e:
+        print(f"✗ Skill bitset test FAILED: {e}")
+        return 1
+
+    print("✓ Skill bitset test PASSED")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
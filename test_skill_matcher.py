@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Skill matcher test for the Resume Shortlisting Tool
+Checks that the skill trie only matches whole tokens, finds multi-word
+skills, and finds skills next to punctuation
+"""
+
+import sys
+
+def _find(text):
+    """Skills the keyword matcher finds in raw text"""
+    from utils import get_skill_matcher, NormalizedText
+
+    return set(get_skill_matcher().find(NormalizedText(text).cleaned))
+
+def test_whole_tokens():
+    """Short skills never match inside longer words"""
+    print("Testing whole-token matching...")
+
+    found = _find("Wrote RESTful regression tests for Gopher, ongoing error reporting")
+    assert not found & {'r', 'go', 'rest'}, f"Matched inside words: {found & {'r', 'go', 'rest'}}"
+
+    found = _find("I use R and Go daily and design REST services")
+    assert {'r', 'go', 'rest'} <= found, f"Missed standalone skills, found {found}"
+
+    print("✓ Only whole tokens matched")
+
+def test_multi_word_skills():
+    """Skills spanning several tokens match as one skill"""
+    print("Testing multi-word skills...")
+
+    from utils import SkillMatcher
+
+    found = _find("Five years of machine learning and deep   learning research")
+    assert {'machine learning', 'deep learning'} <= found, f"Found {found}"
+
+    # A longer skill and the shorter skill it starts with are both found
+    matcher = SkillMatcher({'spring', 'spring boot'})
+    assert matcher.find('built services with spring boot') == ['spring', 'spring boot']
+
+    print("✓ Multi-word skills matched")
+
+def test_punctuation():
+    """Skills next to punctuation are found"""
+    print("Testing punctuation-adjacent skills...")
+
+    found = _find("Skills: (Python), Docker. REST-APIs; CI/CD, R.")
+    expected = {'python', 'docker', 'rest', 'ci/cd', 'r'}
+    assert expected <= found, f"Missed {expected - found}"
+
+    print("✓ Punctuation did not hide skills")
+
+def main():
+    """Main test function"""
+    print("=" * 60)
+    print("RESUME SHORTLISTING TOOL - SKILL MATCHER TEST")
+    print("=" * 60)
+
+    try:
+        test_whole_tokens()
+        test_multi_word_skills()
+        test_punctuation()
+    except AssertionError as e:
+        print(f"✗ Skill matcher test FAILED: {e}")
+        return 1
+
+    print("✓ Skill matcher test PASSED")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Fixed vector space test for the Resume Shortlisting Tool
+Checks that scores computed in a saved TF-IDF space or the hashing space do
+not depend on when, or alongside which other resumes, they were computed
+"""
+
+import os
+import sys
+import tempfile
+
+SAMPLE_JDS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sample_jds')
+
+SAMPLE_RESUMES = [
+    "Python developer with Django, Flask and PostgreSQL. Git, Docker and AWS daily.",
+    "Frontend engineer working in React, TypeScript, Redux and webpack.",
+    "Data scientist using pandas, numpy, scikit-learn and machine learning in Python.",
+]
+
+def _sample_jds():
+    """Text of every sample job description"""
+    texts = []
+    for name in sorted(os.listdir(SAMPLE_JDS_DIR)):
+        with open(os.path.join(SAMPLE_JDS_DIR, name), 'r', encoding='utf-8') as f:
+            texts.append(f.read())
+    return texts
+
+def _scores(matcher, jd_text):
+    """Similarity of each sample resume to jd_text, scored one at a time"""
+    return [
+        round(float(matcher.compute_similarity(resume, '', jd_terms=matcher.document_terms(jd_text))), 9)
+        for resume in SAMPLE_RESUMES
+    ]
+
+def test_fitted_space_round_trip():
+    """A saved space gives the same scores after loading, alone or in a batch"""
+    print("Testing fitted vector space...")
+
+    from match_engine import ResumeJobMatcher
+    from utils import NormalizedText
+    from vector_space import FittedVectorSpace, load_vector_space
+
+    jds = _sample_jds()
+    fitter = ResumeJobMatcher()
+    space = FittedVectorSpace.fit([fitter.document_terms(NormalizedText(text)) for text in jds + SAMPLE_RESUMES])
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'vector_space.pkl')
+        space.save(path)
+        loaded = load_vector_space(path)
+
+    assert loaded.identifier == space.identifier
+    expected = _scores(ResumeJobMatcher(vector_space=space), jds[0])
+    matcher = ResumeJobMatcher(vector_space=loaded)
+    assert _scores(matcher, jds[0]) == expected, "Scores changed after loading the space"
+
+    batch = matcher.compute_similarities(SAMPLE_RESUMES, '', jd_terms=matcher.document_terms(jds[0]))
+    assert [round(float(score), 9) for score in batch] == expected, "Batch scores differ from single scores"
+
+    print(f"✓ {space.identifier} scores are stable across save, load and batching")
+
+def test_hashing_space_is_stateless():
+    """Hashing vectors are identical however they are computed"""
+    print("Testing hashing vector space...")
+
+    from match_engine import ResumeJobMatcher
+    from vector_space import load_vector_space
+
+    matcher = ResumeJobMatcher(vector_space=load_vector_space('hashing'))
+    first = matcher.vectorize(SAMPLE_RESUMES)
+    again = matcher.vectorize(SAMPLE_RESUMES[::-1])[::-1]
+    assert (first != again).nnz == 0, "Hashing vectors depend on the batch"
+
+    jd_text = _sample_jds()[0]
+    assert _scores(matcher, jd_text) == _scores(ResumeJobMatcher(vector_space=load_vector_space('hashing')), jd_text)
+
+    print("✓ Hashing vectors do not depend on the batch or the matcher")
+
+def main():
+    """Main test function"""
+    print("=" * 60)
+    print("RESUME SHORTLISTING TOOL - VECTOR SPACE TEST")
+    print("=" * 60)
+
+    try:
+        test_fitted_space_round_trip()
+        test_hashing_space_is_stateless()
+    except AssertionError as e:
+        print(f"✗ Vector space test FAILED: {e}")
+        return 1
+
+    print("✓ Vector space test PASSED")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
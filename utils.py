@@ -2,20 +2,55 @@
 Utility functions for the Resume Shortlisting Tool
 """
 
+import os
 import re
 import string
-from typing import List, Set
-import spacy
-
-def load_spacy_model():
-    """Load spaCy model with error handling"""
-    try:
-        nlp = spacy.load("en_core_web_sm")
-        return nlp
-    except OSError:
-        print("Warning: spaCy model 'en_core_web_sm' not found.")
-        print("Please install it using: python -m spacy download en_core_web_sm")
-        return None
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+# Name of the spaCy model shared by every parser in the process
+SPACY_MODEL_NAME = os.environ.get('SPACY_MODEL', 'en_core_web_sm')
+
+# Process-wide registry of loaded spaCy models, keyed by model name
+_spacy_models = {}
+_spacy_models_lock = threading.Lock()
+
+def configure_spacy_model(name: str):
+    """Set the spaCy model that load_spacy_model returns by default"""
+    global SPACY_MODEL_NAME
+    SPACY_MODEL_NAME = name
+
+def load_spacy_model(name: str = None):
+    """
+    Load spaCy model with error handling
+    
+    Each model is loaded once per process on first use and the same
+    instance is returned to every caller afterwards.
+    
+    Args:
+        name: Model name (defaults to SPACY_MODEL_NAME)
+        
+    Returns:
+        Loaded spaCy model, or None if it is not installed
+    """
+    name = name or SPACY_MODEL_NAME
+    if name in _spacy_models:
+        return _spacy_models[name]
+    
+    with _spacy_models_lock:
+        if name not in _spacy_models:
+            # spaCy itself is slow to import, so defer it to the first load
+            import spacy
+            try:
+                _spacy_models[name] = spacy.load(name)
+            except OSError:
+                print(f"Warning: spaCy model '{name}' not found.")
+                print(f"Please install it using: python -m spacy download {name}")
+                _spacy_models[name] = None
+    
+    return _spacy_models[name]
 
 def clean_text(text: str) -> str:
     """
@@ -31,7 +66,12 @@ def clean_text(text: str) -> str:
         return ""
     
     # Convert to lowercase
-    text = text.lower()
+    return _clean_lowercase_text(text.lower())
+
+def _clean_lowercase_text(text: str) -> str:
+    """clean_text for text that is already lowercase"""
+    if not text:
+        return ""
     
     # Remove extra whitespace and newlines
     text = re.sub(r'\s+', ' ', text)
@@ -44,17 +84,49 @@ def clean_text(text: str) -> str:
     
     return text.strip()
 
+# Contact details sit near the top of a resume; never scan further than this
+MAX_CONTACT_SCAN_CHARS = 20000
+
+# Quantifiers are bounded (RFC 5321 local part and domain lengths) so a long
+# run of address-like characters without an '@' cannot cause quadratic
+# backtracking
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,255}\.[A-Za-z]{2,24}\b')
+PHONE_PATTERN = re.compile(r'(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+
 def extract_email(text: str) -> str:
     """Extract email address from text"""
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, text)
-    return emails[0] if emails else ""
+    match = EMAIL_PATTERN.search(text[:MAX_CONTACT_SCAN_CHARS])
+    return match.group(0) if match else ""
 
 def extract_phone(text: str) -> str:
     """Extract phone number from text"""
-    phone_pattern = r'(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-    phones = re.findall(phone_pattern, text)
-    return phones[0] if phones else ""
+    match = PHONE_PATTERN.search(text[:MAX_CONTACT_SCAN_CHARS])
+    return match.group(0).strip() if match else ""
+
+def truncate_text(text: str, max_chars: int) -> Tuple[str, bool]:
+    """
+    Cap text at max_chars
+    
+    Returns:
+        The (possibly shortened) text and whether it was truncated
+    """
+    if len(text) <= max_chars:
+        return text, False
+    return text[:max_chars], True
+
+class StageBudget:
+    """
+    Wall-clock budget shared by the stages of one parse
+    
+    Stages check exhausted() before starting and fall back to a cheaper
+    result once the budget is spent.
+    """
+
+    def __init__(self, seconds: float):
+        self.deadline = time.perf_counter() + seconds
+
+    def exhausted(self) -> bool:
+        return time.perf_counter() > self.deadline
 
 def get_technical_skills() -> Set[str]:
     """
@@ -98,36 +170,196 @@ def get_technical_skills() -> Set[str]:
     
     return skills
 
-def extract_skills_from_text(text: str, nlp=None) -> List[str]:
+# Tokens are runs of word characters, so '-', '.', '/' and spaces all act as
+# boundaries in both the text and the skill names
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# Characters clean_text strips that are significant inside a skill name
+# ('c++', 'c#'); such skills can never appear in cleaned text
+UNMATCHABLE_SKILL_CHARS = re.compile(r'[^\w\s\-./]')
+
+class NormalizedText:
     """
-    Extract technical skills from text using keyword matching
+    One input text normalized once and shared by every pipeline stage
+    
+    Holds the raw text (cut to max_chars), its lowercase form for section
+    detection, the cleaned text and its word tokens. Each form is computed
+    on first use and reused by skill extraction, section detection, word
+    counts and vectorization.
+    """
+
+    __slots__ = ('raw', 'truncated', '_lower', '_cleaned', '_tokens')
+
+    def __init__(self, text: str, max_chars: Optional[int] = None):
+        """
+        Args:
+            text: Raw text
+            max_chars: Longest text kept; anything beyond is dropped (optional)
+        """
+        if max_chars is None:
+            self.raw, self.truncated = text or "", False
+        else:
+            self.raw, self.truncated = truncate_text(text or "", max_chars)
+        self._lower = None
+        self._cleaned = None
+        self._tokens = None
+
+    @classmethod
+    def from_cleaned(cls, cleaned_text: str) -> 'NormalizedText':
+        """Wrap text that has already been through clean_text"""
+        document = cls(cleaned_text)
+        document._lower = document._cleaned = cleaned_text
+        return document
+
+    @property
+    def lower(self) -> str:
+        """Lowercase raw text, with every line break turned into a newline"""
+        if self._lower is None:
+            # Browsers submit form text with CRLF line breaks; header
+            # patterns anchor on '$', which does not match before '\r'
+            self._lower = self.raw.lower().replace('\r\n', '\n').replace('\r', '\n')
+        return self._lower
+
+    @property
+    def cleaned(self) -> str:
+        """Text after clean_text"""
+        if self._cleaned is None:
+            self._cleaned = _clean_lowercase_text(self.lower)
+        return self._cleaned
+
+    @property
+    def tokens(self) -> List[str]:
+        """Word tokens of the cleaned text"""
+        if self._tokens is None:
+            self._tokens = TOKEN_PATTERN.findall(self.cleaned)
+        return self._tokens
+
+    @property
+    def word_count(self) -> int:
+        """Number of whitespace-separated words in the cleaned text"""
+        # Cleaned text is single-space separated, so no split is needed
+        return self.cleaned.count(' ') + 1 if self.cleaned else 0
+
+def normalize_text(text: Union[str, NormalizedText]) -> NormalizedText:
+    """Return text as a NormalizedText, reusing it if it already is one"""
+    return text if isinstance(text, NormalizedText) else NormalizedText(text)
+
+class SkillMatcher:
+    """
+    Token trie over the technical skill vocabulary
+
+    Finds every skill, including multi-word ones, in a single left-to-right
+    pass over the text's tokens and only matches on whole tokens, so 'r' or
+    'go' never match inside other words.
+    """
+
+    def __init__(self, skills: Set[str]):
+        self.trie: Dict[str, Dict] = {}
+        for skill in skills:
+            if UNMATCHABLE_SKILL_CHARS.search(skill):
+                continue
+            node = self.trie
+            for token in TOKEN_PATTERN.findall(skill.lower()):
+                node = node.setdefault(token, {})
+            node[None] = skill
+
+    def find(self, text: str) -> List[str]:
+        """Return the distinct skills found in lowercase text, in order of appearance"""
+        return self.find_tokens(TOKEN_PATTERN.findall(text))
+
+    def find_tokens(self, tokens: List[str]) -> List[str]:
+        """Return the distinct skills found in lowercase word tokens, in order of appearance"""
+        found = {}
+        for start in range(len(tokens)):
+            node = self.trie.get(tokens[start])
+            position = start + 1
+            while node is not None:
+                if None in node:
+                    found[node[None]] = True
+                if position >= len(tokens):
+                    break
+                node = node.get(tokens[position])
+                position += 1
+        return list(found)
+
+@lru_cache(maxsize=1)
+def get_skill_matcher() -> SkillMatcher:
+    """Return the process-wide skill matcher, built on first use"""
+    return SkillMatcher(get_technical_skills())
+
+# Documents per nlp.pipe batch when running NER over many texts
+NER_BATCH_SIZE = int(os.environ.get('SPACY_BATCH_SIZE', 64))
+
+def get_ner_disabled_pipes(nlp) -> List[str]:
+    """
+    Return the pipeline components that skill NER does not need
+    
+    Only the entity recognizer is kept, plus a shared tok2vec or transformer
+    layer if the recognizer listens to it.
+    """
+    keep = {'ner'}
+    for name in ('tok2vec', 'transformer'):
+        if name in nlp.pipe_names:
+            if 'ner' in getattr(nlp.get_pipe(name), 'listening_components', []):
+                keep.add(name)
+    return [name for name in nlp.pipe_names if name not in keep]
+
+def _add_entity_skills(found_skills: List[str], doc):
+    """Append ORG/PRODUCT entities that look like technologies"""
+    for ent in doc.ents:
+        if ent.label_ in ['ORG', 'PRODUCT'] and ent.text.lower() not in found_skills:
+            # Check if it's a potential tech skill
+            if any(keyword in ent.text.lower() for keyword in ['tech', 'software', 'system', 'platform']):
+                found_skills.append(ent.text.lower())
+
+def extract_skills_from_texts(texts: List[Union[str, NormalizedText]], nlp=None, batch_size: int = None,
+                              n_process: int = 1) -> List[List[str]]:
+    """
+    Extract technical skills from many texts at once
+    
+    Keyword matching runs per text; NER runs through nlp.pipe with every
+    component except the entity recognizer disabled.
     
     Args:
-        text: Text to extract skills from
+        texts: Texts, or NormalizedText documents, to extract skills from
         nlp: spaCy model (optional)
+        batch_size: Documents per nlp.pipe batch (defaults to NER_BATCH_SIZE)
+        n_process: Number of processes for nlp.pipe
         
     Returns:
-        List of extracted skills
+        List of extracted skills for each text
     """
-    text = clean_text(text)
-    technical_skills = get_technical_skills()
-    found_skills = []
+    documents = [normalize_text(text) for text in texts]
     
-    # Check for exact matches and partial matches
-    for skill in technical_skills:
-        if skill in text:
-            found_skills.append(skill)
+    # Match whole-token skills in one pass over each text
+    skill_matcher = get_skill_matcher()
+    results = [skill_matcher.find_tokens(document.tokens) for document in documents]
     
     # If spaCy is available, also extract named entities
-    if nlp:
-        doc = nlp(text)
-        for ent in doc.ents:
-            if ent.label_ in ['ORG', 'PRODUCT'] and ent.text.lower() not in found_skills:
-                # Check if it's a potential tech skill
-                if any(keyword in ent.text.lower() for keyword in ['tech', 'software', 'system', 'platform']):
-                    found_skills.append(ent.text.lower())
+    if nlp and documents:
+        docs = nlp.pipe(
+            [document.cleaned for document in documents],
+            batch_size=batch_size or NER_BATCH_SIZE,
+            n_process=n_process,
+            disable=get_ner_disabled_pipes(nlp)
+        )
+        for found_skills, doc in zip(results, docs):
+            _add_entity_skills(found_skills, doc)
     
-    return list(set(found_skills))  # Remove duplicates
+    return [list(set(found_skills)) for found_skills in results]  # Remove duplicates
+
+def extract_skills_from_text(text: Union[str, NormalizedText], nlp=None) -> List[str]:
+    """
+    Extract technical skills from text using keyword matching
+    
+    Args:
+        text: Text, or a NormalizedText document, to extract skills from
+        nlp: spaCy model (optional)
+        
+    Returns:
+        List of extracted skills
+    """
+    return extract_skills_from_texts([text], nlp)[0]
 
 def calculate_match_percentage(similarity_score: float) -> float:
     """
@@ -151,6 +383,40 @@ def calculate_match_percentage(similarity_score: float) -> float:
     
     return min(100, max(0, percentage))
 
+def max_match_percentage(similarity_score: float) -> float:
+    """
+    Highest percentage calculate_match_percentage gives any score up to similarity_score
+
+    The curve only ever rises, except where the boost for low scores ends
+    at 30%, so the answer is the larger of the percentage at the score
+    itself and the top of the boosted range below it.
+
+    Args:
+        similarity_score: Upper bound of a similarity score (0-1)
+
+    Returns:
+        Upper bound of the match percentage (0-100)
+    """
+    return max(
+        calculate_match_percentage(similarity_score),
+        calculate_match_percentage(min(similarity_score, 0.3 - 1e-12))
+    )
+
+def select_fields(data: Optional[Dict], fields: Optional[Iterable[str]]) -> Optional[Dict]:
+    """
+    Keep only the requested top-level keys of a result's data
+
+    Args:
+        data: Result data (may be None for failed results)
+        fields: Keys to keep, or None to keep everything
+
+    Returns:
+        The projected data
+    """
+    if data is None or fields is None:
+        return data
+    return {key: value for key, value in data.items() if key in fields}
+
 def get_improvement_suggestions(missing_skills: List[str], match_score: float) -> str:
     """
     Generate improvement suggestions based on missing skills and match score
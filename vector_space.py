@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Vector Space Module
+Fixed term-vector spaces, so resume and job description vectors can be
+computed once, stored and compared later without refitting
+
+Usage: python vector_space.py <corpus_dir> <output_path>
+Fits a TF-IDF space on every .pdf and .txt file in corpus_dir and saves it.
+"""
+
+# scikit-learn is imported where it is first needed, like in match_engine
+import hashlib
+import os
+import pickle
+import sys
+from typing import Dict, List, Optional
+
+from utils import NormalizedText
+
+ARTIFACT_FORMAT = 1
+
+# Features of the stateless hashing space
+HASHING_FEATURES = 2 ** 20
+
+def _identity(terms: List[str]) -> List[str]:
+    """Analyzer for pre-analyzed terms (module level so it can be pickled)"""
+    return terms
+
+class VectorSpace:
+    """
+    A term-vector space that never changes once created
+
+    transform() maps pre-analyzed term lists (see
+    ResumeJobMatcher.document_terms) to L2-normalized sparse rows, so the
+    dot product of two rows is their cosine similarity whenever and
+    wherever they were computed.
+    """
+
+    kind = None
+
+    def __init__(self, vectorizer, identifier: str):
+        """
+        Args:
+            vectorizer: Fitted or stateless scikit-learn vectorizer over term lists
+            identifier: Stable name of the space; vectors are only comparable
+                between spaces with the same identifier
+        """
+        self.vectorizer = vectorizer
+        self.identifier = identifier
+
+    def transform(self, term_lists: List[List[str]]):
+        """Return one L2-normalized sparse row per term list"""
+        return self.vectorizer.transform(term_lists)
+
+    @property
+    def n_features(self) -> int:
+        """Number of columns of every vector"""
+        return self.transform([[]]).shape[1]
+
+    @property
+    def vocabulary(self) -> Optional[Dict[str, int]]:
+        """Column of each term, or None if columns do not stand for known terms"""
+        return getattr(self.vectorizer, 'vocabulary_', None)
+
+class FittedVectorSpace(VectorSpace):
+    """TF-IDF space fitted offline on a reference corpus"""
+
+    kind = 'tfidf'
+
+    @classmethod
+    def fit(cls, term_lists: List[List[str]], max_features: int = 5000) -> 'FittedVectorSpace':
+        """
+        Fit the space on a reference corpus
+
+        Args:
+            term_lists: Analyzed terms of each corpus document
+            max_features: Vocabulary size
+
+        Returns:
+            The fitted space
+        """
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        vectorizer = TfidfVectorizer(max_features=max_features, analyzer=_identity)
+        vectorizer.fit(term_lists)
+        digest = hashlib.sha256(pickle.dumps(sorted(vectorizer.vocabulary_.items())))
+        digest.update(vectorizer.idf_.tobytes())
+        return cls(vectorizer, f"tfidf-{digest.hexdigest()[:16]}")
+
+    def save(self, path: str):
+        """Write the space to an artifact file"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'wb') as f:
+            pickle.dump({
+                'format': ARTIFACT_FORMAT,
+                'kind': self.kind,
+                'identifier': self.identifier,
+                'vectorizer': self.vectorizer
+            }, f)
+
+    @classmethod
+    def load(cls, path: str) -> 'FittedVectorSpace':
+        """Read a space saved with save()"""
+        with open(path, 'rb') as f:
+            artifact = pickle.load(f)
+        if artifact.get('format') != ARTIFACT_FORMAT or artifact.get('kind') != cls.kind:
+            raise ValueError(f"'{path}' is not a vector space artifact")
+        return cls(artifact['vectorizer'], artifact['identifier'])
+
+class HashingVectorSpace(VectorSpace):
+    """Stateless space that hashes terms into a fixed number of features"""
+
+    kind = 'hashing'
+
+    def __init__(self, n_features: int = HASHING_FEATURES):
+        from sklearn.feature_extraction.text import HashingVectorizer
+
+        vectorizer = HashingVectorizer(
+            n_features=n_features,
+            analyzer=_identity,
+            alternate_sign=False,
+            norm='l2'
+        )
+        super().__init__(vectorizer, f"hashing-{n_features}")
+
+def load_vector_space(spec: Optional[str]) -> Optional[VectorSpace]:
+    """
+    Create the vector space named by a configuration value
+
+    Args:
+        spec: 'hashing' for the stateless space, a path to a fitted artifact,
+            or empty for none (the matcher then fits per request)
+
+    Returns:
+        The vector space, or None
+    """
+    if not spec:
+        return None
+    if spec == 'hashing':
+        return HashingVectorSpace()
+    return FittedVectorSpace.load(spec)
+
+def _read_corpus(corpus_dir: str) -> List[str]:
+    """Read the text of every PDF and text file in a directory"""
+    from resume_parser import ResumeParser
+
+    parser = ResumeParser()
+    texts = []
+    for name in sorted(os.listdir(corpus_dir)):
+        path = os.path.join(corpus_dir, name)
+        if name.lower().endswith('.pdf'):
+            texts.append(parser.extract_text_from_pdf(path))
+        elif name.lower().endswith('.txt'):
+            with open(path, 'r', encoding='utf-8') as f:
+                texts.append(f.read())
+    return [text for text in texts if text]
+
+def main():
+    if len(sys.argv) != 3:
+        print("Usage: python vector_space.py <corpus_dir> <output_path>")
+        print("\nExample:")
+        print("python vector_space.py corpus/ models/vector_space.pkl")
+        sys.exit(1)
+
+    corpus_dir, output_path = sys.argv[1], sys.argv[2]
+    if not os.path.isdir(corpus_dir):
+        print(f"Error: Corpus directory '{corpus_dir}' not found.")
+        sys.exit(1)
+
+    # Fit through the importable module, not __main__, so the pickled
+    # analyzer can be found again when the artifact is loaded
+    import vector_space
+    from match_engine import ResumeJobMatcher
+
+    texts = _read_corpus(corpus_dir)
+    if not texts:
+        print(f"Error: No .pdf or .txt documents found in '{corpus_dir}'.")
+        sys.exit(1)
+
+    matcher = ResumeJobMatcher()
+    term_lists = [matcher.document_terms(NormalizedText(text)) for text in texts]
+    space = vector_space.FittedVectorSpace.fit(term_lists, max_features=matcher.vectorizer.max_features)
+    space.save(output_path)
+
+    print(f"Fitted {space.identifier} on {len(texts)} documents "
+          f"({len(space.vectorizer.vocabulary_)} terms) -> {output_path}")
+
+if __name__ == "__main__":
+    main()